@@ -0,0 +1,31 @@
+"""Operational alerts for the admin chat, queued from any thread and sent by a job."""
+
+import logging
+from collections import deque
+
+from telegram.ext import ContextTypes
+
+from .config import ADMIN_CHAT_ID
+
+logger = logging.getLogger("vaalilakanabot")
+
+# deque.append/popleft are thread-safe, so worker threads can queue alerts directly
+_pending_alerts: deque[str] = deque()
+
+
+def queue_admin_alert(text: str) -> None:
+    """Queue an HTML message for the admin chat; sent by send_admin_alerts."""
+    logger.warning("Admin alert: %s", text)
+    _pending_alerts.append(text)
+
+
+async def send_admin_alerts(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Send queued admin alerts (job queue callback)."""
+    while _pending_alerts:
+        text = _pending_alerts.popleft()
+        try:
+            await context.bot.send_message(ADMIN_CHAT_ID, text, parse_mode="HTML")
+        except Exception as e:
+            logger.error("Failed to send admin alert: %s", e)
+            _pending_alerts.appendleft(text)
+            return
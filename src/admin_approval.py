@@ -209,6 +209,13 @@ async def handle_admin_approval(
                 f"<i>{display_names}</i>",
                 context,
                 data_manager,
+                [
+                    (
+                        "candidate",
+                        f"{role_row.get('Role_FI')} / {role_row.get('Role_EN')}: "
+                        f"<i>{display_names}</i>",
+                    )
+                ],
             )
             logger.info("Application %s approved by admin", application_ref)
         else:
@@ -1,14 +1,18 @@
 """Admin commands and operations."""
 
+import csv
 import logging
 import re
+import time
 from io import BytesIO, StringIO
 from typing import Dict, List, Optional, Tuple
 
-from telegram import Message, Update
+from telegram import Document, Message, Update
 from telegram.ext import ContextTypes
 
+from .circuit_breaker import discourse_breaker, sheets_breaker
 from .config import ADMIN_CHAT_ID
+from .executors import ALL_EXECUTORS, file_io_executor, sheets_executor
 from .sheets_data_manager import DataManager
 from .types import (
     ApplicationRow,
@@ -16,10 +20,18 @@ from .types import (
     ElectionStructureRow,
     UserRow,
 )
+from .name_index import did_you_mean
+from .role_import import parse_roles_file
+from .stats import render_chart, stats_history
 from .utils import create_fiirumi_link, get_notification_text, get_role_name
 
 logger = logging.getLogger("vaalilakanabot")
 
+# Uploaded import files are parsed in memory; anything bigger is not a role list.
+MAX_IMPORT_FILE_SIZE = 1024 * 1024
+# Keep error replies well under Telegram's message length limit
+MAX_REPORTED_ERRORS = 30
+
 
 def parse_command_parameters(message_text: str, command: str) -> str:
     """
@@ -73,9 +85,19 @@ async def admin_help(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
 • /add_fiirumi &lt;position&gt;, &lt;name&gt;, &lt;thread_id&gt; - Add Fiirumi link to applicant
 • /remove_fiirumi &lt;position&gt;, &lt;name&gt; - Remove Fiirumi link from applicant
 
+<b>Bulk Setup:</b>
+• /import_roles - Send a CSV or YAML file with this command as the caption (or reply to the file) to add roles to the Election Structure
+• /import_roles &lt;sheet URL&gt; - Clone the roles of another spreadsheet (e.g. last year's)
+• /import_results - Send a CSV file (one row per result: position, name1, name2, ...) with this command as the caption (or reply to the file) to mark all winners as elected at once
+
 <b>Data Export:</b>
 • /export_officials_website - Export officials data as CSV file for the Guild's website
 
+<b>Monitoring:</b>
+• /health - Show worker pools, circuit breakers and pending Google Sheets writes
+• /stats - Show applicant counts per status, type and division, the most contested roles and the 24 h change
+• /stats chart - Also send a chart of applications over time
+
 <b>Manual Data Editing in Google Sheets:</b>
 • <b>Election Structure</b> sheet: Add/edit roles, amounts, deadlines
 • <b>Applications</b> sheet: Manage applicants, statuses, Fiirumi links
@@ -100,7 +122,8 @@ async def admin_help(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
 • Thread ID can be found in Fiirumi post URL
 • Deadline format: DD.MM. (e.g., 15.12.)
 • <b>Division and role names support both Finnish and English</b>
-• If a position or name is not found, the bot replies with an error — check the spelling against the Google Sheet
+• Positions match Role_FI, Role_EN or an alias from the optional <code>Aliases</code> column, ignoring case and accents; if a position is not found, the bot suggests close matches
+• Applicant names ignore case and accents (ä/a) but must otherwise be written in full; if a name is not found, the bot suggests close matches and names starting with it
 • Commands work with or without @botname mentions
 • <b>Google Sheets provides version history and collaborative editing</b>
             """
@@ -164,6 +187,7 @@ async def remove_applicant(
         else:
             await message.reply_text(
                 f"Failed to remove applicant: {name} from {role.get('Role_EN')}. Check if the applicant exists for this position."
+                + data_manager.explain_unmatched_applicant(role, name)
             )
     except Exception as e:
         logger.error(e)
@@ -191,7 +215,10 @@ async def add_fiirumi_to_applicant(update: Update, data_manager: DataManager) ->
         fiirumi = create_fiirumi_link(thread_id)
         success = data_manager.set_applicant_fiirumi(found_position, name, fiirumi)
         if not success:
-            await message.reply_text(f"Applicant not found: {name}")
+            await message.reply_text(
+                f"Applicant not found: {name}."
+                + data_manager.explain_unmatched_applicant(found_position, name)
+            )
             return
         display_names = data_manager.get_applicant_display_names_for_role_and_name(
             found_position, name
@@ -224,7 +251,10 @@ async def unassociate_fiirumi(update: Update, data_manager: DataManager) -> None
 
         success = data_manager.set_applicant_fiirumi(role, name, "")
         if not success:
-            await message.reply_text(f"Applicant not found: {name}")
+            await message.reply_text(
+                f"Applicant not found: {name}."
+                + data_manager.explain_unmatched_applicant(role, name)
+            )
             return
         display_names = data_manager.get_applicant_display_names_for_role_and_name(
             role, name
@@ -259,7 +289,10 @@ async def _parse_admin_role_names(
 
     role = data_manager.find_role_by_name(position)
     if not role:
-        await msg.reply_text(f"Unknown position: {position}")
+        await msg.reply_text(
+            f"Unknown position: {position}."
+            + did_you_mean(data_manager.suggest_role_names(position))
+        )
         return None
 
     return role, names
@@ -331,6 +364,238 @@ async def combine_applicants(
         logger.error(e)
 
 
+def _command_document(message: Message) -> Optional[Document]:
+    """Return the document sent with a command caption or replied to by the command."""
+    if message.document is not None:
+        return message.document
+    if message.reply_to_message is not None:
+        return message.reply_to_message.document
+    return None
+
+
+async def _download_document(document: Document) -> bytes:
+    """Download an uploaded document, refusing files that are too large to be an import."""
+    if document.file_size and document.file_size > MAX_IMPORT_FILE_SIZE:
+        raise ValueError(
+            f"File is too large ({document.file_size} bytes, max {MAX_IMPORT_FILE_SIZE})"
+        )
+    telegram_file = await document.get_file()
+    return bytes(await telegram_file.download_as_bytearray())
+
+
+def _format_errors(header: str, errors: List[str]) -> str:
+    """Join validation errors into one reply, truncating very long lists."""
+    lines = errors[:MAX_REPORTED_ERRORS]
+    if len(errors) > MAX_REPORTED_ERRORS:
+        lines.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more")
+    return header + "\n" + "\n".join(lines)
+
+
+async def import_roles(
+    update: Update, _: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
+) -> None:
+    """Bulk-import roles from an uploaded CSV/YAML file or clone another spreadsheet."""
+    try:
+        message = update.message
+        if message is None or not is_admin_chat(message.chat.id):
+            return
+
+        source_url = parse_command_parameters(
+            message.text or message.caption or "", "/import_roles"
+        )
+        document = _command_document(message)
+        started = time.perf_counter()
+        try:
+            if document is not None:
+                raw_roles = parse_roles_file(
+                    await _download_document(document), document.file_name or ""
+                )
+            elif source_url:
+                raw_roles = await sheets_executor.run(
+                    data_manager.read_roles_for_clone, source_url
+                )
+            else:
+                await message.reply_text(
+                    "Usage: send a CSV/YAML file with the caption /import_roles "
+                    "(or reply to one), or /import_roles <spreadsheet URL> to clone its roles."
+                )
+                return
+        except Exception as e:
+            await message.reply_text(f"Could not read roles: {e}")
+            return
+        read_done = time.perf_counter()
+
+        count, errors = await sheets_executor.run(data_manager.import_roles, raw_roles)
+        finished = time.perf_counter()
+        if errors:
+            await message.reply_text(
+                _format_errors("Import failed, nothing was written:", errors)
+            )
+            return
+        await message.reply_text(
+            f"Imported {count} roles in {finished - started:.2f} s "
+            f"(read {1000 * (read_done - started):.0f} ms, "
+            f"validate and write {1000 * (finished - read_done):.0f} ms)."
+        )
+        logger.info("Admin imported %d roles", count)
+    except Exception as e:
+        logger.error("Error importing roles: %s", e)
+        if update.message is not None:
+            await update.message.reply_text(
+                "Error writing roles to Google Sheets. Please try again."
+            )
+
+
+def _parse_results_csv(content: bytes) -> List[Tuple[str, List[str]]]:
+    """Parse results CSV rows of 'position, name1, name2, ...'; an optional header is skipped."""
+    results: List[Tuple[str, List[str]]] = []
+    reader = csv.reader(StringIO(content.decode("utf-8-sig")))
+    for row_number, row in enumerate(reader):
+        cells = [c.strip() for c in row if c.strip()]
+        if not cells:
+            continue
+        if row_number == 0 and cells[0].lower() in ("role", "position", "virka"):
+            continue
+        names = [n.strip() for cell in cells[1:] for n in cell.split(",") if n.strip()]
+        results.append((cells[0], names))
+    return results
+
+
+async def import_results(
+    update: Update, _: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
+) -> None:
+    """Mark all election results from an uploaded CSV file as elected in one batch."""
+    try:
+        message = update.message
+        if message is None or not is_admin_chat(message.chat.id):
+            return
+
+        document = _command_document(message)
+        if document is None:
+            await message.reply_text(
+                "Usage: send a CSV file with the caption /import_results (or reply to "
+                "one). Each row: <position>, <name> or <position>, <name1>, <name2>, ... "
+                "(for groups list all members)."
+            )
+            return
+        started = time.perf_counter()
+        try:
+            results = _parse_results_csv(await _download_document(document))
+        except Exception as e:
+            await message.reply_text(f"Could not read results: {e}")
+            return
+        if not results:
+            await message.reply_text("No results found in the file.")
+            return
+
+        count, errors, flushed = await sheets_executor.run(
+            data_manager.set_results_elected, results
+        )
+        elapsed = time.perf_counter() - started
+        if errors:
+            await message.reply_text(_format_errors("No results were applied:", errors))
+            return
+        reply = (
+            f"Marked {count} applicant(s) as elected for {len(results)} "
+            f"position(s) in {elapsed:.2f} s."
+        )
+        if not flushed:
+            reply += (
+                "\nWriting to Google Sheets failed; the statuses are queued and "
+                "will be retried automatically."
+            )
+        await message.reply_text(reply)
+        logger.info("Admin imported %d election results", len(results))
+    except Exception as e:
+        logger.error("Error importing results: %s", e)
+        if update.message is not None:
+            await update.message.reply_text(
+                "Error importing results. Please try again."
+            )
+
+
+async def health(update: Update, data_manager: DataManager) -> None:
+    """Show executor load, circuit breaker states and pending write queues."""
+    message = update.message
+    if message is None or not is_admin_chat(message.chat.id):
+        return
+
+    lines = ["<b>Executors</b> (running/workers, queued, done, rejected)"]
+    for executor in ALL_EXECUTORS:
+        stats = executor.stats()
+        lines.append(
+            f"• {executor.name}: {stats['running']}/{stats['workers']}, "
+            f"{stats['queued']} queued, {stats['completed']} done, "
+            f"{stats['rejected']} rejected"
+        )
+    lines.append("\n<b>Circuit breakers</b>")
+    for breaker in (sheets_breaker, discourse_breaker):
+        lines.append(f"• {breaker.name}: {breaker.state}")
+    credential_manager = data_manager.sheets_manager.credential_manager
+    if credential_manager is not None:
+        token = credential_manager.stats()
+        last_ms = token["last_refresh_ms"]
+        expires_in = token["expires_in"]
+        lines.append("\n<b>Google access token</b>")
+        lines.append(
+            f"• {token['refreshes']} refreshes, {token['failures']} failed, "
+            f"last took {'-' if last_ms is None else f'{last_ms:.0f} ms'}, "
+            f"expires in {'-' if expires_in is None else f'{expires_in / 60:.0f} min'}"
+        )
+    lines.append("\n<b>Pending Sheets writes</b>")
+    for name, size in data_manager.sheets_manager.queue_sizes().items():
+        lines.append(f"• {name}: {size}")
+    await message.reply_text("\n".join(lines), parse_mode="HTML")
+
+
+async def show_stats(update: Update, data_manager: DataManager) -> None:
+    """Show application statistics; '/stats chart' also sends a chart over time."""
+    try:
+        message = update.message
+        if message is None or not is_admin_chat(message.chat.id):
+            return
+
+        stats = await sheets_executor.run(data_manager.statistics)
+        statuses = stats.by_status
+        lines = [
+            f"<b>Applications:</b> {stats.active} active "
+            f"({statuses['pending']} pending, {statuses['approved']} approved, "
+            f"{statuses['elected']} elected), {statuses['denied']} denied, "
+            f"{statuses['removed']} removed"
+        ]
+        day_ago = stats_history.active_at(time.time() - 24 * 3600)
+        if day_ago is not None:
+            lines.append(f"<b>Last 24 h:</b> {stats.active - day_ago:+d} active")
+        lines.append(
+            f"<b>Roles without applicants:</b> "
+            f"{stats.roles_without_applicants} of {stats.role_count}"
+        )
+        lines.append("\n<b>By type</b>")
+        lines.extend(f"• {t}: {n}" for t, n in stats.by_type.most_common())
+        lines.append("\n<b>By division</b>")
+        lines.extend(f"• {d}: {n}" for d, n in stats.by_division.most_common())
+        contested = stats.most_contested()
+        if contested:
+            lines.append("\n<b>Most contested</b> (applicants / seats)")
+            lines.extend(f"• {name}: {n}/{seats}" for name, n, seats in contested)
+        await message.reply_text("\n".join(lines), parse_mode="HTML")
+
+        if parse_command_parameters(message.text or "", "/stats") != "chart":
+            return
+        samples = stats_history.samples()
+        if len(samples) < 2:
+            await message.reply_text("Not enough history for a chart yet.")
+            return
+        try:
+            chart = await file_io_executor.run(render_chart, list(samples))
+        except ValueError as e:
+            await message.reply_text(str(e))
+            return
+        await message.reply_photo(photo=chart)
+    except Exception as e:
+        logger.error(e)
+
+
 def _write_officials_role_row(
     output: StringIO,
     role: ElectionStructureRow,
@@ -3,16 +3,19 @@
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
 from telegram.ext import ContextTypes
 
+from .circuit_breaker import discourse_breaker
+from .digest import DigestItem, channel_digest
+from .discourse_client import discourse
+from .executors import file_io_executor
+from .fiirumi_cursor import topic_cursor
 from .utils import check_title_matches_applicant_and_role, create_fiirumi_link
 from .sheets_data_manager import DataManager
 from .types import ApplicationWithDisplay, ElectionStructureRow, RoleData
 from .config import get_topic_list_url, get_question_list_url
-from .fiirumi_area_generator import get_discourse_headers
 
 logger = logging.getLogger("vaalilakanabot")
 
@@ -23,11 +26,58 @@ def get_current_minute_start() -> datetime:
     return now.replace(second=0, microsecond=0)
 
 
-def get_fiirumi_data(url: str) -> Any:
-    """Get Fiirumi data from the given URL."""
-    # Using authenticated headers bypasses the anonymous cache so we see new posts.
-    response = requests.get(url, headers=get_discourse_headers(), timeout=10)
-    return response.json()
+async def get_fiirumi_data(url: str) -> Any:
+    """Get the first page of a Fiirumi topic list from the given URL."""
+    # The authenticated client bypasses the anonymous cache so we see new posts.
+    return await discourse.topic_list(url)
+
+
+# First pages of the topic lists each job last finished processing, keyed by
+# (job, url). The client returns the same object again when Discourse answers 304
+# Not Modified, so an unchanged list is skipped only once it was fully handled.
+_processed_lists: Dict[Tuple[str, str], Any] = {}
+
+
+def _latest_bump(topics: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the newest bumped_at of the topics (ISO 8601 UTC, so they sort as text)."""
+    return max((t["bumped_at"] for t in topics if t.get("bumped_at")), default=None)
+
+
+async def _fetch_topics(
+    job: str, url: str
+) -> Tuple[Any, Optional[List[Dict[str, Any]]]]:
+    """Return the first page of a list and its topics changed since the job's last run.
+
+    The topics are None when the list is the one the job last finished
+    processing. Lists are ordered by bump time, so every topic created or
+    replied to since then sits before the first (non-pinned) topic bumped no
+    later than that run's newest topic. Later pages are read only until that
+    point; after a restart the whole list is read, so nothing missed is skipped.
+    Call _mark_processed with the first page once the topics have been handled.
+    """
+    first_page = await get_fiirumi_data(url)
+    previous = _processed_lists.get((job, url))
+    if first_page is previous:
+        return first_page, None
+    topics: List[Dict[str, Any]] = list(first_page["topic_list"]["topics"])
+    watermark = (
+        _latest_bump(previous["topic_list"]["topics"]) if previous is not None else None
+    )
+
+    def reaches_watermark(page: List[Dict[str, Any]]) -> bool:
+        return watermark is not None and any(
+            not t.get("pinned") and (t.get("bumped_at") or "") <= watermark
+            for t in page
+        )
+
+    if not reaches_watermark(topics):
+        topics.extend(await discourse.more_topics(url, first_page, reaches_watermark))
+    return first_page, topics
+
+
+def _mark_processed(job: str, url: str, first_page: Any) -> None:
+    """Record that the job finished processing the list with this first page."""
+    _processed_lists[(job, url)] = first_page
 
 
 def is_recent_timestamp(
@@ -46,10 +96,22 @@ def is_recent_timestamp(
 
 
 async def announce_to_channels(
-    message: str, context: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
+    message: str,
+    context: ContextTypes.DEFAULT_TYPE,
+    data_manager: DataManager,
+    digest: Sequence[DigestItem] = (),
 ) -> None:
-    """Announce a message to all registered channels concurrently."""
+    """Announce a message to all registered channels concurrently.
+
+    Channels that enabled digests get the digest items buffered instead of the
+    message; without digest items every channel gets the message right away.
+    """
     channels = list(data_manager.channels)
+    if digest:
+        digest_ids = [c["Channel_ID"] for c in channels if c.get("Digest")]
+        for item in digest:
+            channel_digest.add(item, digest_ids)
+        channels = [c for c in channels if not c.get("Digest")]
     if not channels:
         return
 
@@ -111,39 +173,65 @@ def _link_topic_to_applicants(
     return fiirumi_link, linked
 
 
+async def _take_new_topics(url: str) -> List[Dict[str, Any]]:
+    """Return the topics of a list not announced yet, and mark them announced.
+
+    The list is recorded as processed only after the cursor was saved, so if
+    fetching or saving fails the same list is looked at again on the next poll.
+    """
+    first_page, topics = await _fetch_topics("posts", url)
+    if topics is None:
+        return []
+    new = await file_io_executor.run(topic_cursor.take_new, url, topics)
+    _mark_processed("posts", url, first_page)
+    return new
+
+
+def _new_topics_or_log(url: str, result: Any) -> List[Dict[str, Any]]:
+    """Return the new topics of a list, or log why the list failed and return []."""
+    if isinstance(result, KeyError):
+        logger.error(
+            "The topic list %s cannot be found. Check URLs. Got error %s", url, result
+        )
+    elif isinstance(result, BaseException):
+        logger.error("Error fetching Fiirumi data from %s: %s", url, result)
+    return result if isinstance(result, list) else []
+
+
 async def parse_fiirumi_posts(
     context: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
 ) -> None:
-    """Parse and announce new fiirumi posts and questions based on timestamps."""
+    """Parse and announce new fiirumi posts and questions.
+
+    Topics are new when the persisted topic cursor has not announced them yet,
+    so posts made while the bot was down are announced after a restart. The
+    topic and question lists are handled independently: one failing does not
+    hold back announcements from the other.
+    """
+    if not discourse_breaker.allow():
+        logger.debug("Fiirumi circuit open, skipping post parsing")
+        return
     topic_url = get_topic_list_url()
     question_url = get_question_list_url()
-    try:
-        current_time = get_current_minute_start()
-        topic_json, question_json = await asyncio.gather(
-            asyncio.to_thread(get_fiirumi_data, topic_url),
-            asyncio.to_thread(get_fiirumi_data, question_url),
-        )
-        topic_list = topic_json["topic_list"]["topics"]
-        question_list = question_json["topic_list"]["topics"]
-        logger.debug(
-            "Retrieved %d topics and %d questions", len(topic_list), len(question_list)
-        )
-    except KeyError as e:
-        logger.error(
-            "The topic and question lists cannot be found. Check URLs. Got error %s", e
-        )
-        return
-    except Exception as e:
-        logger.error("Error fetching Fiirumi data: %s", e)
-        return
+    results = await asyncio.gather(
+        _take_new_topics(topic_url),
+        _take_new_topics(question_url),
+        return_exceptions=True,
+    )
+    topic_list, question_list = (
+        _new_topics_or_log(url, result)
+        for url, result in zip((topic_url, question_url), results)
+    )
+    logger.debug(
+        "Found %d new topics and %d new questions",
+        len(topic_list),
+        len(question_list),
+    )
 
     applicant_index: ApplicantIndex = []
     index_built = False
 
     for topic in topic_list:
-        created_at = topic.get("created_at")
-        if not (created_at and is_recent_timestamp(created_at, current_time)):
-            continue
         title = topic["title"]
         logger.info("Found new post: %s (ID: %s)", title, topic["id"])
         if not index_built:
@@ -154,27 +242,24 @@ async def parse_fiirumi_posts(
         )
         if linked:
             logger.info("Auto-linked post '%s' to applicants: %s", title, linked)
+        link = f'<a href="{fiirumi_link}">{title}</a>'
         await announce_to_channels(
-            f"<b>Uusi postaus Fiirumilla!</b>\n"
-            f"<b>New post on Fiirumi!</b>\n"
-            f'<a href="{fiirumi_link}">{title}</a>',
+            f"<b>Uusi postaus Fiirumilla!</b>\n<b>New post on Fiirumi!</b>\n{link}",
             context,
             data_manager,
+            [("post", link)],
         )
 
     for question in question_list:
-        created_at = question.get("created_at")
-        if not (created_at and is_recent_timestamp(created_at, current_time)):
-            continue
         title = question["title"]
         t_id = question["id"]
         logger.info("Found new question: %s (ID: %s)", title, t_id)
+        link = f'<a href="{create_fiirumi_link(t_id)}">{title}</a>'
         await announce_to_channels(
-            f"<b>Uusi kysymys Fiirumilla!</b>\n"
-            f"<b>New question on Fiirumi!</b>\n"
-            f'<a href="{create_fiirumi_link(t_id)}">{title}</a>',
+            f"<b>Uusi kysymys Fiirumilla!</b>\n<b>New question on Fiirumi!</b>\n{link}",
             context,
             data_manager,
+            [("question", link)],
         )
 
 
@@ -182,11 +267,16 @@ async def announce_new_responses(
     context: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
 ) -> None:
     """Announce new responses to questions based on timestamps, runs every hour."""
+    if not discourse_breaker.allow():
+        logger.debug("Fiirumi circuit open, skipping response announcements")
+        return
     question_url = get_question_list_url()
     try:
         current_time = get_current_minute_start()
-        question_json = await asyncio.to_thread(get_fiirumi_data, question_url)
-        question_list = question_json["topic_list"]["topics"]
+        question_page, question_list = await _fetch_topics("responses", question_url)
+        if question_list is None:
+            logger.debug("No new responses: question list not modified")
+            return
 
         new_responses: List[Dict[str, Any]] = []
 
@@ -220,15 +310,19 @@ async def announce_new_responses(
         if new_responses:
             message = "<b>Uusia vastauksia Fiirumilla!</b>\n"
             message += "<b>New responses on Fiirumi!</b>\n\n"
+            digest: List[DigestItem] = []
 
             for response in new_responses:
-                message += f"• <a href=\"{create_fiirumi_link(response['t_id'])}/{response['posts_count']}\">{response['title']}</a>\n"
+                link = f"<a href=\"{create_fiirumi_link(response['t_id'])}/{response['posts_count']}\">{response['title']}</a>"
+                message += f"• {link}\n"
                 message += f"  Viimeisin vastaaja / Latest poster: {response['last_poster']}\n\n"
+                digest.append(("response", f"{link} ({response['last_poster']})"))
 
-            await announce_to_channels(message, context, data_manager)
+            await announce_to_channels(message, context, data_manager, digest)
             logger.info(
                 "Announced %d questions with recent responses", len(new_responses)
             )
+        _mark_processed("responses", question_url, question_page)
 
     except Exception as e:
         logger.error("Error in announce_new_responses: %s", e)
@@ -22,6 +22,14 @@ from .config import (
     SELECTING_ROLE,
     CONFIRMING_APPLICATION,
     ELECTION_YEAR,
+    STATS_INTERVAL,
+    FIIRUMI_POLL_INTERVAL,
+    FIIRUMI_WEBHOOK_HOST,
+    FIIRUMI_WEBHOOK_PATH,
+    FIIRUMI_WEBHOOK_PORT,
+    FIIRUMI_WEBHOOK_SECRET,
+    FIIRUMI_WEBHOOK_POLL_INTERVAL,
+    DIGEST_INTERVAL,
     REGISTER_NAME,
     REGISTER_EMAIL,
     REGISTER_CONSENT,
@@ -34,11 +42,16 @@ from .admin_commands import (
     add_elected_tag,
     combine_applicants,
     export_officials_website,
+    import_roles,
+    import_results,
+    health,
+    show_stats,
     admin_help,
 )
 from .user_commands import (
     register_announcement_channel,
     unregister_channel,
+    set_channel_digest,
     show_election_sheet,
     show_election_sheet_en,
     applications_en,
@@ -66,10 +79,18 @@ from .register_handlers import (
     register_consent,
     register_cancel,
 )
+from .admin_alerts import send_admin_alerts
+from .deadline_scheduler import DeadlineScheduler
+from .digest import send_digests
+from .discourse_client import discourse
+from .executors import file_io_executor, sheets_executor
+from .stats import stats_history
 from .announcements import parse_fiirumi_posts, announce_new_responses
 from .admin_approval import handle_admin_approval
 from .sheet_updater import update_election_sheet
+from .sheet_diff import notify_sheet_changes
 from .fiirumi_area_generator import should_generate_areas, generate_election_areas
+from .webhook import FiirumiWebhook
 
 logger = logging.getLogger("vaalilakanabot")
 
@@ -129,12 +150,21 @@ async def process_application_queue(
 ) -> None:
     """Flush queued applications, status updates, channel operations, and user operations to Google Sheets."""
     try:
-        data_manager.flush_all_queues()
+        await sheets_executor.run(data_manager.flush_all_queues)
         logger.debug("Successfully flushed all queues")
     except Exception as e:
         logger.error("Error in queue processing job: %s", e)
 
 
+async def record_stats(_: ContextTypes.DEFAULT_TYPE, data_manager: DataManager) -> None:
+    """Append an application statistics sample to the /stats time series."""
+    try:
+        stats = await sheets_executor.run(data_manager.statistics)
+        await file_io_executor.run(stats_history.record, stats)
+    except Exception as e:
+        logger.error("Error recording statistics: %s", e)
+
+
 async def post_init(
     app: Application[Any, Any, Any, Any, Any, Any], data_manager: DataManager
 ) -> None:
@@ -153,7 +183,7 @@ async def post_init(
             )
     if election_year_int is not None and should_generate_areas(election_year_int):
         logger.info("Generating election areas for year %s", election_year_int)
-        success = generate_election_areas(election_year_int)
+        success = await generate_election_areas(election_year_int)
         if not success:
             logger.error(
                 "Failed to generate election areas for year %s", election_year_int
@@ -166,9 +196,24 @@ async def post_init(
         raise ValueError("JobQueue is None")
 
     # Schedule jobs
+    fiirumi_poll_interval = FIIRUMI_POLL_INTERVAL
+    if FIIRUMI_WEBHOOK_PORT:
+        if FIIRUMI_WEBHOOK_SECRET:
+            webhook = FiirumiWebhook(
+                FIIRUMI_WEBHOOK_PATH,
+                FIIRUMI_WEBHOOK_SECRET,
+                jq,
+                _job(parse_fiirumi_posts, data_manager),
+            )
+            await webhook.start(FIIRUMI_WEBHOOK_HOST, FIIRUMI_WEBHOOK_PORT)
+            app.bot_data["fiirumi_webhook"] = webhook
+            # Deliveries trigger polls; the repeating poll only reconciles
+            fiirumi_poll_interval = FIIRUMI_WEBHOOK_POLL_INTERVAL
+        else:
+            logger.error("FIIRUMI_WEBHOOK_SECRET is not set; not starting the webhook")
     jq.run_repeating(
         _job(parse_fiirumi_posts, data_manager),
-        interval=60,
+        interval=fiirumi_poll_interval,
         first=datetime.datetime(2025, 8, 10, hour=0),
     )
     jq.run_repeating(
@@ -189,6 +234,26 @@ async def post_init(
         first=datetime.datetime(2025, 8, 10, hour=0, minute=0, second=10),
     )
 
+    jq.run_repeating(send_admin_alerts, interval=15, first=15)
+
+    jq.run_repeating(
+        _job(notify_sheet_changes, data_manager),
+        interval=60,
+        first=datetime.datetime(2025, 8, 10, hour=0, minute=0, second=40),
+    )
+
+    DeadlineScheduler(data_manager).start(jq)
+
+    jq.run_repeating(
+        _job(send_digests, data_manager),
+        interval=DIGEST_INTERVAL,
+        first=DIGEST_INTERVAL,
+    )
+
+    jq.run_repeating(
+        _job(record_stats, data_manager), interval=STATS_INTERVAL, first=30
+    )
+
     # Admin command handlers
     app.add_handler(CommandHandler("remove", _dm_ctx(remove_applicant, data_manager)))
     app.add_handler(
@@ -202,16 +267,38 @@ async def post_init(
         CommandHandler("combine", _dm_ctx(combine_applicants, data_manager))
     )
 
+    app.add_handler(
+        CommandHandler("import_roles", _dm_ctx(import_roles, data_manager))
+    )
+    app.add_handler(
+        MessageHandler(
+            filters.Document.ALL & filters.CaptionRegex(r"^/import_roles(@\w+)?\b"),
+            _dm_ctx(import_roles, data_manager),
+        )
+    )
+    app.add_handler(
+        CommandHandler("import_results", _dm_ctx(import_results, data_manager))
+    )
+    app.add_handler(
+        MessageHandler(
+            filters.Document.ALL & filters.CaptionRegex(r"^/import_results(@\w+)?\b"),
+            _dm_ctx(import_results, data_manager),
+        )
+    )
+
     # export_data removed; use Google Sheets directly for raw exports
     app.add_handler(
         CommandHandler(
             "export_officials_website", _dm(export_officials_website, data_manager)
         )
     )
+    app.add_handler(CommandHandler("health", _dm(health, data_manager)))
+    app.add_handler(CommandHandler("stats", _dm(show_stats, data_manager)))
     app.add_handler(CommandHandler("admin_help", admin_help))
 
     # User command handlers
     app.add_handler(CommandHandler("stop", _dm(unregister_channel, data_manager)))
+    app.add_handler(CommandHandler("digest", _dm(set_channel_digest, data_manager)))
     app.add_handler(
         CommandHandler(
             "announcements", _dm(register_announcement_channel, data_manager)
@@ -352,6 +439,14 @@ async def post_init(
     logger.info("Post init done.")
 
 
+async def post_shutdown(app: Application[Any, Any, Any, Any, Any, Any]) -> None:
+    """Stop the webhook receiver and close the Fiirumi connections."""
+    webhook: Optional[FiirumiWebhook] = app.bot_data.get("fiirumi_webhook")
+    if webhook is not None:
+        await webhook.stop()
+    await discourse.aclose()
+
+
 def main() -> None:
     """Main function to run the bot."""
     setup_logging()
@@ -364,6 +459,7 @@ def main() -> None:
 
     # Set up post initialization
     app.post_init = lambda app: post_init(app, data_manager)
+    app.post_shutdown = post_shutdown
 
     # Run the bot
     app.run_polling()
@@ -0,0 +1,193 @@
+"""Circuit breakers for the external services (Google Sheets and Fiirumi)."""
+
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Literal, Optional, TypeVar
+
+import httpx
+import requests
+from gspread.exceptions import APIError
+
+from .admin_alerts import queue_admin_alert
+from .config import BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT
+
+logger = logging.getLogger("vaalilakanabot")
+T = TypeVar("T")
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# Status codes that mean the service is struggling rather than the request being wrong
+OUTAGE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+
+def is_outage_error(exc: BaseException) -> bool:
+    """Return True if the exception means the remote service is down or overloaded."""
+    if isinstance(
+        exc, (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+    ):
+        return True
+    if isinstance(exc, TimeoutError):
+        # A request deadline expired
+        return True
+    response = getattr(exc, "response", None)
+    if (
+        isinstance(exc, (requests.HTTPError, httpx.HTTPStatusError, APIError))
+        and response is not None
+    ):
+        return getattr(response, "status_code", None) in OUTAGE_STATUS_CODES
+    return False
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """Closed/open/half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failed calls the breaker opens and
+    calls fail fast with CircuitOpenError. Once ``reset_timeout`` seconds have
+    passed it goes half-open and admits a single probe call, while other calls
+    keep failing fast: the probe's success closes it, its failure opens it
+    again. Admins are alerted when it trips and when it recovers, not on every
+    half-open retry.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state; an open breaker turns half-open once the timeout has passed."""
+        with self._lock:
+            if (
+                self._state == "open"
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = "half_open"
+                self._probing = False
+                logger.info("%s circuit half-open, probing", self.name)
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now (without admitting it)."""
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self._probing)
+
+    def acquire(self) -> Optional[BreakerState]:
+        """Admit a call; return the state it was admitted in, or None to fail fast.
+
+        While half-open only one call, the probe, is admitted until it reports
+        back with record_success or record_failure, or ends with release_probe.
+        """
+        if self.state == "open":
+            return None
+        with self._lock:
+            if self._state == "closed":
+                return "closed"
+            if self._state == "half_open" and not self._probing:
+                self._probing = True
+                return "half_open"
+            return None
+
+    def release_probe(self) -> None:
+        """End a half-open probe that neither succeeded nor hit an outage."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """Record a successful call; closes a half-open breaker."""
+        with self._lock:
+            recovered = self._state != "closed"
+            self._state = "closed"
+            self._failures = 0
+            self._probing = False
+        if recovered:
+            logger.info("%s circuit closed", self.name)
+            queue_admin_alert(f"✅ <b>{self.name} is reachable again.</b>")
+
+    def record_failure(self) -> None:
+        """Record a failed call; opens the breaker at the threshold or on a failed probe."""
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            tripped = self._state == "closed" and (
+                self._failures >= self.failure_threshold
+            )
+            if tripped or self._state == "half_open":
+                self._state = "open"
+                self._opened_at = time.monotonic()
+        if tripped:
+            logger.error(
+                "%s circuit opened after %d failures", self.name, self._failures
+            )
+            queue_admin_alert(
+                f"⚠️ <b>{self.name} is unreachable.</b>\n"
+                "Serving the last known data, keeping writes queued and skipping "
+                "background work until it recovers."
+            )
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call func through the breaker, failing fast while it is open.
+
+        HTTP responses with an outage status count as failures even though
+        requests does not raise for them.
+        """
+        admitted = self.acquire()
+        if admitted is None:
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        try:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if is_outage_error(e):
+                    self.record_failure()
+                raise
+            self._record_result(result)
+            return result
+        finally:
+            if admitted == "half_open":
+                self.release_probe()
+
+    async def call_async(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await func through the breaker, failing fast while it is open."""
+        admitted = self.acquire()
+        if admitted is None:
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        try:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if is_outage_error(e):
+                    self.record_failure()
+                raise
+            self._record_result(result)
+            return result
+        finally:
+            if admitted == "half_open":
+                self.release_probe()
+
+    def _record_result(self, result: Any) -> None:
+        if getattr(result, "status_code", None) in OUTAGE_STATUS_CODES:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+sheets_breaker = CircuitBreaker("Google Sheets")
+discourse_breaker = CircuitBreaker("Fiirumi")
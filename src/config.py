@@ -1,7 +1,7 @@
 """Configuration settings for the Vaalilakanabot."""
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Bot configuration
 TOKEN: str = os.environ["VAALILAKANABOT_TOKEN"]
@@ -12,6 +12,9 @@ BASE_URL: str = os.environ["BASE_URL"].rstrip("/")
 GOOGLE_SHEET_URL: str = os.environ["GOOGLE_SHEET_URL"]
 # Use a fixed credentials file name; keep it out of version control
 GOOGLE_CREDENTIALS_FILE: str = "google_credentials.json"
+# Backend for cached sheet reads: "api" (Sheets values API) or "csv" (CSV export
+# endpoint, which does not consume the Sheets API read quota). Optional.
+SHEETS_READ_BACKEND: str = os.environ.get("SHEETS_READ_BACKEND", "api").strip().lower()
 
 # Discourse / Fiirumi configuration
 API_KEY: str = os.environ["API_KEY"]
@@ -22,6 +25,94 @@ API_USERNAME: str = os.environ["API_USERNAME"]
 # creates the election sheet topic, and derives all Fiirumi URLs from this.
 ELECTION_YEAR: str = os.environ["ELECTION_YEAR"]
 
+# Spreadsheets of past elections (optional), e.g. "2024=<url>,2023=<url>". They are
+# opened read-only on first use (/lakana 2024); user info comes from this year's
+# Users sheet.
+PAST_ELECTION_SHEETS: Dict[str, str] = dict(
+    (year.strip(), url.strip())
+    for year, _, url in (
+        entry.partition("=")
+        for entry in os.environ.get("PAST_ELECTION_SHEETS", "").split(",")
+        if "=" in entry
+    )
+)
+
+# Circuit breakers for Google Sheets and Fiirumi (optional): consecutive outage
+# errors before a breaker opens, and seconds before an open breaker is probed again.
+BREAKER_FAILURE_THRESHOLD: int = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_RESET_TIMEOUT: float = float(os.environ.get("BREAKER_RESET_TIMEOUT", "60"))
+
+# Worker threads for blocking calls to each external dependency (optional), and how
+# many calls may wait for a worker before new ones are rejected.
+SHEETS_WORKERS: int = int(os.environ.get("SHEETS_WORKERS", "2"))
+DISCOURSE_WORKERS: int = int(os.environ.get("DISCOURSE_WORKERS", "4"))
+FILE_IO_WORKERS: int = int(os.environ.get("FILE_IO_WORKERS", "2"))
+EXECUTOR_MAX_QUEUE: int = int(os.environ.get("EXECUTOR_MAX_QUEUE", "100"))
+
+# Fiirumi (Discourse) HTTP timeouts in seconds (optional): establishing a connection,
+# waiting for each response read, and the deadline for a whole request.
+DISCOURSE_CONNECT_TIMEOUT: float = float(
+    os.environ.get("DISCOURSE_CONNECT_TIMEOUT", "5")
+)
+DISCOURSE_READ_TIMEOUT: float = float(os.environ.get("DISCOURSE_READ_TIMEOUT", "30"))
+DISCOURSE_REQUEST_DEADLINE: float = float(
+    os.environ.get("DISCOURSE_REQUEST_DEADLINE", "60")
+)
+
+# Google Sheets write backlog (optional): queued applications and status updates
+# beyond QUEUE_HIGH_WATER are kept on disk in QUEUE_SPILL_DIR, flushes send at most
+# FLUSH_CHUNK_SIZE rows per request, and admins are alerted once a queue holds
+# QUEUE_ALERT_THRESHOLD items.
+QUEUE_HIGH_WATER: int = int(os.environ.get("QUEUE_HIGH_WATER", "500"))
+QUEUE_SPILL_DIR: str = os.environ.get("QUEUE_SPILL_DIR", "data")
+FLUSH_CHUNK_SIZE: int = int(os.environ.get("FLUSH_CHUNK_SIZE", "200"))
+QUEUE_ALERT_THRESHOLD: int = int(os.environ.get("QUEUE_ALERT_THRESHOLD", "200"))
+
+# Seconds before expiry at which the Google access token is refreshed in the
+# background (optional). Must exceed google-auth's own threshold of 225 seconds.
+TOKEN_REFRESH_MARGIN: float = float(os.environ.get("TOKEN_REFRESH_MARGIN", "600"))
+
+# Announce to registered channels 24 hours before each application deadline
+# (optional, off by default). Set to "true" to enable.
+DEADLINE_REMINDERS: bool = os.environ.get("DEADLINE_REMINDERS", "").lower() == "true"
+
+# Application statistics time series for /stats (optional): samples are taken every
+# STATS_INTERVAL seconds and appended to STATS_FILE when the counts changed.
+STATS_FILE: str = os.environ.get("STATS_FILE", "data/stats.jsonl")
+STATS_INTERVAL: int = int(os.environ.get("STATS_INTERVAL", "3600"))
+
+# Seconds between re-reads of the Fiirumi election sheet post while the sheet itself
+# is unchanged (optional); picks up edits to the preamble.
+SHEET_RECHECK_INTERVAL: float = float(os.environ.get("SHEET_RECHECK_INTERVAL", "600"))
+
+# Seconds between announcement digests for channels that enabled /digest (optional)
+DIGEST_INTERVAL: int = int(os.environ.get("DIGEST_INTERVAL", "3600"))
+
+# Fiirumi polling for new introductions and questions (optional): seconds between
+# polls, and the file recording which topics were announced, so polls missed
+# during downtime are caught up on after a restart.
+FIIRUMI_POLL_INTERVAL: int = int(os.environ.get("FIIRUMI_POLL_INTERVAL", "60"))
+FIIRUMI_CURSOR_FILE: str = os.environ.get(
+    "FIIRUMI_CURSOR_FILE", "data/fiirumi_cursor.json"
+)
+
+# Fiirumi topic list pagination (optional): pages requested at once, and the most
+# pages read from one list.
+FIIRUMI_PAGE_CONCURRENCY: int = int(os.environ.get("FIIRUMI_PAGE_CONCURRENCY", "1"))
+FIIRUMI_MAX_PAGES: int = int(os.environ.get("FIIRUMI_MAX_PAGES", "50"))
+
+# Discourse webhook receiver (optional, off unless FIIRUMI_WEBHOOK_PORT is set):
+# Fiirumi posts topic_created events to FIIRUMI_WEBHOOK_PATH, signed with
+# FIIRUMI_WEBHOOK_SECRET. While it runs, topics are polled only every
+# FIIRUMI_WEBHOOK_POLL_INTERVAL seconds to catch deliveries that were missed.
+FIIRUMI_WEBHOOK_PORT: int = int(os.environ.get("FIIRUMI_WEBHOOK_PORT", "0"))
+FIIRUMI_WEBHOOK_HOST: str = os.environ.get("FIIRUMI_WEBHOOK_HOST", "0.0.0.0")
+FIIRUMI_WEBHOOK_PATH: str = os.environ.get("FIIRUMI_WEBHOOK_PATH", "/fiirumi-webhook")
+FIIRUMI_WEBHOOK_SECRET: str = os.environ.get("FIIRUMI_WEBHOOK_SECRET", "")
+FIIRUMI_WEBHOOK_POLL_INTERVAL: int = int(
+    os.environ.get("FIIRUMI_WEBHOOK_POLL_INTERVAL", "900")
+)
+
 # Set by fiirumi_area_generator after finding/creating the election sheet topic.
 # A list is used so the setter can mutate it without a global statement.
 _generated_vaalilakana_post_url: List[Optional[str]] = [None]
@@ -0,0 +1,102 @@
+"""Shared service-account credentials with background token refresh."""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+
+from .config import TOKEN_REFRESH_MARGIN
+
+logger = logging.getLogger("vaalilakanabot")
+
+# Delay before retrying a failed refresh; the old token is usually still valid
+RETRY_DELAY = 30.0
+
+_managers: Dict[Tuple[str, Tuple[str, ...]], "CredentialManager"] = {}
+_managers_lock = threading.Lock()
+
+
+class CredentialManager:
+    """Keeps one service-account access token fresh from a daemon thread.
+
+    The token is refreshed ``TOKEN_REFRESH_MARGIN`` seconds before it expires,
+    which is earlier than google-auth's own refresh threshold, so requests made
+    through clients using these credentials never stop to fetch a token.
+    """
+
+    def __init__(self, credentials_file: str, scopes: List[str]) -> None:
+        self.credentials: Credentials = Credentials.from_service_account_file(  # type: ignore[no-untyped-call]
+            credentials_file, scopes=scopes
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_refresh_ms: Optional[float] = None
+
+    def refresh(self) -> None:
+        """Fetch a new access token and record how long it took."""
+        started = time.perf_counter()
+        with self._lock:
+            self.credentials.refresh(Request())  # type: ignore[no-untyped-call]
+            self.last_refresh_ms = 1000 * (time.perf_counter() - started)
+            self.refresh_count += 1
+        logger.debug("Refreshed Google access token in %.0f ms", self.last_refresh_ms)
+
+    def start(self) -> None:
+        """Fetch the first token and start the background refresh thread."""
+        if self._thread is not None:
+            return
+        self.refresh()
+        self._thread = threading.Thread(
+            target=self._run, name="token-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def seconds_until_expiry(self) -> Optional[float]:
+        """Seconds until the current token expires, or None if there is none."""
+        expiry: Optional[datetime] = self.credentials.expiry
+        if expiry is None:
+            return None
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds()
+
+    def _run(self) -> None:
+        while True:
+            remaining = self.seconds_until_expiry()
+            delay = 0.0 if remaining is None else remaining - TOKEN_REFRESH_MARGIN
+            time.sleep(max(delay, 0.0))
+            try:
+                self.refresh()
+            except Exception as e:
+                self.failure_count += 1
+                logger.error("Background token refresh failed: %s", e)
+                time.sleep(RETRY_DELAY)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return refresh metrics for the health report."""
+        return {
+            "refreshes": self.refresh_count,
+            "failures": self.failure_count,
+            "last_refresh_ms": self.last_refresh_ms,
+            "expires_in": self.seconds_until_expiry(),
+        }
+
+
+def get_credential_manager(
+    credentials_file: str, scopes: List[str]
+) -> CredentialManager:
+    """Return the started manager shared by every client using these credentials."""
+    key = (credentials_file, tuple(scopes))
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = CredentialManager(credentials_file, scopes)
+            manager.start()
+            _managers[key] = manager
+        return manager
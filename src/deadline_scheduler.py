@@ -0,0 +1,95 @@
+"""Job that fires at application deadlines and sends optional closing reminders."""
+
+import heapq
+import logging
+from datetime import datetime
+from typing import Any, List, Optional
+
+from telegram.ext import ContextTypes, JobQueue
+
+from .announcements import announce_to_channels
+from .config import DEADLINE_REMINDERS
+from .deadlines import DeadlineCalendar, DeadlineEvent
+from .sheets_data_manager import DataManager
+from .utils import get_role_name
+
+logger = logging.getLogger("vaalilakanabot")
+
+# Longest sleep between runs, so deadlines edited in the sheet are picked up
+RESYNC_INTERVAL = 600.0
+
+
+class DeadlineScheduler:
+    """Fires one run_once job at the next deadline event and re-arms itself.
+
+    Pending events live in a heap built from the current DeadlineCalendar; the
+    heap is rebuilt only when the roles snapshot (and so the calendar) changes.
+    Position keyboards are keyed on the number of passed deadlines, so a
+    closed role is evicted from them at its deadline even if this job is late.
+    """
+
+    def __init__(self, data_manager: DataManager) -> None:
+        self.data_manager = data_manager
+        self._calendar: Optional[DeadlineCalendar] = None
+        self._events: List[DeadlineEvent] = []
+        self._last_run = datetime.now()
+
+    def start(self, job_queue: JobQueue[Any]) -> None:
+        """Schedule the first run, which loads the calendar."""
+        job_queue.run_once(self.run, when=5.0, name="deadlines")
+
+    async def run(self, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle every event due since the last run, then schedule the next run."""
+        now = datetime.now()
+        try:
+            self._sync_calendar(now)
+            due: List[DeadlineEvent] = []
+            while self._events and self._events[0][0] <= now:
+                due.append(heapq.heappop(self._events))
+            await self._handle(due, context)
+        except Exception as e:
+            logger.error("Error handling deadline events: %s", e)
+        finally:
+            self._last_run = now
+            if context.job_queue is not None:
+                self._arm(context.job_queue, now)
+
+    def _sync_calendar(self, now: datetime) -> None:
+        """Rebuild the event heap if the roles snapshot changed since the last run."""
+        calendar = self.data_manager.deadline_calendar(now)
+        if calendar is not self._calendar:
+            self._calendar = calendar
+            self._events = calendar.events(self._last_run, DEADLINE_REMINDERS)
+
+    def _arm(self, job_queue: JobQueue[Any], now: datetime) -> None:
+        delay = RESYNC_INTERVAL
+        if self._events:
+            delay = min(delay, (self._events[0][0] - now).total_seconds())
+        job_queue.run_once(self.run, when=max(delay, 1.0), name="deadlines")
+
+    async def _handle(
+        self, due: List[DeadlineEvent], context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        reminder_roles = []
+        for _, kind, role_id in due:
+            role = self.data_manager.get_role_by_id(role_id)
+            if role is None:
+                continue
+            if kind == "close":
+                logger.info("Applications closed for %s", role.get("Role_EN"))
+            else:
+                reminder_roles.append(role)
+        if not reminder_roles:
+            return
+        names_fi = ", ".join(get_role_name(r, True) for r in reminder_roles)
+        names_en = ", ".join(get_role_name(r, False) for r in reminder_roles)
+        await announce_to_channels(
+            f"⏰ <b>Haku sulkeutuu 24 tunnin kuluttua:</b> {names_fi}\n"
+            f"⏰ <b>Applications close in 24 hours:</b> {names_en}",
+            context,
+            self.data_manager,
+            [
+                ("deadline", f"{get_role_name(r, True)} / {get_role_name(r, False)}")
+                for r in reminder_roles
+            ],
+        )
@@ -0,0 +1,67 @@
+"""Application deadlines parsed once per roles snapshot."""
+
+import bisect
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from .types import ElectionStructureRow
+
+DeadlineEventKind = Literal["remind", "close"]
+# (when, kind, Role_ID); tuples order by time first, so a list of them is a heap
+DeadlineEvent = Tuple[datetime, DeadlineEventKind, str]
+
+REMINDER_LEAD = timedelta(hours=24)
+
+
+def parse_deadline(deadline: Optional[str], year: int) -> Optional[datetime]:
+    """Return when applications close for a 'dd.mm.' deadline, or None if unparseable.
+
+    The deadline day itself is still open: the role closes at midnight after it.
+    """
+    if not deadline:
+        return None
+    try:
+        day, month = deadline.strip().rstrip(".").split(".")
+        return datetime(year, int(month), int(day)) + timedelta(days=1)
+    except (ValueError, AttributeError):
+        return None
+
+
+class DeadlineCalendar:
+    """Closing times of all roles with a deadline, for one roles snapshot and year.
+
+    Closing times are kept sorted, so the number of deadlines already passed is
+    a bisect and callers can key prebuilt keyboards on it instead of checking
+    every role on every button press.
+    """
+
+    def __init__(self, roles: Iterable[ElectionStructureRow], year: int) -> None:
+        """Parse every role's Deadline for the given year."""
+        self.year = year
+        self.closes_at: Dict[str, datetime] = {}
+        for role in roles:
+            closes_at = parse_deadline(role.get("Deadline"), year)
+            if closes_at is not None:
+                self.closes_at[role.get("ID", "")] = closes_at
+        self._closing_times: List[datetime] = sorted(self.closes_at.values())
+
+    def closed_count(self, now: datetime) -> int:
+        """Number of deadlines that have passed at the given time."""
+        return bisect.bisect_right(self._closing_times, now)
+
+    def is_open(self, role_id: str, now: datetime) -> bool:
+        """Return True if applications to the role are still accepted."""
+        closes_at = self.closes_at.get(role_id)
+        return closes_at is None or now < closes_at
+
+    def events(self, after: datetime, reminders: bool) -> List[DeadlineEvent]:
+        """Return a heap of the close (and reminder) events later than ``after``."""
+        events: List[DeadlineEvent] = []
+        for role_id, closes_at in self.closes_at.items():
+            if closes_at > after:
+                events.append((closes_at, "close", role_id))
+            if reminders and closes_at - REMINDER_LEAD > after:
+                events.append((closes_at - REMINDER_LEAD, "remind", role_id))
+        heapq.heapify(events)
+        return events
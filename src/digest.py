@@ -0,0 +1,99 @@
+"""Periodic announcement digests for channels that prefer them over single messages."""
+
+import logging
+from typing import Dict, Iterable, List, Literal, Tuple
+
+from telegram.ext import ContextTypes
+
+from .sheets_data_manager import DataManager
+
+logger = logging.getLogger("vaalilakanabot")
+
+DigestSection = Literal[
+    "candidate", "withdrawal", "result", "deadline", "post", "question", "response"
+]
+# (section, one HTML line describing the event)
+DigestItem = Tuple[DigestSection, str]
+
+# Section headings in the order they appear in a digest
+DIGEST_SECTIONS: Dict[DigestSection, str] = {
+    "candidate": "Uudet nimet vaalilakanassa / New candidates",
+    "withdrawal": "Poistuneet vaalilakanasta / Withdrawn",
+    "result": "Valitut / Elected",
+    "deadline": "Haku sulkeutuu 24 tunnin kuluttua / Applications close in 24 hours",
+    "post": "Uudet postaukset Fiirumilla / New posts on Fiirumi",
+    "question": "Uudet kysymykset Fiirumilla / New questions on Fiirumi",
+    "response": "Uudet vastaukset Fiirumilla / New responses on Fiirumi",
+}
+# Stay below Telegram's 4096 character message limit
+MESSAGE_LIMIT = 4000
+
+
+class ChannelDigest:
+    """Announcement items buffered per channel until the next digest run.
+
+    Items are buffered for the channels that had digests enabled when the
+    announcement was made, so switching /digest on or off never duplicates
+    or drops an announcement.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[int, List[DigestItem]] = {}
+
+    def add(self, item: DigestItem, channel_ids: Iterable[int]) -> None:
+        """Buffer an item for each of the given channels."""
+        for channel_id in channel_ids:
+            self._pending.setdefault(channel_id, []).append(item)
+
+    def drain(self) -> Dict[int, List[DigestItem]]:
+        """Take every buffered item, leaving the buffer empty."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+
+channel_digest = ChannelDigest()
+
+
+def queue_digest(item: DigestItem, data_manager: DataManager) -> None:
+    """Buffer an item for digest channels only; others are not told at all."""
+    channel_digest.add(
+        item, (c["Channel_ID"] for c in data_manager.channels if c.get("Digest"))
+    )
+
+
+def render_digest(items: List[DigestItem]) -> List[str]:
+    """Render items grouped by section; returns one or more message texts."""
+    by_section: Dict[DigestSection, List[str]] = {}
+    for section, line in items:
+        by_section.setdefault(section, []).append(line)
+    lines = ["<b>Vaalikooste / Election digest</b>"]
+    for section, heading in DIGEST_SECTIONS.items():
+        if section in by_section:
+            lines.append(f"\n<b>{heading}</b>")
+            lines.extend(f"• {line}" for line in by_section[section])
+
+    messages: List[str] = []
+    current = ""
+    for line in lines:
+        if current and len(current) + len(line) + 1 > MESSAGE_LIMIT:
+            messages.append(current)
+            current = line.lstrip("\n")
+        else:
+            current = f"{current}\n{line}" if current else line
+    messages.append(current)
+    return messages
+
+
+async def send_digests(
+    context: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
+) -> None:
+    """Send each digest channel one message with everything buffered for it."""
+    for channel_id, items in channel_digest.drain().items():
+        try:
+            for text in render_digest(items):
+                await context.bot.send_message(channel_id, text, parse_mode="HTML")
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(e)
+            data_manager.remove_channel(channel_id)
+            continue
+        logger.info("Sent digest of %d items to channel %s", len(items), channel_id)
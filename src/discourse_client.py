@@ -0,0 +1,211 @@
+"""Shared asyncio HTTP client for the Fiirumi (Discourse) API."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, cast
+
+import httpx
+
+from .circuit_breaker import discourse_breaker
+from .config import (
+    API_KEY,
+    API_USERNAME,
+    BASE_URL,
+    DISCOURSE_CONNECT_TIMEOUT,
+    DISCOURSE_READ_TIMEOUT,
+    DISCOURSE_REQUEST_DEADLINE,
+    DISCOURSE_WORKERS,
+    FIIRUMI_MAX_PAGES,
+    FIIRUMI_PAGE_CONCURRENCY,
+)
+from .executors import discourse_executor
+
+logger = logging.getLogger("vaalilakanabot")
+
+
+class CachedList(NamedTuple):
+    """A topic list body with the validators Discourse sent for it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Dict[str, Any]
+
+
+class DiscourseClient:
+    """Native asyncio client for every Discourse endpoint the bot uses.
+
+    One keep-alive httpx.AsyncClient is shared, so polls and sheet updates reuse
+    warm TLS connections. Every request goes through the Fiirumi circuit breaker
+    and the discourse bulkhead, has separate connect and read timeouts, and is
+    cancelled as a whole once its deadline passes. Cancelling the awaiting task
+    cancels the request, so a hung call never holds a thread.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = DISCOURSE_CONNECT_TIMEOUT,
+        read_timeout: float = DISCOURSE_READ_TIMEOUT,
+        deadline: float = DISCOURSE_REQUEST_DEADLINE,
+        pool_size: int = DISCOURSE_WORKERS,
+    ) -> None:
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.deadline = deadline
+        self.pool_size = max(1, pool_size)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lists: Dict[str, CachedList] = {}
+
+    def _http(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use inside the event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"Api-Key": API_KEY, "Api-Username": API_USERNAME},
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+        return self._client
+
+    async def _send(
+        self, method: str, url: str, deadline: float, **kwargs: Any
+    ) -> httpx.Response:
+        async with asyncio.timeout(deadline):
+            return await self._http().request(method, url, **kwargs)
+
+    async def request(
+        self, method: str, url: str, deadline: Optional[float] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request and raise httpx.HTTPStatusError for 4xx and 5xx responses.
+
+        ``deadline`` (seconds, default DISCOURSE_REQUEST_DEADLINE) bounds the
+        whole exchange; when it passes the request is cancelled and TimeoutError
+        is raised.
+        """
+        response: httpx.Response = await discourse_executor.run(
+            discourse_breaker.call_async,
+            self._send,
+            method,
+            url,
+            self.deadline if deadline is None else deadline,
+            **kwargs,
+        )
+        if response.is_error:
+            response.raise_for_status()
+        return response
+
+    async def get_json(self, url: str, deadline: Optional[float] = None) -> Any:
+        """GET a JSON endpoint and return the decoded body."""
+        return (await self.request("GET", url, deadline)).json()
+
+    async def topic_list(self, url: str) -> Dict[str, Any]:
+        """Return a category topic list (``.../l/latest.json``).
+
+        Lists are fetched with If-None-Match / If-Modified-Since when an earlier
+        response had an ETag or Last-Modified. On 304 Not Modified the body is
+        not downloaded or parsed: the previously returned object is returned
+        again, so callers can detect "no change" with an identity check.
+        """
+        cached = self._lists.get(url)
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = await self.request("GET", url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Topic list not modified: %s", url)
+            return cached.body
+        body = cast(Dict[str, Any], response.json())
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._lists[url] = CachedList(etag, last_modified, body)
+        else:
+            self._lists.pop(url, None)
+        return body
+
+    async def more_topics(
+        self,
+        url: str,
+        first_page: Dict[str, Any],
+        stop: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+        concurrency: int = FIIRUMI_PAGE_CONCURRENCY,
+        max_pages: int = FIIRUMI_MAX_PAGES,
+    ) -> List[Dict[str, Any]]:
+        """Return the topics on the pages after ``first_page`` of a topic list.
+
+        Pages are requested with ``?page=N`` for as long as the previous page
+        has a ``more_topics_url``, up to ``max_pages`` pages in all. ``stop`` is
+        called with each page's topics; returning True ends the traversal after
+        that page. With ``concurrency`` above 1 that many pages are requested at
+        once, and pages fetched past the end are ignored.
+        """
+        topics: List[Dict[str, Any]] = []
+        if not first_page.get("topic_list", {}).get("more_topics_url"):
+            return topics
+        separator = "&" if "?" in url else "?"
+        page = 1
+        while page < max_pages:
+            batch = range(page, min(page + max(1, concurrency), max_pages))
+            results = await asyncio.gather(
+                *(self.get_json(f"{url}{separator}page={n}") for n in batch)
+            )
+            for result in results:
+                topic_list = result.get("topic_list", {})
+                page_topics = topic_list.get("topics", [])
+                topics.extend(page_topics)
+                if (
+                    not page_topics
+                    or not topic_list.get("more_topics_url")
+                    or (stop is not None and stop(page_topics))
+                ):
+                    return topics
+            page = batch.stop
+        logger.warning("Stopped reading %s after %d pages", url, max_pages)
+        return topics
+
+    async def topic(self, topic_id: int) -> Dict[str, Any]:
+        """Return a topic with its first posts (``t/{id}.json``)."""
+        return cast(
+            Dict[str, Any], await self.get_json(f"{BASE_URL}/t/{topic_id}.json")
+        )
+
+    async def get_post(self, post_url: str) -> Dict[str, Any]:
+        """Return a post (``posts/{id}.json``), including its raw markdown."""
+        return cast(Dict[str, Any], await self.get_json(post_url))
+
+    async def update_post(self, post_url: str, raw: str) -> httpx.Response:
+        """Replace a post's markdown (PUT ``posts/{id}.json``)."""
+        return await self.request("PUT", post_url, json={"raw": raw})
+
+    async def create_post(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a topic or reply (POST ``posts.json``).
+
+        Sent as form data, which every Discourse instance accepts.
+        """
+        response = await self.request("POST", f"{BASE_URL}/posts.json", data=form)
+        return cast(Dict[str, Any], response.json())
+
+    async def show_category(self, slug: str) -> Dict[str, Any]:
+        """Return a category by slug path (``c/{slug}/show.json``)."""
+        return cast(
+            Dict[str, Any], await self.get_json(f"{BASE_URL}/c/{slug}/show.json")
+        )
+
+    async def create_category(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a category (POST ``categories.json``)."""
+        response = await self.request(
+            "POST", f"{BASE_URL}/categories.json", json=payload
+        )
+        return cast(Dict[str, Any], response.json())
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+discourse = DiscourseClient()
@@ -0,0 +1,121 @@
+"""Bulkheads for work on each external dependency.
+
+Blocking work runs in bounded thread pools; Fiirumi requests are native
+coroutines and are bounded by an asyncio semaphore instead.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from .config import (
+    DISCOURSE_WORKERS,
+    EXECUTOR_MAX_QUEUE,
+    FILE_IO_WORKERS,
+    SHEETS_WORKERS,
+)
+
+T = TypeVar("T")
+
+
+class BulkheadFullError(Exception):
+    """Raised when an executor's queue is full and new work is rejected."""
+
+
+class BoundedExecutor:
+    """A size-limited thread pool with queue-depth metrics.
+
+    Work for one dependency (e.g. Fiirumi) can only occupy this pool's threads,
+    so a hung request never delays work routed through another executor. When
+    ``max_queue`` tasks are already waiting, new work fails fast with
+    BulkheadFullError instead of piling up.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"{name}-"
+        )
+        self._lock = threading.Lock()
+        self._counts = {"queued": 0, "running": 0, "completed": 0, "rejected": 0}
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in this executor and await its result."""
+        with self._lock:
+            if self._counts["queued"] >= self.max_queue:
+                self._counts["rejected"] += 1
+                raise BulkheadFullError(f"{self.name} executor queue is full")
+            self._counts["queued"] += 1
+
+        def task() -> T:
+            with self._lock:
+                self._counts["queued"] -= 1
+                self._counts["running"] += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._counts["running"] -= 1
+                    self._counts["completed"] += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._pool, task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the executor metrics."""
+        with self._lock:
+            return {"workers": self.max_workers, **self._counts}
+
+
+class AsyncBulkhead:
+    """Limits how many coroutines for one dependency run at a time.
+
+    The counterpart of BoundedExecutor for async work: at most ``max_workers``
+    calls run concurrently, at most ``max_queue`` wait for a slot, and the
+    metrics have the same shape. Calls are plain tasks, so they can be
+    cancelled while waiting or running. Use it from the event loop only.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._counts = {"queued": 0, "running": 0, "completed": 0, "rejected": 0}
+
+    async def run(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await func(*args, **kwargs) once a slot is free."""
+        if self._counts["queued"] >= self.max_queue:
+            self._counts["rejected"] += 1
+            raise BulkheadFullError(f"{self.name} queue is full")
+        self._counts["queued"] += 1
+        waiting = True
+        try:
+            async with self._semaphore:
+                waiting = False
+                self._counts["queued"] -= 1
+                self._counts["running"] += 1
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._counts["running"] -= 1
+                    self._counts["completed"] += 1
+        finally:
+            if waiting:
+                # Cancelled before a slot was free
+                self._counts["queued"] -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the bulkhead metrics."""
+        return {"workers": self.max_workers, **self._counts}
+
+
+sheets_executor = BoundedExecutor("sheets", SHEETS_WORKERS, EXECUTOR_MAX_QUEUE)
+discourse_executor = AsyncBulkhead("discourse", DISCOURSE_WORKERS, EXECUTOR_MAX_QUEUE)
+file_io_executor = BoundedExecutor("file-io", FILE_IO_WORKERS, EXECUTOR_MAX_QUEUE)
+
+ALL_EXECUTORS = (sheets_executor, discourse_executor, file_io_executor)
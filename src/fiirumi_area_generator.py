@@ -4,32 +4,15 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, Optional, cast
 
-import requests
+import httpx
 
-from .config import BASE_URL, API_KEY, API_USERNAME, set_generated_vaalilakana_post_url
+from .config import BASE_URL, set_generated_vaalilakana_post_url
+from .discourse_client import discourse
 
 logger = logging.getLogger("vaalilakanabot")
 
 
-def get_discourse_headers(
-    content_type: Optional[str] = "application/json",
-) -> Dict[str, str]:
-    """Get headers for Discourse API requests.
-
-    Args:
-        content_type: Value for the Content-Type header, or None to omit it
-                      (e.g. when posting form data so requests sets the boundary automatically).
-    """
-    headers: Dict[str, str] = {
-        "Api-Key": API_KEY,
-        "Api-Username": API_USERNAME,
-    }
-    if content_type is not None:
-        headers["Content-Type"] = content_type
-    return headers
-
-
-def create_category(
+async def create_category(
     name: str,
     color: str = "0088CC",
     text_color: str = "FFFFFF",
@@ -48,8 +31,6 @@ def create_category(
     Returns:
         Category data dict with 'id' field if successful, None otherwise
     """
-    url = f"{BASE_URL}/categories.json"
-
     payload: Dict[str, Any] = {
         "name": name,
         "color": color,
@@ -63,19 +44,12 @@ def create_category(
         payload["parent_category_id"] = parent_category_id
 
     try:
-        response = requests.post(
-            url,
-            headers=get_discourse_headers(),
-            json=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await discourse.create_category(payload)
         category = result.get("category")
         if category is not None:
             logger.info("Created category '%s' with ID %s", name, category.get("id"))
         return cast(Optional[Dict[str, Any]], result.get("category"))
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 422:
             # Category already exists; return a stub so callers treat this as success
             logger.info("Category '%s' already exists (422)", name)
@@ -87,7 +61,7 @@ def create_category(
         return None
 
 
-def find_category_by_slug(slug: str) -> Optional[Dict[str, Any]]:
+async def find_category_by_slug(slug: str) -> Optional[Dict[str, Any]]:
     """Find a category by its slug.
 
     Args:
@@ -96,16 +70,8 @@ def find_category_by_slug(slug: str) -> Optional[Dict[str, Any]]:
     Returns:
         Category data dict if found, None otherwise
     """
-    url = f"{BASE_URL}/c/{slug}/show.json"
-
     try:
-        response = requests.get(
-            url,
-            headers=get_discourse_headers(),
-            timeout=30,
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await discourse.show_category(slug)
         return cast(Optional[Dict[str, Any]], result.get("category"))
     except Exception as e:
         logger.debug("Category with slug '%s' not found: %s", slug, e)
@@ -123,16 +89,10 @@ def _first_post_url_from_topic_data(t_data: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def _topic_id_to_post_url(topic_id: int) -> Optional[str]:
+async def _topic_id_to_post_url(topic_id: int) -> Optional[str]:
     """Fetch a topic by ID and return its first post URL."""
     try:
-        tr = requests.get(
-            f"{BASE_URL}/t/{topic_id}.json",
-            headers=get_discourse_headers(),
-            timeout=30,
-        )
-        tr.raise_for_status()
-        url = _first_post_url_from_topic_data(tr.json())
+        url = _first_post_url_from_topic_data(await discourse.topic(topic_id))
         if url:
             logger.info("Found election sheet topic (id=%d): %s", topic_id, url)
         return url
@@ -141,16 +101,23 @@ def _topic_id_to_post_url(topic_id: int) -> Optional[str]:
         return None
 
 
-def _find_by_category_list(title: str, parent_slug: str) -> Optional[str]:
+async def _find_by_category_list(title: str, parent_slug: str) -> Optional[str]:
     """Scan the parent category's topic list for a topic with the given title."""
     if not parent_slug:
         return None
     list_url = f"{BASE_URL}/c/{parent_slug}/l/latest.json"
     logger.info("Scanning category topic list: %s", list_url)
     try:
-        r = requests.get(list_url, headers=get_discourse_headers(), timeout=30)
-        r.raise_for_status()
-        topics = r.json().get("topic_list", {}).get("topics", [])
+        first_page = await discourse.topic_list(list_url)
+        topics = list(first_page.get("topic_list", {}).get("topics", []))
+        if not any(topic.get("title") == title for topic in topics):
+            topics.extend(
+                await discourse.more_topics(
+                    list_url,
+                    first_page,
+                    lambda page: any(topic.get("title") == title for topic in page),
+                )
+            )
         logger.info(
             "Category '%s' has %d topic(s): %s",
             parent_slug,
@@ -161,25 +128,24 @@ def _find_by_category_list(title: str, parent_slug: str) -> Optional[str]:
             if topic.get("title") == title:
                 topic_id = topic.get("id")
                 if topic_id:
-                    return _topic_id_to_post_url(int(topic_id))
+                    return await _topic_id_to_post_url(int(topic_id))
     except Exception as e:
         logger.warning("Category list scan failed for '%s': %s", parent_slug, e)
     return None
 
 
-def _find_election_sheet_post_url(year: int, parent_slug: str) -> Optional[str]:
+async def _find_election_sheet_post_url(year: int, parent_slug: str) -> Optional[str]:
     """Find the election sheet topic for the given year via the parent category topic list."""
-    return _find_by_category_list(f"Vaalilakana {year}", parent_slug)
+    return await _find_by_category_list(f"Vaalilakana {year}", parent_slug)
 
 
-def _create_election_sheet_topic(
+async def _create_election_sheet_topic(
     year: int, category_id: int, parent_slug: str = ""
 ) -> Optional[str]:
     """Create the election sheet topic in the given category; return its first post URL.
 
     If the topic already exists (422), falls back to searching for it.
     """
-    url = f"{BASE_URL}/posts.json"
     title = f"Vaalilakana {year}"
     # Initial body: the sheet heading satisfies Discourse's minimum-body quality check
     # and also acts as the preamble delimiter for the sheet updater.
@@ -188,22 +154,14 @@ def _create_election_sheet_topic(
         f"This post contains the automatically updated election sheet.\n\n"
         f"# VAALILAKANA {year} / ELECTION SHEET {year}\n\n"
     )
-    # Discourse often expects form data for POST /posts.json (some instances reject JSON);
-    # omit Content-Type so requests sets the correct multipart boundary automatically.
+    # Discourse often expects form data for POST /posts.json (some instances reject JSON)
     payload: Dict[str, Any] = {
         "title": title,
         "raw": raw,
         "category": category_id,
     }
     try:
-        response = requests.post(
-            url,
-            headers=get_discourse_headers(content_type=None),
-            data=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await discourse.create_post(payload)
         post_id = result.get("id")
         if post_id is not None:
             logger.info(
@@ -211,13 +169,13 @@ def _create_election_sheet_topic(
             )
             return f"{BASE_URL}/posts/{post_id}.json"
         return None
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 422:
             body = e.response.text[:500]
             logger.info(
                 "Election sheet topic '%s' already exists (422); body: %s", title, body
             )
-            return _find_election_sheet_post_url(year, parent_slug)
+            return await _find_election_sheet_post_url(year, parent_slug)
         logger.error(
             "Failed to create election sheet topic: %s — %s", e, e.response.text[:500]
         )
@@ -227,7 +185,7 @@ def _create_election_sheet_topic(
         return None
 
 
-def generate_election_areas(year: int) -> bool:
+async def generate_election_areas(year: int) -> bool:
     """Generate Discourse categories for election year.
 
     Creates:
@@ -248,11 +206,11 @@ def generate_election_areas(year: int) -> bool:
     parent_name = f"Vaalipeli {year}"
 
     # Check if parent category exists
-    parent_category = find_category_by_slug(parent_slug)
+    parent_category = await find_category_by_slug(parent_slug)
 
     if not parent_category:
         # Create parent category
-        parent_category = create_category(
+        parent_category = await create_category(
             name=parent_name,
             slug=parent_slug,
             color="ED207B",  # Pink/magenta color for elections
@@ -287,12 +245,12 @@ def generate_election_areas(year: int) -> bool:
         full_slug = f"{parent_slug}/{subcat['slug']}"
         # Try slug-based lookup first, then numeric-parent-ID-based lookup as fallback
         # (some Discourse instances don't support /c/{parent_slug}/{child_slug}/show.json)
-        existing = find_category_by_slug(full_slug) or find_category_by_slug(
-            f"{parent_id}/{subcat['slug']}"
-        )
+        existing = await find_category_by_slug(full_slug)
+        if not existing:
+            existing = await find_category_by_slug(f"{parent_id}/{subcat['slug']}")
 
         if not existing:
-            result = create_category(
+            result = await create_category(
                 name=subcat["name"],
                 slug=subcat["slug"],
                 color=subcat["color"],
@@ -317,9 +275,9 @@ def generate_election_areas(year: int) -> bool:
         logger.info("Successfully generated all election areas for year %d", year)
 
     # Find or create the election sheet topic in the parent category
-    post_url = _find_election_sheet_post_url(year, parent_slug)
+    post_url = await _find_election_sheet_post_url(year, parent_slug)
     if not post_url:
-        post_url = _create_election_sheet_topic(year, parent_id, parent_slug)
+        post_url = await _create_election_sheet_topic(year, parent_id, parent_slug)
     if post_url:
         set_generated_vaalilakana_post_url(post_url)
         logger.info("Election sheet post URL: %s", post_url)
@@ -0,0 +1,104 @@
+"""Persisted record of which Fiirumi topics have been announced."""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from .config import FIIRUMI_CURSOR_FILE
+
+logger = logging.getLogger("vaalilakanabot")
+
+
+class TopicCursor:  # pylint: disable=too-few-public-methods
+    """Per-category cursor over Fiirumi topic IDs, kept in a small JSON file.
+
+    For each category the file holds a baseline (the highest topic ID present
+    when the category was first polled, moved forward as listed topics are
+    announced) and the IDs announced above it. A topic is
+    new when its ID is above the baseline and not announced yet, however late
+    or often the poll runs, so missed ticks and restarts are caught up on and
+    nothing is announced twice. Methods do file I/O; run them in an executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._state is None:
+            self._state = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, encoding="utf-8") as cursor_file:
+                        self._state = json.load(cursor_file)
+                except (OSError, ValueError) as e:
+                    logger.error("Could not read Fiirumi cursor %s: %s", self.path, e)
+        return self._state
+
+    def _save(self, state: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write a new state and make it current; raises on failure."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as cursor_file:
+            json.dump(state, cursor_file)
+        os.replace(tmp_path, self.path)
+        self._state = state
+
+    def take_new(
+        self, category: str, topics: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Return the topics not announced yet, oldest first, and mark them announced.
+
+        The first poll of a category only sets the baseline: topics that were
+        already there when the bot started following it are not announced. The
+        new state is written before it is used, so if saving fails nothing is
+        marked announced and the topics are returned again by the next poll.
+        The baseline then moves past the listed topics that are announced up to
+        the first one that is not, so only IDs above it need to be remembered.
+        """
+        with self._lock:
+            state = self._load()
+            ids = sorted({int(topic["id"]) for topic in topics})
+            cursor = state.get(category)
+            if cursor is None:
+                self._save(
+                    {
+                        **state,
+                        category: {"baseline": max(ids, default=0), "announced": []},
+                    }
+                )
+                logger.info(
+                    "Following Fiirumi %s from topic %d", category, max(ids, default=0)
+                )
+                return []
+            announced = set(cursor["announced"])
+            new = sorted(
+                (
+                    topic
+                    for topic in topics
+                    if int(topic["id"]) > cursor["baseline"]
+                    and int(topic["id"]) not in announced
+                ),
+                key=lambda topic: int(topic["id"]),
+            )
+            announced.update(int(topic["id"]) for topic in new)
+            baseline = cursor["baseline"]
+            for topic_id in ids:
+                if topic_id <= baseline:
+                    continue
+                if topic_id not in announced:
+                    break
+                baseline = topic_id
+            updated = {
+                "baseline": baseline,
+                "announced": sorted(i for i in announced if i > baseline),
+            }
+            if updated != cursor:
+                self._save({**state, category: updated})
+            return new
+
+
+topic_cursor = TopicCursor(FIIRUMI_CURSOR_FILE)
@@ -0,0 +1,175 @@
+"""Applicant and role name lookup for admin commands: normalized, prefix and fuzzy matching."""
+
+import difflib
+import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .types import ApplicationRow, ElectionStructureRow
+from .utils import get_group_id
+
+# Minimum difflib similarity for a name to be suggested
+SUGGESTION_CUTOFF = 0.6
+MAX_SUGGESTIONS = 3
+
+
+def normalize_name(name: str) -> str:
+    """Casefold, drop accents (ä -> a, é -> e) and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(without_accents.casefold().split())
+
+
+def did_you_mean(suggestions: List[str]) -> str:
+    """Return a ' Did you mean: ...?' sentence for error replies, or '' without suggestions."""
+    if not suggestions:
+        return ""
+    return f" Did you mean: {' / '.join(suggestions)}?"
+
+
+class NameIndex:
+    """Active applications of one role, indexed by applicant name.
+
+    Admin commands change or remove applications, so a name only resolves when
+    it equals exactly one applicant's name after normalization. Prefixes and
+    close spellings are offered as suggestions only, and a name shared by
+    several applicants is reported as ambiguous. Group members and their name
+    sets are precomputed so 'Name1, Name2' lookups are a single dict access.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, ApplicationRow]]) -> None:
+        """Build the index from (applicant name, application) pairs."""
+        self._normalized: Dict[str, List[ApplicationRow]] = {}
+        self._display: Dict[str, str] = {}
+        self._names_by_id: Dict[int, str] = {}
+        self._groups: Dict[str, List[ApplicationRow]] = {}
+        for name, app in entries:
+            self._names_by_id[app.get("Telegram_ID")] = name
+            gid = get_group_id(app)
+            if gid:
+                self._groups.setdefault(gid, []).append(app)
+            key = normalize_name(name)
+            if not key:
+                continue
+            self._normalized.setdefault(key, []).append(app)
+            self._display.setdefault(key, name)
+        self._group_keys: Dict[FrozenSet[str], str] = {
+            frozenset(normalize_name(self.name_of(a)) for a in members): gid
+            for gid, members in self._groups.items()
+        }
+
+    def name_of(self, app: ApplicationRow) -> str:
+        """Return the applicant name the index knows for an application."""
+        return self._names_by_id.get(app.get("Telegram_ID"), "")
+
+    def match(self, name: str) -> Optional[ApplicationRow]:
+        """Return the one application whose applicant has this name, without group expansion.
+
+        None when no applicant or more than one applicant has the name.
+        """
+        apps = self._normalized.get(normalize_name(name), [])
+        return apps[0] if len(apps) == 1 else None
+
+    def ambiguous(self, name: str) -> int:
+        """Return how many applicants share the name when it is ambiguous, else 0."""
+        count = len(self._normalized.get(normalize_name(name), []))
+        return count if count > 1 else 0
+
+    def group(self, group_id: str) -> List[ApplicationRow]:
+        """Return all applications in a group (empty for no group)."""
+        return self._groups.get(group_id.strip(), [])
+
+    def group_names(self, group_id: str) -> Set[str]:
+        """Return the applicant names of a group."""
+        return {self.name_of(app) for app in self.group(group_id)}
+
+    def expand(self, app: ApplicationRow) -> List[ApplicationRow]:
+        """Return the application's whole group, or just the application."""
+        members = self.group(get_group_id(app))
+        return list(members) if members else [app]
+
+    def lookup(self, name: str) -> List[ApplicationRow]:
+        """Resolve a single name or 'Name1, Name2' to application(s), expanded to full groups."""
+        if "," in name:
+            key = frozenset(normalize_name(n) for n in name.split(",") if n.strip())
+            gid = self._group_keys.get(key)
+            return list(self._groups[gid]) if gid else []
+        app = self.match(name)
+        return self.expand(app) if app is not None else []
+
+    def suggest(self, name: str) -> List[str]:
+        """Return applicant names starting with or close to the given name, best first."""
+        key = normalize_name(name)
+        if not key:
+            return []
+        prefixed = [
+            candidate
+            for candidate in self._normalized
+            if candidate.startswith(key)
+            or any(word.startswith(key) for word in candidate.split())
+        ]
+        close = difflib.get_close_matches(
+            key, list(self._normalized), n=MAX_SUGGESTIONS, cutoff=SUGGESTION_CUTOFF
+        )
+        keys = list(dict.fromkeys(prefixed + close))[:MAX_SUGGESTIONS]
+        return [self._display[k] for k in keys]
+
+    def explain_unmatched(self, name: str) -> str:
+        """Return a sentence for error replies: why an ambiguous name failed, or suggestions."""
+        count = self.ambiguous(name)
+        if count:
+            return (
+                f" {count} applicants are named {name}; "
+                "change their applications in the sheet instead."
+            )
+        return did_you_mean(self.suggest(name))
+
+    def describe_missing(self, name: str) -> str:
+        """Return the name with an 'ambiguous' or 'did you mean' hint."""
+        count = self.ambiguous(name)
+        if count:
+            return f"{name} (ambiguous: {count} applicants have this name)"
+        suggestions = self.suggest(name)
+        if not suggestions:
+            return name
+        return f"{name} (did you mean {' / '.join(suggestions)}?)"
+
+
+class RoleNameIndex:
+    """Roles indexed by normalized Role_FI, Role_EN and Aliases names.
+
+    Built once per roles snapshot. When two roles share a name (e.g. the same
+    title in two divisions), the first one in sheet order wins, as before.
+    """
+
+    def __init__(self, roles: Iterable[ElectionStructureRow]) -> None:
+        """Build the index from Election Structure rows."""
+        self._roles: Dict[str, ElectionStructureRow] = {}
+        self._display: Dict[str, str] = {}
+        for role in roles:
+            aliases = str(role.get("Aliases") or "").split(",")
+            for name in (role.get("Role_FI"), role.get("Role_EN"), *aliases):
+                key = normalize_name(str(name or ""))
+                if key:
+                    self._roles.setdefault(key, role)
+                    self._display.setdefault(key, str(name).strip())
+
+    def find(self, name: str) -> Optional[ElectionStructureRow]:
+        """Return the role with the given name or alias, ignoring case and accents."""
+        return self._roles.get(normalize_name(name))
+
+    def suggest(self, name: str) -> List[str]:
+        """Return role names close to the given name, best first (one per role)."""
+        close = difflib.get_close_matches(
+            normalize_name(name),
+            list(self._roles),
+            n=4 * MAX_SUGGESTIONS,
+            cutoff=SUGGESTION_CUTOFF,
+        )
+        suggestions: List[str] = []
+        seen_roles: Set[str] = set()
+        for key in close:
+            role_id = self._roles[key].get("ID", "")
+            if role_id not in seen_roles:
+                seen_roles.add(role_id)
+                suggestions.append(self._display[key])
+        return suggestions[:MAX_SUGGESTIONS]
@@ -0,0 +1,151 @@
+"""Parsing and validation for bulk election structure imports."""
+
+import csv
+import io
+import re
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set, Tuple, cast
+
+from .types import ElectionStructureRow, RoleType
+
+ROLE_COLUMNS = [
+    "ID",
+    "Division_FI",
+    "Division_EN",
+    "Role_FI",
+    "Role_EN",
+    "Type",
+    "Amount",
+    "Deadline",
+]
+# Written only when an imported role has a value for them
+OPTIONAL_ROLE_COLUMNS = ["Aliases"]
+ROLE_TYPES: Tuple[RoleType, ...] = ("BOARD", "ELECTED", "NON_ELECTED", "AUDITOR")
+
+_DEADLINE_RE = re.compile(r"^(\d{1,2})\.(\d{1,2})\.$")
+
+
+def parse_roles_file(content: bytes, filename: str) -> List[Dict[str, Any]]:
+    """Parse an uploaded CSV or YAML file into raw role dicts.
+
+    CSV files must have a header row using the Election Structure column names.
+    YAML files contain a list of mappings (or a mapping with a ``roles`` list)
+    and need the optional PyYAML dependency.
+    """
+    text = content.decode("utf-8-sig")
+    if filename.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ValueError(
+                "YAML import requires PyYAML (pip install 'vaalilakanabot[yaml]')"
+            ) from e
+        data = yaml.safe_load(text)
+        if isinstance(data, dict):
+            data = data.get("roles")
+        if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+            raise ValueError("YAML must be a list of roles or a mapping with 'roles'")
+        return cast(List[Dict[str, Any]], data)
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def _cell(raw: Dict[str, Any], key: str) -> str:
+    """Return a stripped string cell; numbers from the Sheets decoder become strings."""
+    value = raw.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def _validate_deadline(deadline: str) -> bool:
+    """Check the dd.mm. deadline format used by the Election Structure sheet."""
+    match = _DEADLINE_RE.match(deadline)
+    if not match:
+        return False
+    try:
+        # Leap year so 29.02. is accepted
+        datetime(2000, int(match.group(2)), int(match.group(1)))
+    except ValueError:
+        return False
+    return True
+
+
+def _validate_role_row(raw: Dict[str, Any]) -> Tuple[ElectionStructureRow, List[str]]:
+    """Normalise one raw role and return it with its validation errors."""
+    errors: List[str] = []
+    division_fi = _cell(raw, "Division_FI")
+    role_fi = _cell(raw, "Role_FI")
+    role_type = _cell(raw, "Type").upper()
+    amount = _cell(raw, "Amount")
+    deadline = _cell(raw, "Deadline")
+    if not division_fi:
+        errors.append("Division_FI is required")
+    if not role_fi:
+        errors.append("Role_FI is required")
+    if role_type not in ROLE_TYPES:
+        errors.append(f"Type must be one of {', '.join(ROLE_TYPES)}")
+    if amount and not (amount.isdigit() and int(amount) > 0):
+        errors.append(f"Amount must be a positive integer, got '{amount}'")
+    if deadline and not _validate_deadline(deadline):
+        errors.append(f"Deadline must have the format dd.mm., got '{deadline}'")
+    role = ElectionStructureRow(
+        ID=_cell(raw, "ID"),
+        Division_FI=division_fi,
+        Division_EN=_cell(raw, "Division_EN") or division_fi,
+        Role_FI=role_fi,
+        Role_EN=_cell(raw, "Role_EN") or role_fi,
+        Type=cast(RoleType, role_type),
+        Amount=amount,
+        Deadline=deadline,
+    )
+    aliases = _cell(raw, "Aliases")
+    if aliases:
+        role["Aliases"] = aliases
+    return role, errors
+
+
+def validate_roles(
+    raw_roles: List[Dict[str, Any]],
+    existing_roles: Iterable[ElectionStructureRow],
+) -> Tuple[List[ElectionStructureRow], List[str]]:
+    """Validate every raw role and assign IDs to rows without one.
+
+    Returns (roles, errors). Errors reference the data row number (1-based, header
+    excluded) and cover duplicates within the file and against existing roles.
+    """
+    existing = list(existing_roles)
+    seen_ids: Set[str] = {str(r.get("ID", "")) for r in existing if r.get("ID")}
+    seen_names: Set[Tuple[str, str]] = {
+        (str(r.get("Division_FI", "")), str(r.get("Role_FI", ""))) for r in existing
+    }
+    roles: List[ElectionStructureRow] = []
+    errors: List[str] = []
+    for row_number, raw in enumerate(raw_roles, start=1):
+        if not any(_cell(raw, key) for key in ROLE_COLUMNS):
+            continue
+        role, row_errors = _validate_role_row(raw)
+        name_key = (role["Division_FI"], role["Role_FI"])
+        if role["Role_FI"] and name_key in seen_names:
+            row_errors.append(
+                f"duplicate role {role['Role_FI']} in {role['Division_FI']}"
+            )
+        if role["ID"] and role["ID"] in seen_ids:
+            row_errors.append(f"duplicate ID {role['ID']}")
+        if row_errors:
+            errors.extend(f"Row {row_number}: {e}" for e in row_errors)
+            continue
+        if not role["ID"]:
+            role["ID"] = str(uuid.uuid4())
+        seen_ids.add(role["ID"])
+        seen_names.add(name_key)
+        roles.append(role)
+    return roles, errors
+
+
+def role_columns(roles: Iterable[ElectionStructureRow]) -> List[str]:
+    """Return the Election Structure columns to write for the given roles."""
+    roles = list(roles)
+    return ROLE_COLUMNS + [
+        column
+        for column in OPTIONAL_ROLE_COLUMNS
+        if any(cast(Dict[str, Any], role).get(column) for role in roles)
+    ]
@@ -0,0 +1,239 @@
+"""Detect application changes made directly in the sheet and notify the applicants."""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from telegram.ext import ContextTypes
+
+from .digest import DigestSection, queue_digest
+from .executors import sheets_executor
+from .sheets_data_manager import DataManager
+from .types import (
+    ApplicationChange,
+    ApplicationChangeKind,
+    ApplicationRow,
+    ElectionStructureRow,
+)
+from .utils import get_notification_text, get_role_name
+
+logger = logging.getLogger("vaalilakanabot")
+
+# (Role_ID, Telegram_ID, Timestamp): a re-application after a removal is a new row
+RowKey = Tuple[str, str, str]
+# Fields whose changes become events, and the event kind for each new Status
+TRACKED_FIELDS = ("Status", "Group_ID", "Fiirumi_Post")
+STATUS_KINDS: Dict[str, ApplicationChangeKind] = {
+    "APPROVED": "approved",
+    "DENIED": "rejected",
+    "REMOVED": "removed",
+    "ELECTED": "elected",
+}
+FIELD_KINDS: Dict[str, ApplicationChangeKind] = {
+    "Group_ID": "group",
+    "Fiirumi_Post": "fiirumi",
+}
+NOTIFIED_KINDS = ("approved", "rejected", "removed", "elected")
+# Statuses shown on the public election sheet; leaving them is a withdrawal
+LISTED_STATUSES = ("APPROVED", "ELECTED")
+
+
+def _row_key(app: ApplicationRow) -> RowKey:
+    return (
+        str(app.get("Role_ID", "")),
+        str(app.get("Telegram_ID", "")),
+        str(app.get("Timestamp", "")),
+    )
+
+
+def _tracked_values(app: ApplicationRow) -> Tuple[str, ...]:
+    return tuple(str(app.get(field) or "") for field in TRACKED_FIELDS)
+
+
+def _event(
+    kind: ApplicationChangeKind,
+    app: ApplicationRow,
+    old: str,
+    new: str,
+    by_bot: bool = False,
+) -> Optional[ApplicationChange]:
+    try:
+        telegram_id = int(app.get("Telegram_ID"))
+    except (TypeError, ValueError):
+        return None
+    return ApplicationChange(
+        Kind=kind,
+        Role_ID=str(app.get("Role_ID", "")),
+        Telegram_ID=telegram_id,
+        Old=old,
+        New=new,
+        Language=app.get("Language") or "en",
+        By_Bot=by_bot,
+    )
+
+
+class SheetDiff:  # pylint: disable=too-few-public-methods
+    """Compares consecutive Applications snapshots row by row.
+
+    Each row is keyed by (Role_ID, Telegram_ID, Timestamp), so several
+    applications of one user to one role are compared separately, and stored
+    with a hash of its tracked fields; only rows whose hash differs are compared
+    field by field. Rows that share the whole key (copied rows) are logged and
+    only the first one is tracked.
+    When the snapshot is the same list object as last time (the read cache was
+    not refreshed) nothing is compared at all.
+    """
+
+    def __init__(self) -> None:
+        self._source: Optional[List[ApplicationRow]] = None
+        self._rows: Optional[Dict[RowKey, Tuple[int, ApplicationRow]]] = None
+        self._duplicates = 0
+
+    def diff(
+        self,
+        applications: List[ApplicationRow],
+        is_bot_update: Callable[[str, Any, str, str], bool],
+    ) -> List[ApplicationChange]:
+        """Return the changes since the previous snapshot (none for the first one).
+
+        is_bot_update(role_id, telegram_id, field, value) tells whether the bot
+        wrote a value itself; those changes were already notified and are marked
+        with By_Bot.
+        """
+        if applications is self._source:
+            return []
+        rows: Dict[RowKey, Tuple[int, ApplicationRow]] = {}
+        duplicates = 0
+        for app in applications:
+            key = _row_key(app)
+            if key in rows:
+                duplicates += 1
+                continue
+            rows[key] = (hash(_tracked_values(app)), app)
+        if duplicates != self._duplicates:
+            self._duplicates = duplicates
+            logger.warning(
+                "%d Applications rows duplicate another row's Role_ID, Telegram_ID "
+                "and Timestamp; only the first of each is checked for changes",
+                duplicates,
+            )
+        previous, self._rows, self._source = self._rows, rows, applications
+        if previous is None:
+            return []
+
+        events: List[Optional[ApplicationChange]] = []
+        for key, (row_hash, app) in rows.items():
+            old = previous.get(key)
+            if old is None:
+                events.append(_event("added", app, "", app.get("Status") or ""))
+            elif old[0] != row_hash:
+                events.extend(self._field_events(old[1], app, is_bot_update))
+        for key in previous.keys() - rows.keys():
+            app = previous[key][1]
+            events.append(_event("deleted", app, app.get("Status") or "", ""))
+        return [event for event in events if event is not None]
+
+    @staticmethod
+    def _field_events(
+        old: ApplicationRow,
+        new: ApplicationRow,
+        is_bot_update: Callable[[str, Any, str, str], bool],
+    ) -> List[Optional[ApplicationChange]]:
+        events: List[Optional[ApplicationChange]] = []
+        for field, old_value, new_value in zip(
+            TRACKED_FIELDS, _tracked_values(old), _tracked_values(new)
+        ):
+            if old_value == new_value:
+                continue
+            by_bot = is_bot_update(
+                new.get("Role_ID"), new.get("Telegram_ID"), field, new_value
+            )
+            if field == "Status":
+                kind = STATUS_KINDS.get(new_value, "status")
+            else:
+                kind = FIELD_KINDS[field]
+            events.append(_event(kind, new, old_value, new_value, by_bot))
+        return events
+
+
+_sheet_diff = SheetDiff()
+
+
+def _digest_change(
+    event: ApplicationChange, role: ElectionStructureRow, data_manager: DataManager
+) -> None:
+    """Buffer new candidates, withdrawals and results for digest channels.
+
+    Approvals made through the bot were already announced with a digest item.
+    """
+    kind = event["Kind"]
+    if kind == "elected":
+        section: DigestSection = "result"
+    elif kind == "approved" and not event["By_Bot"]:
+        section = "candidate"
+    elif kind in ("removed", "deleted") and event["Old"] in LISTED_STATUSES:
+        section = "withdrawal"
+    else:
+        return
+    user = data_manager.get_user_by_telegram_id(event["Telegram_ID"])
+    name = user.get("Name") if user else None
+    queue_digest(
+        (
+            section,
+            f"{get_role_name(role, True)} / {get_role_name(role, False)}: "
+            f"<i>{name or '?'}</i>",
+        ),
+        data_manager,
+    )
+
+
+async def notify_sheet_changes(
+    context: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
+) -> None:
+    """Notify applicants about status changes admins made directly in the sheet.
+
+    All changes for one user since the last run go out as a single message.
+    New candidates, withdrawals and results are also buffered for digest channels.
+    """
+    try:
+        sheets_manager = data_manager.sheets_manager
+        applications = await sheets_executor.run(
+            sheets_manager.get_all_applications_from_sheets
+        )
+        events = _sheet_diff.diff(applications, sheets_manager.pop_bot_update)
+    except Exception as e:
+        logger.error("Error diffing the Applications sheet: %s", e)
+        return
+
+    by_user: Dict[int, List[str]] = {}
+    for event in events:
+        logger.info(
+            "Sheet change: %s %s -> %s (role %s, user %s)",
+            event["Kind"],
+            event["Old"],
+            event["New"],
+            event["Role_ID"],
+            event["Telegram_ID"],
+        )
+        role = data_manager.get_role_by_id(event["Role_ID"])
+        if role is None:
+            continue
+        _digest_change(event, role, data_manager)
+        if event["By_Bot"] or event["Kind"] not in NOTIFIED_KINDS:
+            continue
+        is_finnish = event["Language"] == "fi"
+        by_user.setdefault(event["Telegram_ID"], []).append(
+            get_notification_text(
+                event["Kind"],  # type: ignore[arg-type]
+                get_role_name(role, is_finnish),
+                is_finnish,
+            )
+        )
+    for telegram_id, texts in by_user.items():
+        try:
+            await context.bot.send_message(
+                chat_id=telegram_id, text="\n\n".join(texts), parse_mode="HTML"
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to notify user %s about sheet changes: %s", telegram_id, e
+            )
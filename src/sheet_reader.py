@@ -0,0 +1,56 @@
+"""Worksheet readers and the record decoder shared by every read backend."""
+
+import csv
+import io
+from typing import Any, Dict, List
+
+from gspread.utils import numericise_all, to_records
+
+CSV_EXPORT_URL = "https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export"
+CSV_EXPORT_TIMEOUT = 30
+
+
+def records_from_values(values: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Decode a header row plus data rows into records like gspread's get_all_records.
+
+    Rows are padded to the header width and numeric strings are converted, so
+    the API and CSV export backends produce identical records.
+    """
+    if not values or not values[0]:
+        return []
+    headers = values[0]
+    width = len(headers)
+    rows = [
+        numericise_all(list(row[:width]) + [""] * (width - len(row)))
+        for row in values[1:]
+    ]
+    return to_records(headers, rows)
+
+
+def read_csv_export(session: Any, spreadsheet_id: str, gid: int) -> List[List[str]]:
+    """Stream one worksheet through the spreadsheet CSV export endpoint.
+
+    ``session`` must be an authorized requests session (e.g. gspread's), since the
+    export endpoint does not count against the Sheets API read quota but still
+    requires access to the document. Trailing empty rows are dropped to match
+    the values API.
+    """
+    url = CSV_EXPORT_URL.format(spreadsheet_id=spreadsheet_id)
+    with session.get(
+        url,
+        params={"format": "csv", "gid": gid},
+        stream=True,
+        timeout=CSV_EXPORT_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        if "text/csv" not in content_type:
+            # Missing permissions redirect to an HTML sign-in page instead of failing
+            raise ValueError(f"Unexpected CSV export content type: {content_type!r}")
+        response.raw.decode_content = True
+        stream = io.TextIOWrapper(response.raw, encoding="utf-8", newline="")
+        rows = list(csv.reader(stream))
+
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return rows
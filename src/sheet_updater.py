@@ -1,15 +1,18 @@
 """Update the election sheet in Fiirumi."""
 
-import asyncio
+import hashlib
 import logging
+import time
 from typing import List, Optional, Tuple
-import requests
+import httpx
 from telegram.ext import ContextTypes
 
 from .sheets_data_manager import DataManager
 from .types import DivisionData, RoleData
-from .config import ELECTION_YEAR, get_vaalilakana_post_url
-from .fiirumi_area_generator import get_discourse_headers
+from .circuit_breaker import discourse_breaker
+from .executors import sheets_executor
+from .config import ELECTION_YEAR, SHEET_RECHECK_INTERVAL, get_vaalilakana_post_url
+from .discourse_client import discourse
 
 YEAR = int(ELECTION_YEAR)
 SHEET_HEADING = f"# VAALILAKANA {YEAR} / ELECTION SHEET {YEAR}"
@@ -23,11 +26,7 @@ async def get_current_post_content() -> Optional[str]:
     if not url:
         return None
     try:
-        response = await asyncio.to_thread(
-            requests.get, url, headers=get_discourse_headers(), timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = await discourse.get_post(url)
         return str(data.get("raw", ""))
     except Exception as e:
         logger.error("Error fetching current post content: %s", e)
@@ -100,28 +99,88 @@ def data_to_markdown(data: List[DivisionData]) -> str:
     return text
 
 
+def content_hash(text: str) -> str:
+    """Return a stable hash of post markdown.
+
+    Line endings and surrounding whitespace are ignored, as Discourse may
+    normalize them when it stores a post.
+    """
+    normalized = text.replace("\r\n", "\n").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class SheetPostSync:  # pylint: disable=too-few-public-methods
+    """What the election sheet post held after the last successful sync.
+
+    ``post_hash`` covers the whole post (preamble and sheet) as last written or
+    read, and ``sheet_hash`` the rendered sheet it was built from. While the
+    rendered sheet hashes the same, the post is not read again until
+    SHEET_RECHECK_INTERVAL has passed; when it is read, a post that still hashes
+    to ``post_hash`` has not been edited since, and a post that already equals
+    the new content is not written again.
+    """
+
+    def __init__(self) -> None:
+        self.post_url: Optional[str] = None
+        self.sheet_hash: Optional[str] = None
+        self.post_hash: Optional[str] = None
+        self.checked_at = 0.0
+
+    def is_current(self, post_url: str, sheet_hash: str, now: float) -> bool:
+        """Return True if the post is known to hold this sheet and needs no re-read."""
+        return (
+            post_url == self.post_url
+            and sheet_hash == self.sheet_hash
+            and now - self.checked_at < SHEET_RECHECK_INTERVAL
+        )
+
+    def record(
+        self, post_url: str, sheet_hash: str, post_hash: str, now: float
+    ) -> None:
+        """Remember a synced post."""
+        self.post_url = post_url
+        self.sheet_hash = sheet_hash
+        self.post_hash = post_hash
+        self.checked_at = now
+
+
+_sync = SheetPostSync()
+
+
 async def update_election_sheet(
     _: ContextTypes.DEFAULT_TYPE, data_manager: DataManager
-) -> Optional[requests.Response]:
+) -> Optional[httpx.Response]:
     """Update the election sheet in the Guild website.
 
     Preserves any preamble text that appears before the sheet heading in the post.
-    Does nothing if VAALILAKANA_POST_URL is not set.
+    Does nothing if VAALILAKANA_POST_URL is not set. Only reads the post when the
+    sheet changed or SHEET_RECHECK_INTERVAL has passed, and only writes it when
+    the content differs.
     """
     post_url = get_vaalilakana_post_url()
     if not post_url:
         logger.debug("Skipping election sheet update: VAALILAKANA_POST_URL not set")
         return None
+    if not discourse_breaker.allow():
+        logger.debug("Skipping election sheet update: Fiirumi circuit open")
+        return None
 
     # Get full data from Google Sheets (includes non-elected roles)
     try:
-        vaalilakana_data = data_manager.vaalilakana_full
+        vaalilakana_data = await sheets_executor.run(
+            lambda: data_manager.vaalilakana_full
+        )
     except Exception as e:
         logger.error("Error getting data from Google Sheets: %s", e)
         return None
 
     # Convert data to markdown
     sheet_content = data_to_markdown(vaalilakana_data)
+    sheet_hash = content_hash(sheet_content)
+    now = time.monotonic()
+    if _sync.is_current(post_url, sheet_hash, now):
+        logger.debug("Election sheet unchanged, skipping update")
+        return None
 
     # Fetch current post to check for preamble
     current_content = await get_current_post_content()
@@ -132,9 +191,13 @@ async def update_election_sheet(
         )
         return None
 
+    current_hash = content_hash(current_content)
+    if _sync.post_url == post_url and current_hash != _sync.post_hash:
+        logger.info("Election sheet post was edited on Fiirumi since the last sync")
+
     preamble, has_heading = extract_preamble_and_content(current_content)
     if has_heading and preamble:
-        logger.info("Found preamble, preserving it (%d chars)", len(preamble))
+        logger.debug("Found preamble, preserving it (%d chars)", len(preamble))
 
     # Build final content: preamble (if any) followed by the sheet
     if has_heading and preamble:
@@ -142,19 +205,15 @@ async def update_election_sheet(
     else:
         final_text = sheet_content
 
-    payload = {
-        "raw": final_text,
-    }
+    final_hash = content_hash(final_text)
+    if final_hash == current_hash:
+        logger.debug("Election sheet post already up to date")
+        _sync.record(post_url, sheet_hash, final_hash, now)
+        return None
 
     try:
-        response = await asyncio.to_thread(
-            requests.put,
-            post_url,
-            headers=get_discourse_headers(),
-            json=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
+        response = await discourse.update_post(post_url, final_text)
+        _sync.record(post_url, sheet_hash, final_hash, now)
         logger.info("Successfully updated election sheet")
         return response
     except Exception as e:
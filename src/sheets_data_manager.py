@@ -1,11 +1,29 @@
 """Data management using Google Sheets as the primary data source."""
 
 import logging
+import threading
 import uuid
-from typing import Dict, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from datetime import datetime
 
-from .sheets_manager import SheetsManager
+from .circuit_breaker import sheets_breaker
+from .config import ELECTION_YEAR, PAST_ELECTION_SHEETS
+from .deadlines import DeadlineCalendar
+from .name_index import NameIndex, did_you_mean
+from .sheets_manager import DATA_SHEETS, SheetsManager
+from .role_import import validate_roles
+from .stats import ElectionStats
 from .utils import get_role_name, get_group_id, get_user_name, is_active_application
 from .types import (
     ElectionStructureRow,
@@ -19,22 +37,55 @@ from .types import (
     ResultTuple,
 )
 
-
 logger = logging.getLogger("vaalilakanabot")
+T = TypeVar("T")
 
 # Keys added when enriching ApplicationRow -> ApplicationWithDisplay (from Users sheet).
 # Excluded when spreading app to avoid duplicate keyword arguments if sheet data contains them.
 _DISPLAY_KEYS = frozenset({"Name", "Email", "Telegram"})
 
 
-class DataManager:
+class DataManager:  # pylint: disable=too-many-instance-attributes
     """Manages all data operations using Google Sheets as the backend."""
 
     def __init__(
-        self, sheet_url: Optional[str] = None, credentials_file: Optional[str] = None
+        self,
+        sheet_url: Optional[str] = None,
+        credentials_file: Optional[str] = None,
+        read_only: bool = False,
+        users_from: Optional["DataManager"] = None,
     ) -> None:
-        """Initialize with Google Sheets connection."""
-        self.sheets_manager: SheetsManager = SheetsManager(sheet_url, credentials_file)
+        """Initialize with Google Sheets connection.
+
+        Past election years use read_only managers that take users from the
+        current year's manager (users_from).
+        """
+        self.sheets_manager: SheetsManager = SheetsManager(
+            sheet_url,
+            credentials_file,
+            read_only=read_only,
+            users_manager=users_from.sheets_manager if users_from else None,
+        )
+        # Past election years: year -> spreadsheet URL; managers are opened on first use
+        self._past_sheets: Dict[str, str] = {} if read_only else PAST_ELECTION_SHEETS
+        self._past_years: Dict[str, DataManager] = {}
+        self._past_years_lock = threading.Lock()
+        # Materialized views: name -> (generations of the sheets read, value). Values
+        # are shared between callers and must not be mutated.
+        self._views: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
+        # Election tree state kept between builds: the generations it was built
+        # from, Role_ID -> active applications, the roles each applicant's
+        # Telegram_ID appears in, and Role_ID -> (role row, node). Only roles
+        # whose row, applications or applicant users changed are rebuilt.
+        self._tree_lock = threading.Lock()
+        self._tree_generation: Optional[Tuple[int, ...]] = None
+        self._role_applications: Dict[str, List[ApplicationRow]] = {}
+        self._roles_by_applicant: Dict[Any, Set[str]] = {}
+        self._role_nodes: Dict[str, Tuple[ElectionStructureRow, RoleData]] = {}
+        # ((deadline calendar, passed deadlines), (division, is_finnish) -> keyboard)
+        self._position_keyboards: Tuple[
+            Any, Dict[Tuple[str, bool], Tuple[List[str], List[str]]]
+        ] = (None, {})
 
         # Initialize empty structure if needed
         try:
@@ -46,6 +97,34 @@ class DataManager:
                 "Google Sheets not accessible, will use empty structure: %s", e
             )
 
+    def election_years(self) -> List[str]:
+        """Return the current and past election years, newest first."""
+        return sorted({ELECTION_YEAR, *self._past_sheets}, reverse=True)
+
+    def for_year(self, year: str) -> Optional["DataManager"]:
+        """Return the data manager of an election year, or None if it is not configured.
+
+        A past year's spreadsheet is opened (blocking) on the first call and
+        kept with its own caches; the current year is this manager.
+        """
+        if year == ELECTION_YEAR:
+            return self
+        sheet_url = self._past_sheets.get(year)
+        if sheet_url is None:
+            return None
+        with self._past_years_lock:
+            manager = self._past_years.get(year)
+            if manager is None:
+                logger.info("Opening election sheet of %s", year)
+                manager = DataManager(
+                    sheet_url,
+                    self.sheets_manager.credentials_file,
+                    read_only=True,
+                    users_from=self,
+                )
+                self._past_years[year] = manager
+            return manager
+
     def get_all_roles(self) -> List[ElectionStructureRow]:
         """Get all roles from Google Sheets with caching."""
         return self.sheets_manager.get_all_roles()  # type: ignore[no-any-return]
@@ -54,13 +133,74 @@ class DataManager:
         """Find a role by name using SheetsManager's cached lookup."""
         return self.sheets_manager.find_role_by_name(role_name)
 
+    def suggest_role_names(self, role_name: str) -> List[str]:
+        """Return role names close to a position name that did not match."""
+        return self.sheets_manager.suggest_role_names(role_name)
+
     def get_role_by_id(self, role_id: str) -> Optional[ElectionStructureRow]:
         """Get a role by ID using SheetsManager's cached lookup."""
         return self.sheets_manager.get_role_by_id(role_id)
 
+    def import_roles(self, raw_roles: List[Dict[str, Any]]) -> Tuple[int, List[str]]:
+        """Validate raw roles and append them to the Election Structure in one request.
+
+        IDs are assigned up front, so the refresh path has nothing to backfill.
+        Nothing is written if any row fails validation.
+
+        Returns:
+            (imported_count, errors)
+        """
+        roles, errors = validate_roles(raw_roles, self.get_all_roles())
+        if errors:
+            return 0, errors
+        if not roles:
+            return 0, ["No roles found."]
+        self.sheets_manager.append_roles(roles)
+        self.sheets_manager.invalidate_caches()
+        logger.info("Imported %d roles to the Election Structure sheet", len(roles))
+        return len(roles), []
+
+    def read_roles_for_clone(self, sheet_url: str) -> List[Dict[str, Any]]:
+        """Read another spreadsheet's roles without IDs so the new year gets fresh ones."""
+        return [
+            {k: v for k, v in row.items() if k != "ID"}
+            for row in self.sheets_manager.read_roles_from_spreadsheet(sheet_url)
+        ]
+
+    def _view(
+        self, name: str, build: Callable[[], T], sheets: Sequence[str] = DATA_SHEETS
+    ) -> T:
+        """Return a materialized view, rebuilding it only when a sheet it reads changed.
+
+        ``sheets`` names the sheets (roles, applications, users) the view is
+        built from; only those are refreshed and compared.
+        """
+        # Read the generation before building: a change during the build then
+        # leaves the view outdated and it is rebuilt on the next access.
+        generation = self.sheets_manager.data_generation(sheets)
+        cached_view = self._views.get(name)
+        if cached_view is not None and cached_view[0] == generation:
+            return cast(T, cached_view[1])
+        value = build()
+        self._views[name] = (generation, value)
+        return value
+
+    def _roles_by_division(self) -> Dict[str, List[ElectionStructureRow]]:
+        """Roles grouped by Division_FI, in sheet order (materialized view)."""
+
+        def build() -> Dict[str, List[ElectionStructureRow]]:
+            by_division: Dict[str, List[ElectionStructureRow]] = {}
+            for role in self.get_all_roles():
+                by_division.setdefault(role.get("Division_FI"), []).append(role)
+            return by_division
+
+        return self._view("roles_by_division", build, ("roles",))
+
     def get_divisions(self, is_finnish: bool = False) -> Tuple[List[str], List[str]]:
         """Get divisions with localization."""
-        divisions: List[DivisionDict] = self.sheets_manager.get_divisions()
+        divisions: List[DivisionDict] = self._view(
+            "divisions", self.sheets_manager.get_divisions, ("roles",)
+        )
         localized_divisions: List[str] = [
             division.get("Division_FI") if is_finnish else division.get("Division_EN")
             for division in divisions
@@ -70,33 +210,49 @@ class DataManager:
         ]
         return localized_divisions, callback_data
 
+    def deadline_calendar(self, now: Optional[datetime] = None) -> DeadlineCalendar:
+        """Role closing times for the current roles snapshot and year (materialized view)."""
+        year = (now or datetime.now()).year
+        return self._view(
+            f"deadlines_{year}",
+            lambda: DeadlineCalendar(self.get_all_roles(), year),
+            ("roles",),
+        )
+
     def get_positions(
         self, division: str, is_finnish: bool = False
     ) -> Tuple[List[str], List[str]]:
-        """Get positions for a division with deadline filtering."""
-        current_date = datetime.now()
-        # Use cached roles and filter by division to avoid extra Sheets calls
-        roles = [
-            role for role in self.get_all_roles() if role.get("Division_FI") == division
-        ]
-        filtered_roles: List[ElectionStructureRow] = []
-
-        for role in roles:
-            # Check if there's a deadline and if it has passed
-            deadline_str = role.get("Deadline", "")
-            if deadline_str:
-                try:
-                    # Parse date in dd.mm format and assume current year
-                    day, month = deadline_str.rstrip(".").split(".")
-                    deadline = datetime(current_date.year, int(month), int(day))
+        """Get positions for a division with deadline filtering.
 
-                    if current_date.date() > deadline.date():
-                        continue  # Skip this position if deadline has passed
-                except (ValueError, AttributeError):
-                    # If date parsing fails, include the position (assume no deadline)
-                    pass
+        Keyboards are built once per roles snapshot and number of passed
+        deadlines, so a role drops out as soon as its deadline passes.
+        """
+        now = datetime.now()
+        calendar = self.deadline_calendar(now)
+        key = (calendar, calendar.closed_count(now))
+        if self._position_keyboards[0] != key:
+            self._position_keyboards = (key, {})
+        keyboards = self._position_keyboards[1]
+        keyboard = keyboards.get((division, is_finnish))
+        if keyboard is None:
+            keyboard = self._build_position_keyboard(
+                division, is_finnish, calendar, now
+            )
+            keyboards[(division, is_finnish)] = keyboard
+        return keyboard
 
-            filtered_roles.append(role)
+    def _build_position_keyboard(
+        self,
+        division: str,
+        is_finnish: bool,
+        calendar: DeadlineCalendar,
+        now: datetime,
+    ) -> Tuple[List[str], List[str]]:
+        """Build (localized names, Role_IDs) of a division's roles that are still open."""
+        roles = self._roles_by_division().get(division, [])
+        filtered_roles = [
+            role for role in roles if calendar.is_open(role.get("ID", ""), now)
+        ]
 
         localized_positions = []
         for role in filtered_roles:
@@ -231,56 +387,38 @@ class DataManager:
             role_apps = self._get_applications_for_role(role_id)
         return [app for app in role_apps if get_group_id(app) == normalized_group_id]
 
+    def _name_indexes(self) -> Dict[str, NameIndex]:
+        """Applicant name index per Role_ID over active applications (materialized view)."""
+
+        def build() -> Dict[str, NameIndex]:
+            users_by_id = self._build_users_by_id()
+            entries: Dict[str, List[Tuple[str, ApplicationRow]]] = {}
+            for app in self.get_all_applications():
+                if is_active_application(app):
+                    name = get_user_name(users_by_id.get(app.get("Telegram_ID")), "")
+                    entries.setdefault(app.get("Role_ID"), []).append((name, app))
+            return {role_id: NameIndex(items) for role_id, items in entries.items()}
+
+        return self._view("name_indexes", build, ("applications", "users"))
+
+    def _name_index(self, role: ElectionStructureRow) -> NameIndex:
+        """Return the applicant name index for one role."""
+        return self._name_indexes().get(role.get("ID", "")) or NameIndex([])
+
     def _resolve_applications_by_name(
-        self,
-        role: ElectionStructureRow,
-        name: str,
-        users_by_id: Optional[Dict[int, UserRow]] = None,
-        role_apps: Optional[List[ApplicationRow]] = None,
+        self, role: ElectionStructureRow, name: str
     ) -> List[ApplicationRow]:
         """Resolve name (single or 'Name1, Name2') to application(s) for a role.
 
-        For single names: finds the application whose user Name matches.
-        For comma-separated names: finds the group whose member names match exactly.
-        Always expands to full group if the matched app is in a group.
+        Names match case- and accent-insensitively but otherwise exactly, and
+        must belong to one applicant only. Comma-separated names must be
+        exactly one group's members. Always expands to the full group.
         """
-        role_id = role.get("ID", "")
-        if role_apps is None:
-            role_apps = self._get_applications_for_role(role_id)
-        if users_by_id is None:
-            users_by_id = self._build_users_by_id()
+        return self._name_index(role).lookup(name)
 
-        # Comma-separated → group lookup
-        if ", " in name:
-            target_names = frozenset(n.strip() for n in name.split(","))
-            seen_groups: set[str] = set()
-            for app in role_apps:
-                gid = get_group_id(app)
-                if not gid or gid in seen_groups:
-                    continue
-                seen_groups.add(gid)
-                group_apps = self._get_applications_for_group(
-                    role_id, gid, role_apps=role_apps
-                )
-                group_names = frozenset(
-                    get_user_name(users_by_id.get(a.get("Telegram_ID")), "")
-                    for a in group_apps
-                )
-                if group_names == target_names:
-                    return group_apps
-            return []
-
-        # Single name → find matching app, expand to group if applicable
-        for app in role_apps:
-            user = users_by_id.get(app.get("Telegram_ID"))
-            if user is not None and user.get("Name") == name:
-                gid = get_group_id(app)
-                if gid:
-                    return self._get_applications_for_group(
-                        role_id, gid, role_apps=role_apps
-                    )
-                return [app]
-        return []
+    def explain_unmatched_applicant(self, role: ElectionStructureRow, name: str) -> str:
+        """Return why an applicant name did not resolve (ambiguous) or close matches."""
+        return self._name_index(role).explain_unmatched(name)
 
     def add_applicant(
         self,
@@ -331,33 +469,23 @@ class DataManager:
     def _validate_group_completeness(
         self,
         apps: List[ApplicationRow],
-        names_set: set[str],
-        role_id: str,
-        users_by_id: Optional[Dict[int, UserRow]] = None,
+        named_ids: set[int],
+        index: NameIndex,
     ) -> Optional[str]:
         """Validate that all group members are included when electing groups.
 
-        Returns error message if validation fails, None if OK.
+        named_ids are the Telegram IDs the command's names matched directly,
+        before group expansion. Returns error message if validation fails, None if OK.
         """
-        if users_by_id is None:
-            users_by_id = self._build_users_by_id()
-
-        role_apps = self._get_applications_for_role(role_id)
-        for app in apps:
-            group_id = get_group_id(app)
-            if not group_id:
-                continue
-
-            # Get all applications in this group
-            group_apps = self._get_applications_for_group(role_id, group_id, role_apps)
-            group_names = {
-                get_user_name(users_by_id.get(a.get("Telegram_ID")), "")
+        for group_id in {get_group_id(app) for app in apps} - {""}:
+            group_apps = index.group(group_id)
+            missing = {
+                index.name_of(a)
                 for a in group_apps
+                if a.get("Telegram_ID") not in named_ids
             }
-
-            # Check if all group members are in the command
-            if not group_names.issubset(names_set):
-                missing = group_names - names_set
+            if missing:
+                group_names = index.group_names(group_id)
                 return (
                     f"Group application: list all members: {', '.join(sorted(group_names))}. "
                     f"Missing in command: {', '.join(sorted(missing))}."
@@ -366,30 +494,30 @@ class DataManager:
         return None
 
     def _resolve_names_to_apps(
-        self, role: ElectionStructureRow, names: List[str]
-    ) -> Tuple[List[ApplicationRow], List[str], Dict[int, UserRow]]:
-        """Resolve a list of display names to applications for a role.
+        self, names: List[str], index: NameIndex
+    ) -> Tuple[List[ApplicationRow], List[str], set[int]]:
+        """Resolve a list of applicant names to applications for one role.
 
-        Returns (resolved_apps, missing_names, users_by_id).
+        Returns (resolved_apps, missing_names, named_ids): resolved apps are
+        expanded to full groups, missing names carry 'did you mean' hints and
+        named_ids are the Telegram IDs matched directly by the names.
         """
-        users_by_id = self._build_users_by_id()
-        role_apps = self._get_applications_for_role(role.get("ID", ""))
         apps: List[ApplicationRow] = []
         missing: List[str] = []
+        named_ids: set[int] = set()
         seen_ids: set[int] = set()
         for name in names:
-            resolved = self._resolve_applications_by_name(
-                role, name, users_by_id, role_apps
-            )
-            if resolved:
-                for app in resolved:
-                    tid = app.get("Telegram_ID")
-                    if tid not in seen_ids:
-                        seen_ids.add(tid)
-                        apps.append(app)
-            else:
-                missing.append(name)
-        return apps, missing, users_by_id
+            matched = index.match(name)
+            if matched is None:
+                missing.append(index.describe_missing(name))
+                continue
+            named_ids.add(matched.get("Telegram_ID"))
+            for app in index.expand(matched):
+                tid = app.get("Telegram_ID")
+                if tid not in seen_ids:
+                    seen_ids.add(tid)
+                    apps.append(app)
+        return apps, missing, named_ids
 
     def set_applicants_elected(
         self, role: ElectionStructureRow, names: List[str]
@@ -403,15 +531,13 @@ class DataManager:
             return False, "At least one name is required."
 
         role_id = role.get("ID")
-        apps, missing, users_by_id = self._resolve_names_to_apps(role, names)
+        index = self._name_index(role)
+        apps, missing, named_ids = self._resolve_names_to_apps(names, index)
         if missing:
             return False, f"Could not find applicant(s): {', '.join(missing)}"
 
         # Validate group completeness
-        names_set = set(names)
-        error_msg = self._validate_group_completeness(
-            apps, names_set, role_id, users_by_id
-        )
+        error_msg = self._validate_group_completeness(apps, named_ids, index)
         if error_msg:
             return False, error_msg
 
@@ -424,6 +550,61 @@ class DataManager:
         role_name = role.get("Role_EN") or role.get("Role_FI") or role_id
         return True, f"Elected: {', '.join(names)} for {role_name}"
 
+    def set_results_elected(
+        self, results: List[Tuple[str, List[str]]]
+    ) -> Tuple[int, List[str], bool]:
+        """Mark many (position, names) results as elected in one go.
+
+        Every row is resolved against one snapshot of applications and users and
+        validated like /elected (all group members listed). If any row fails,
+        nothing is applied; otherwise all ELECTED statuses go out in one flush.
+
+        Returns:
+            (elected_count, errors, flushed). When the flush fails the statuses
+            stay queued and the queue job retries them.
+        """
+        indexes = self._name_indexes()
+        to_elect: Dict[Tuple[str, int], ApplicationRow] = {}
+        errors: List[str] = []
+        for row_number, (position, names) in enumerate(results, start=1):
+            role = self.find_role_by_name(position)
+            if role is None:
+                errors.append(
+                    f"Row {row_number}: unknown position {position}"
+                    + did_you_mean(self.suggest_role_names(position))
+                )
+                continue
+            if not names:
+                errors.append(f"Row {row_number}: no names for {position}")
+                continue
+            role_id = role.get("ID", "")
+            index = indexes.get(role_id) or NameIndex([])
+            apps, missing, named_ids = self._resolve_names_to_apps(names, index)
+            if missing:
+                errors.append(
+                    f"Row {row_number}: could not find applicant(s) for {position}: "
+                    f"{', '.join(missing)}"
+                )
+                continue
+            error_msg = self._validate_group_completeness(apps, named_ids, index)
+            if error_msg:
+                errors.append(f"Row {row_number}: {error_msg}")
+                continue
+            for app in apps:
+                to_elect[(role_id, app.get("Telegram_ID"))] = app
+
+        if errors:
+            return 0, errors, False
+        for role_id, telegram_id in to_elect:
+            self.sheets_manager.update_application_status(
+                role_id, telegram_id, status="ELECTED"
+            )
+        self.flush_all_queues()
+        flushed = not self.sheets_manager.status_update_queue
+        if not flushed:
+            logger.warning("Results flush failed; statuses stay queued for retry")
+        return len(to_elect), [], flushed
+
     def combine_applicants(
         self, role: ElectionStructureRow, names: List[str]
     ) -> ResultTuple:
@@ -436,7 +617,7 @@ class DataManager:
             return False, "At least two names are required to combine."
 
         role_id = role.get("ID")
-        apps, missing, _ = self._resolve_names_to_apps(role, names)
+        apps, missing, _ = self._resolve_names_to_apps(names, self._name_index(role))
         if missing:
             return (
                 False,
@@ -488,13 +669,20 @@ class DataManager:
         """Remove a channel."""
         return self.sheets_manager.remove_channel(chat_id)
 
+    def set_channel_digest(self, chat_id: int, enabled: bool) -> bool:
+        """Switch a registered channel between digests and immediate announcements."""
+        return self.sheets_manager.set_channel_digest(chat_id, enabled)
+
     def flush_all_queues(self) -> None:
-        """Flush all queues and invalidate caches in dependency order."""
-        self.sheets_manager.flush_user_queue()
-        self.sheets_manager.flush_application_queue()
-        self.sheets_manager.flush_status_update_queue()
-        self.sheets_manager.flush_channel_queue()
-        self.sheets_manager.invalidate_caches()
+        """Flush all queues and invalidate caches in dependency order.
+
+        While the Google Sheets circuit is open, writes stay queued and the cached
+        snapshot is kept instead of being invalidated.
+        """
+        if not sheets_breaker.allow():
+            logger.info("Google Sheets circuit open, keeping writes queued")
+            return
+        self.sheets_manager.flush_all()
 
     @property
     def channels(self) -> List[ChannelRow]:
@@ -558,55 +746,143 @@ class DataManager:
                 applicants.append(merged)
         return applicants
 
-    def _build_election_data(self) -> List[DivisionData]:
-        """Build full election dataset (divisions with roles and enriched applicants)."""
-        roles = self.get_all_roles()
-        all_applications = self.get_all_applications()
-        users_by_id = self._build_users_by_id()
-        # Bucket active approved/elected apps by Role_ID once: avoids scanning all apps per role.
-        apps_by_role: Dict[str, List[ApplicationRow]] = {}
-        for app in all_applications:
-            if app.get("Status", "") in ("APPROVED", "ELECTED"):
+    def _refresh_role_applications(
+        self, generation: Optional[Tuple[int, ...]]
+    ) -> Optional[Set[str]]:
+        """Update the per-role applications changed since a tree generation.
+
+        Returns the Role_IDs whose applications were re-read, or None when the
+        changed roles are not known and every role was re-read.
+        """
+        changed = (
+            self.sheets_manager.changed_since(
+                "applications", generation[DATA_SHEETS.index("applications")]
+            )
+            if generation is not None
+            else None
+        )
+        if changed is None:
+            self._role_applications = {}
+            self._roles_by_applicant = {}
+            for app in self.get_all_applications():
                 role_id = app.get("Role_ID")
-                if role_id:
-                    apps_by_role.setdefault(role_id, []).append(app)
-        divisions_dict: Dict[str, DivisionData] = {}
-        for role in roles:
-            div_fi = role.get("Division_FI")
-            div_en = role.get("Division_EN")
-            if div_fi not in divisions_dict:
-                divisions_dict[div_fi] = DivisionData(
-                    Division_FI=div_fi, Division_EN=div_en, Roles=[]
+                if role_id and app.get("Status", "") in ("APPROVED", "ELECTED"):
+                    self._role_applications.setdefault(str(role_id), []).append(app)
+                    self._roles_by_applicant.setdefault(
+                        app.get("Telegram_ID"), set()
+                    ).add(str(role_id))
+            return None
+        for role_id in map(str, changed):
+            for app in self._role_applications.pop(role_id, []):
+                self._roles_by_applicant.get(app.get("Telegram_ID"), set()).discard(
+                    role_id
                 )
-            applicants = self._applicants_for_role_enriched(
-                apps_by_role.get(role.get("ID", ""), []), users_by_id
-            )
-            divisions_dict[div_fi]["Roles"].append(
-                RoleData(
-                    ID=role.get("ID", ""),
-                    Role_FI=role.get("Role_FI", ""),
-                    Role_EN=role.get("Role_EN", ""),
-                    Amount=role.get("Amount"),
-                    Deadline=role.get("Deadline"),
-                    Type=role.get("Type", "NON_ELECTED"),
-                    Applicants=applicants,
-                    Division_FI=div_fi or "",
-                    Division_EN=div_en or "",
+            role_apps = [
+                app
+                for app in self.sheets_manager.get_applications_for_role(role_id)
+                if app.get("Status", "") in ("APPROVED", "ELECTED")
+            ]
+            if role_apps:
+                self._role_applications[role_id] = role_apps
+            for app in role_apps:
+                self._roles_by_applicant.setdefault(app.get("Telegram_ID"), set()).add(
+                    role_id
                 )
+        return set(map(str, changed))
+
+    def _build_election_data(self) -> List[DivisionData]:
+        """Build full election dataset (divisions with roles and enriched applicants).
+
+        The sheets report which roles' applications and which users changed
+        since the previous build; only those roles' applications are re-read,
+        and only roles whose row, applications or applicant users changed are
+        enriched again. The other RoleData nodes are shared with the old tree.
+        """
+        with self._tree_lock:
+            # Read the generation first: later changes are then seen next build
+            generation = self.sheets_manager.data_generation()
+            previous_generation = self._tree_generation
+            roles = self.get_all_roles()
+            changed_roles = self._refresh_role_applications(previous_generation)
+            changed_users = (
+                self.sheets_manager.changed_since(
+                    "users", previous_generation[DATA_SHEETS.index("users")]
+                )
+                if previous_generation is not None
+                else None
             )
-        return list(divisions_dict.values())
+            stale_roles: Optional[Set[str]] = None
+            if changed_roles is not None and changed_users is not None:
+                stale_roles = set(changed_roles)
+                for telegram_id in changed_users:
+                    stale_roles.update(self._roles_by_applicant.get(telegram_id, ()))
+
+            users_by_id: Optional[Dict[int, UserRow]] = None
+            divisions_dict: Dict[str, DivisionData] = {}
+            role_nodes: Dict[str, Tuple[ElectionStructureRow, RoleData]] = {}
+            rebuilt = 0
+            for role in roles:
+                div_fi = role.get("Division_FI")
+                div_en = role.get("Division_EN")
+                if div_fi not in divisions_dict:
+                    divisions_dict[div_fi] = DivisionData(
+                        Division_FI=div_fi, Division_EN=div_en, Roles=[]
+                    )
+                role_id = role.get("ID", "")
+                previous = self._role_nodes.get(role_id)
+                if (
+                    previous is not None
+                    and stale_roles is not None
+                    and role_id not in stale_roles
+                    and previous[0] == role
+                ):
+                    node = previous[1]
+                else:
+                    if users_by_id is None:
+                        users_by_id = self._build_users_by_id()
+                    node = RoleData(
+                        ID=role_id,
+                        Role_FI=role.get("Role_FI", ""),
+                        Role_EN=role.get("Role_EN", ""),
+                        Amount=role.get("Amount"),
+                        Deadline=role.get("Deadline"),
+                        Type=role.get("Type", "NON_ELECTED"),
+                        Applicants=self._applicants_for_role_enriched(
+                            self._role_applications.get(role_id, []), users_by_id
+                        ),
+                        Division_FI=div_fi or "",
+                        Division_EN=div_en or "",
+                    )
+                    rebuilt += 1
+                role_nodes[role_id] = (role, node)
+                divisions_dict[div_fi]["Roles"].append(node)
+            logger.debug("Election tree: rebuilt %d of %d roles", rebuilt, len(roles))
+            self._role_nodes = role_nodes
+            self._tree_generation = generation
+            return list(divisions_dict.values())
+
+    def statistics(self) -> ElectionStats:
+        """Application statistics for the current snapshot (materialized view)."""
+        return self._view(
+            "statistics",
+            lambda: ElectionStats(self.get_all_roles(), self.get_all_applications()),
+            ("roles", "applications"),
+        )
 
     @property
     def vaalilakana_full(self) -> List[DivisionData]:
-        """Get the full election dataset (all roles)."""
-        return self._build_election_data()
+        """Get the full election dataset (all roles). Shared; do not mutate."""
+        return self._view("vaalilakana_full", self._build_election_data)
 
     @property
     def vaalilakana(self) -> List[RoleData]:
-        """Get only elected roles (BOARD, ELECTED) as a flat list."""
-        return [
-            role
-            for division in self.vaalilakana_full
-            for role in division.get("Roles", [])
-            if role.get("Type") in ("BOARD", "ELECTED")
-        ]
+        """Get only elected roles (BOARD, ELECTED) as a flat list. Shared; do not mutate."""
+        return self._view(
+            "vaalilakana",
+            lambda: [
+                role
+                for division in self.vaalilakana_full
+                for role in division.get("Roles", [])
+                if role.get("Type") in ("BOARD", "ELECTED")
+            ],
+        )
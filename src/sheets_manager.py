@@ -1,15 +1,40 @@
 """Google Sheets integration for vaalilakana data management."""
 
+# pylint: disable=too-many-lines
+
 import logging
+import itertools
 import os
+import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, cast
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 from collections import deque
-from cachetools import cached, TTLCache
+from cachetools import cachedmethod, TTLCache
 import gspread
-from google.oauth2.service_account import Credentials
+from .admin_alerts import queue_admin_alert
+from .circuit_breaker import sheets_breaker
+from .credentials import CredentialManager, get_credential_manager
+from .name_index import RoleNameIndex
 from .utils import retry_on_api_error
+from .write_planner import CellWrites, plan_write_ranges
+from .role_import import ROLE_COLUMNS, role_columns
+from .sheet_reader import read_csv_export, records_from_values
+from .spill_queue import SpillQueue
 from .types import (
     ApplicationRow,
     ApplicationStatus,
@@ -19,23 +44,114 @@ from .types import (
     UserRow,
 )
 
-from .config import GOOGLE_SHEET_URL, GOOGLE_CREDENTIALS_FILE
+from .config import (
+    FLUSH_CHUNK_SIZE,
+    GOOGLE_SHEET_URL,
+    GOOGLE_CREDENTIALS_FILE,
+    QUEUE_ALERT_THRESHOLD,
+    QUEUE_HIGH_WATER,
+    QUEUE_SPILL_DIR,
+    SHEETS_READ_BACKEND,
+)
 
 logger = logging.getLogger("vaalilakanabot")
 
-# These are invalidated by the job queue every minute
-_roles_cache: TTLCache[str, List[ElectionStructureRow]] = TTLCache(maxsize=1, ttl=300)
-_applications_cache: TTLCache[str, List[ApplicationRow]] = TTLCache(maxsize=1, ttl=300)
-_channels_cache: TTLCache[str, List[ChannelRow]] = TTLCache(maxsize=1, ttl=300)
-_users_cache: TTLCache[str, List[UserRow]] = TTLCache(maxsize=1, ttl=300)
-
-# Persistent storage for last known good values (mutate in place to avoid global statement)
-_fallback_cache: Dict[str, Optional[List[Any]]] = {
-    "roles": None,
-    "applications": None,
-    "channels": None,
-    "users": None,
+# @cachedmethod reads each manager's own caches and condition (see __init__)
+_cache_condition = attrgetter("_cache_condition")
+
+# Sheets with their own data generation; see SheetsManager.data_generation()
+DATA_SHEETS = ("roles", "applications", "users")
+# Key under which a changed row is reported by changed_since(); roles have none,
+# so any change to them reports the whole sheet as changed
+CHANGE_KEYS: Dict[str, Callable[[Any], Hashable]] = {
+    "applications": lambda app: str(app.get("Role_ID")),
+    "users": lambda user: user.get("Telegram_ID"),
 }
+# Seconds a value the bot wrote is still recognised as its own after the flush
+# confirmed it; the sheet diff runs every minute, so it has long seen the write
+BOT_UPDATE_GRACE = 600.0
+
+
+def _changed_keys(
+    old: List[Any], new: List[Any], key: Callable[[Any], Hashable]
+) -> Set[Hashable]:
+    """Return the keys whose rows differ between two reads of a sheet."""
+    old_rows: Dict[Hashable, List[Any]] = {}
+    for row in old:
+        old_rows.setdefault(key(row), []).append(row)
+    new_rows: Dict[Hashable, List[Any]] = {}
+    for row in new:
+        new_rows.setdefault(key(row), []).append(row)
+    return {
+        k
+        for k in old_rows.keys() | new_rows.keys()
+        if old_rows.get(k) != new_rows.get(k)
+    }
+
+
+def _merge_pending_applications(
+    sheet_applications: List[ApplicationRow],
+    queue_applications: List[ApplicationRow],
+    status_updates: List[Dict[str, Any]],
+) -> List[ApplicationRow]:
+    """Copy the sheet rows, add queued applications and apply queued status updates."""
+    # Add queue applications to sheet applications (copy all to avoid mutating the cache
+    # or the queue), skipping ones that the cache already contains
+    in_sheet = {
+        (
+            str(app.get("Role_ID")),
+            str(app.get("Telegram_ID")),
+            str(app.get("Timestamp")),
+        )
+        for app in sheet_applications
+    }
+    all_applications: List[ApplicationRow] = [
+        cast(ApplicationRow, dict(app)) for app in sheet_applications
+    ] + [
+        cast(ApplicationRow, dict(app))
+        for app in queue_applications
+        if (
+            str(app.get("Role_ID")),
+            str(app.get("Telegram_ID")),
+            str(app.get("Timestamp")),
+        )
+        not in in_sheet
+    ]
+
+    if not status_updates:
+        return all_applications
+
+    # Index active apps by (Role_ID, Telegram_ID) so each queued update is O(1).
+    index: Dict[Tuple[str, str], ApplicationRow] = {}
+    for app in all_applications:
+        if app.get("Status") in ("DENIED", "REMOVED"):
+            continue
+        key = (str(app.get("Role_ID")), str(app.get("Telegram_ID")))
+        index.setdefault(key, app)
+
+    for status_update in status_updates:
+        key = (
+            str(status_update.get("Role_ID")),
+            str(status_update.get("Telegram_ID")),
+        )
+        target = index.get(key)
+        if target is None:
+            continue
+        if status_update.get("Status") is not None:
+            target["Status"] = cast(ApplicationStatus, status_update.get("Status"))
+        if status_update.get("Fiirumi_Post") is not None:
+            target["Fiirumi_Post"] = cast(str, status_update.get("Fiirumi_Post"))
+        if status_update.get("Group_ID") is not None:
+            target["Group_ID"] = cast(str, status_update.get("Group_ID"))
+        if target.get("Status") in ("DENIED", "REMOVED"):
+            index.pop(key, None)
+
+    return all_applications
+
+
+def _application_key(item: Any) -> Tuple[str, str]:
+    """(Role_ID, Telegram_ID) of a queued application or status update."""
+    return (str(item.get("Role_ID")), str(item.get("Telegram_ID")))
 
 
 class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
@@ -45,8 +161,15 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
         self,
         sheet_url: Optional[str] = None,
         credentials_file: Optional[str] = None,
+        read_only: bool = False,
+        users_manager: Optional["SheetsManager"] = None,
     ) -> None:
-        """Initialize Google Sheets connection."""
+        """Initialize Google Sheets connection.
+
+        A read_only manager (a past election year) never creates worksheets,
+        assigns role IDs or flushes writes. With users_manager set, users are
+        read from that manager's Users sheet instead of this spreadsheet's.
+        """
 
         self.sheet_url = sheet_url or GOOGLE_SHEET_URL
         self.credentials_file = credentials_file or GOOGLE_CREDENTIALS_FILE
@@ -57,12 +180,39 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
         if not self.credentials_file:
             raise ValueError("Google Credentials file path must be provided")
 
+        self.read_only = read_only
+        self.users_manager = users_manager
+
         # Define required scopes for Google Sheets
         self.scopes = [
             "https://www.googleapis.com/auth/spreadsheets",
             "https://www.googleapis.com/auth/drive",
         ]
 
+        # Read caches, invalidated by the job queue every minute. Each manager (one
+        # per election year) has its own, so a past year never evicts the live one.
+        self._roles_cache: TTLCache[Any, List[ElectionStructureRow]] = TTLCache(
+            maxsize=1, ttl=300
+        )
+        self._applications_cache: TTLCache[Any, List[ApplicationRow]] = TTLCache(
+            maxsize=1, ttl=300
+        )
+        self._channels_cache: TTLCache[Any, List[ChannelRow]] = TTLCache(
+            maxsize=1, ttl=300
+        )
+        self._users_cache: TTLCache[Any, List[UserRow]] = TTLCache(maxsize=1, ttl=300)
+        # The caches are read from handlers and cleared from the flush job's executor thread.
+        # The condition also makes concurrent misses wait for one read instead of each reading.
+        self._cache_condition = threading.Condition(threading.RLock())
+        # Last known good values, served when a read fails
+        self._fallback_cache: Dict[str, Optional[List[Any]]] = {
+            "roles": None,
+            "applications": None,
+            "channels": None,
+            "users": None,
+        }
+
+        self.credential_manager: Optional[CredentialManager] = None
         self.client: Any = None
         self.spreadsheet: Any = None
         self.election_sheet: Any = None
@@ -70,22 +220,93 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
         self.channels_sheet: Any = None
         self.users_sheet: Any = None
 
-        # Application queue for batching
-        self.application_queue: deque[ApplicationRow] = deque()
+        # Application queue for batching; spills to disk above QUEUE_HIGH_WATER.
+        # Read-only managers must not pick up the live manager's spilled writes.
+        spill_dir = (
+            os.path.join(QUEUE_SPILL_DIR, "read-only") if read_only else QUEUE_SPILL_DIR
+        )
+        self.application_queue: SpillQueue[ApplicationRow] = SpillQueue(
+            os.path.join(spill_dir, "application_queue.jsonl"),
+            QUEUE_HIGH_WATER,
+            _application_key,
+        )
 
         # Status update queue for batching (processed after application queue)
-        self.status_update_queue: deque[Dict[str, Any]] = deque()
+        self.status_update_queue: SpillQueue[Dict[str, Any]] = SpillQueue(
+            os.path.join(spill_dir, "status_update_queue.jsonl"),
+            QUEUE_HIGH_WATER,
+            _application_key,
+        )
 
         # Channel operation queues for batching
         self.channel_add_queue: deque[int] = deque()
         self.channel_remove_queue: deque[int] = deque()
+        # (chat_id, digest enabled); the latest entry for a chat wins
+        self.channel_digest_queue: deque[Tuple[int, bool]] = deque()
 
         # User operation queues for batching
         self.user_upsert_queue: deque[UserRow] = deque()
 
-        # Memoized id->role map, rebuilt when get_all_roles() returns a new list object.
-        self._roles_by_id_src: Optional[List[ElectionStructureRow]] = None
-        self._roles_by_id: Dict[str, ElectionStructureRow] = {}
+        # Guards the queues: handlers add to them while the flush job drains them
+        # from the Sheets executor thread
+        self._queue_lock = threading.RLock()
+        # Items taken by a flush and not yet written, and items written during the
+        # current and previous cache cycle. Readers overlay all of them so nothing
+        # disappears between the queue and a refreshed cache.
+        self._in_flight: Dict[str, List[Any]] = {
+            "applications": [],
+            "status updates": [],
+            "users": [],
+            "digest settings": [],
+        }
+        self._written: Dict[str, List[Any]] = {
+            "applications": [],
+            "status updates": [],
+            "users": [],
+            "digest settings": [],
+        }
+        self._written_before: Dict[str, List[Any]] = {
+            name: [] for name in self._written
+        }
+        # Serialises flushes; appends compute their start row from the sheet
+        self._flush_lock = threading.Lock()
+        # Queues whose backlog alert has been sent; re-armed once they shrink again
+        self._backlog_alerted: Set[str] = set()
+
+        # (Role_ID, Telegram_ID) -> field -> (value, time the flush wrote it) for
+        # values the bot itself queued, so the sheet diff can tell them apart from
+        # edits made directly in the sheet. Written values expire after
+        # BOT_UPDATE_GRACE even if the diff never saw them change.
+        self._bot_updates: Dict[
+            Tuple[str, str], Dict[str, Tuple[str, Optional[float]]]
+        ] = {}
+
+        # Per-sheet generations, bumped whenever that sheet's data changes; see
+        # data_generation(). One counter keeps every value unique. For each sheet
+        # also the generation each key last changed in, and the last generation
+        # in which an unknown set of rows changed; see changed_since().
+        self._generation_counter = itertools.count(1)
+        self._generation_lock = threading.Lock()
+        self._generations: Dict[str, int] = dict.fromkeys(DATA_SHEETS, 0)
+        self._key_generations: Dict[str, Dict[Hashable, int]] = {
+            sheet: {} for sheet in DATA_SHEETS
+        }
+        self._unkeyed_generations: Dict[str, int] = dict.fromkeys(DATA_SHEETS, 0)
+
+        # Memoized (roles list, id->role map), rebuilt when get_all_roles() returns a
+        # new list object. Replaced as one tuple so readers never see a mismatched pair.
+        # Memoized (applications list, Role_ID -> its rows), rebuilt when the sheet
+        # read returns a new list object
+        self._sheet_applications_by_role: Tuple[
+            Optional[List[ApplicationRow]], Dict[str, List[ApplicationRow]]
+        ] = (None, {})
+        self._roles_by_id: Tuple[
+            Optional[List[ElectionStructureRow]], Dict[str, ElectionStructureRow]
+        ] = (None, {})
+        self._role_names: Tuple[Optional[List[ElectionStructureRow]], RoleNameIndex] = (
+            None,
+            RoleNameIndex([]),
+        )
 
         self._connect()
 
@@ -97,16 +318,19 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     f"Google credentials file not found: {self.credentials_file}"
                 )
 
-            # Use service account credentials file
-            creds: Credentials = Credentials.from_service_account_file(  # type: ignore[no-untyped-call]
-                self.credentials_file, scopes=self.scopes
+            # Shared service account credentials, refreshed in the background
+            self.credential_manager = get_credential_manager(
+                self.credentials_file, self.scopes
             )
 
-            self.client = gspread.authorize(creds)
+            self.client = gspread.authorize(self.credential_manager.credentials)
             self.spreadsheet = self.client.open_by_url(self.sheet_url)
 
             # Get or create worksheets
-            self._setup_worksheets()
+            if self.read_only:
+                self._open_worksheets()
+            else:
+                self._setup_worksheets()
 
             logger.info("Successfully connected to Google Sheets")
 
@@ -114,6 +338,14 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             logger.error("Failed to connect to Google Sheets: %s", e)
             raise
 
+    def _open_worksheets(self) -> None:
+        """Open the existing worksheets without creating missing ones."""
+        titles = {ws.title: ws for ws in self.spreadsheet.worksheets()}
+        self.election_sheet = titles.get("Election Structure")
+        self.applications_sheet = titles.get("Applications")
+        self.channels_sheet = titles.get("Channels")
+        self.users_sheet = titles.get("Users")
+
     def _setup_worksheets(self) -> None:
         """Set up required worksheets with proper headers."""
         # Get or create Election Structure sheet
@@ -124,17 +356,7 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                 title="Election Structure", rows=1000, cols=8
             )
             # Add headers
-            headers = [
-                "ID",
-                "Division_FI",
-                "Division_EN",
-                "Role_FI",
-                "Role_EN",
-                "Type",
-                "Amount",
-                "Deadline",
-            ]
-            self.election_sheet.update("A1:H1", [headers])
+            self.election_sheet.update("A1:H1", [ROLE_COLUMNS])
 
         # Get or create Applications sheet
         try:
@@ -160,11 +382,11 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             self.channels_sheet = self.spreadsheet.worksheet("Channels")
         except gspread.WorksheetNotFound:
             self.channels_sheet = self.spreadsheet.add_worksheet(
-                title="Channels", rows=1000, cols=2
+                title="Channels", rows=1000, cols=3
             )
             # Add headers
-            headers = ["Chat_ID", "Added_Date"]
-            self.channels_sheet.update("A1:B1", [headers])
+            headers = ["Chat_ID", "Added_Date", "Digest"]
+            self.channels_sheet.update("A1:C1", [headers])
 
         # Get or create Users sheet
         try:
@@ -185,37 +407,259 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             self.users_sheet.update("A1:F1", [headers])
 
     def invalidate_caches(self) -> None:
-        """Invalidate all caches."""
-        _roles_cache.clear()
-        _applications_cache.clear()
-        _channels_cache.clear()
-        _users_cache.clear()
+        """Invalidate all caches.
+
+        Written items stay overlaid for one more cycle: a read that started before
+        they were written may refill the cache with old data after this clear.
+        """
+        with self._cache_condition:
+            self._roles_cache.clear()
+            self._applications_cache.clear()
+            self._channels_cache.clear()
+            self._users_cache.clear()
+        with self._queue_lock:
+            self._written_before = self._written
+            self._written = {name: [] for name in self._written}
+
+    def flush_all(self) -> None:
+        """Flush every queue in dependency order, then invalidate the caches.
+
+        Only one flush runs at a time, so concurrent callers (the flush job and an
+        admin import) cannot compute the same append row.
+        """
+        if self.read_only:
+            return
+        with self._flush_lock:
+            self.flush_user_queue()
+            # Status updates may target applications that are still queued
+            if self.flush_application_queue():
+                self.flush_status_update_queue()
+            self.flush_channel_queue()
+            self.invalidate_caches()
+
+    def _bump_generation(
+        self, sheet: str, keys: Optional[Iterable[Hashable]] = None
+    ) -> None:
+        """Mark one sheet's data (roles, applications or users) as changed.
+
+        ``keys`` are the CHANGE_KEYS of the changed rows; None means any row may
+        have changed.
+        """
+        with self._generation_lock:
+            generation = next(self._generation_counter)
+            self._generations[sheet] = generation
+            if keys is None:
+                self._unkeyed_generations[sheet] = generation
+            else:
+                for key in keys:
+                    self._key_generations[sheet][key] = generation
+
+    def _remember(self, name: str, result: List[Any]) -> None:
+        """Keep a successful read as fallback; bump the generation if the data changed."""
+        previous = self._fallback_cache.get(name)
+        if result != previous:
+            keys: Optional[Set[Hashable]] = None
+            if previous is not None and name in CHANGE_KEYS:
+                keys = _changed_keys(previous, result, CHANGE_KEYS[name])
+            self._bump_generation(name, keys)
+        self._fallback_cache[name] = result
+
+    def changed_since(self, sheet: str, generation: int) -> Optional[Set[Hashable]]:
+        """Return the keys of a sheet's rows changed after a generation it had.
+
+        Applications are keyed by Role_ID and users by Telegram_ID. Returns None
+        when the changed rows are not known, e.g. for roles or after the first
+        read, and the caller must treat every row as changed.
+        """
+        if sheet == "users" and self.users_manager is not None:
+            return self.users_manager.changed_since(sheet, generation)
+        with self._generation_lock:
+            if self._unkeyed_generations[sheet] > generation:
+                return None
+            return {
+                key
+                for key, changed in self._key_generations[sheet].items()
+                if changed > generation
+            }
+
+    def data_generation(self, sheets: Sequence[str] = DATA_SHEETS) -> Tuple[int, ...]:
+        """Return the generations of the given sheets, re-reading only their expired caches.
+
+        A sheet's generation changes when a write is queued for it or when a
+        re-read returns different data than the previous one, so a view keyed on
+        the generations of the sheets it reads is rebuilt only when those change.
+        """
+        generations: List[int] = []
+        for sheet in sheets:
+            if sheet == "users" and self.users_manager is not None:
+                generations.extend(self.users_manager.data_generation(("users",)))
+                continue
+            if sheet == "roles":
+                self.get_all_roles()
+            elif sheet == "applications":
+                self.get_all_applications_from_sheets()
+            else:
+                self.get_all_users_from_sheets()
+            generations.append(self._generations[sheet])
+        return tuple(generations)
+
+    def queue_sizes(self) -> Dict[str, int]:
+        """Return the number of pending writes in each queue."""
+        with self._queue_lock:
+            return {
+                "users": len(self.user_upsert_queue),
+                "applications": len(self.application_queue),
+                "status updates": len(self.status_update_queue),
+                "channel additions": len(self.channel_add_queue),
+                "channel removals": len(self.channel_remove_queue),
+                "channel digest settings": len(self.channel_digest_queue),
+                "spilled to disk": self.application_queue.spilled
+                + self.status_update_queue.spilled,
+            }
+
+    def _drain_queue(
+        self, queue: "deque[Any]", name: Optional[str] = None
+    ) -> List[Any]:
+        """Take every queued item at once, leaving the queue empty.
+
+        With a name, the items stay visible to readers as in flight until they are
+        requeued or written and the caches have been refreshed.
+        """
+        with self._queue_lock:
+            items = list(queue)
+            queue.clear()
+            if name is not None:
+                self._in_flight[name].extend(items)
+        return items
+
+    def _take_chunk(self, queue: "SpillQueue[Any]", name: str) -> List[Any]:
+        """Take up to FLUSH_CHUNK_SIZE items from the front of a queue, as in flight."""
+        with self._queue_lock:
+            items = queue.popleft_many(FLUSH_CHUNK_SIZE)
+            self._in_flight[name].extend(items)
+        return items
+
+    def _release_in_flight(self, name: str, items: List[Any]) -> None:
+        """Drop items from the in-flight list (caller holds the queue lock)."""
+        taken = {id(item) for item in items}
+        self._in_flight[name] = [
+            item for item in self._in_flight[name] if id(item) not in taken
+        ]
+
+    def _requeue(
+        self,
+        queue: "deque[Any] | SpillQueue[Any]",
+        items: List[Any],
+        name: Optional[str] = None,
+    ) -> None:
+        """Put items that failed to flush back in front of anything queued meanwhile."""
+        with self._queue_lock:
+            if name is not None:
+                self._release_in_flight(name, items)
+            queue.extendleft(reversed(items))
+
+    def _mark_written(self, name: str, items: List[Any]) -> None:
+        """Move flushed items from in flight to written until the next invalidation."""
+        with self._queue_lock:
+            self._release_in_flight(name, items)
+            self._written[name].extend(items)
+
+    def _pending(self, name: str, queue: "deque[Any] | SpillQueue[Any]") -> List[Any]:
+        """Return recently written, in-flight and queued items in write order."""
+        with self._queue_lock:
+            return [
+                *self._written_before[name],
+                *self._written[name],
+                *self._in_flight[name],
+                *queue,
+            ]
+
+    def _application_pending(self, key: Tuple[str, str]) -> bool:
+        """Return True if an application is queued or being flushed, but not written."""
+        with self._queue_lock:
+            return self.application_queue.has_key(key) or any(
+                _application_key(app) == key for app in self._in_flight["applications"]
+            )
 
-    @retry_on_api_error(max_retries=3, backoff_factor=2.0)
+    def _check_backlog(self, name: str, queue: "SpillQueue[Any]") -> None:
+        """Alert admins once when a queue grows past QUEUE_ALERT_THRESHOLD."""
+        size = len(queue)
+        if size < QUEUE_ALERT_THRESHOLD:
+            self._backlog_alerted.discard(name)
+            return
+        if name in self._backlog_alerted:
+            return
+        self._backlog_alerted.add(name)
+        queue_admin_alert(
+            f"⚠️ <b>{size} {name} are waiting to be written to Google Sheets.</b>\n"
+            f"{queue.spilled} of them are spilled to disk. They are written in "
+            "chunks once Google Sheets accepts writes again."
+        )
+
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
     def _get_all_values_with_retry(self, worksheet: Any) -> List[List[Any]]:
         """Get all values from a worksheet with retry logic."""
         return cast(List[List[Any]], worksheet.get_all_values())
 
-    @retry_on_api_error(max_retries=3, backoff_factor=2.0)
-    def _get_all_records_with_retry(self, worksheet: Any) -> List[Dict[str, Any]]:
-        """Get all records from a worksheet with retry logic."""
-        return cast(List[Dict[str, Any]], worksheet.get_all_records())
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
+    def _col_values_with_retry(self, worksheet: Any, col: int) -> List[Any]:
+        """Get the values of one column with retry logic."""
+        return cast(List[Any], worksheet.col_values(col))
+
+    def _read_values(self, worksheet: Any) -> List[List[Any]]:
+        """Read a worksheet for the cached refresh path.
+
+        Uses the CSV export endpoint when SHEETS_READ_BACKEND is "csv" (keeping the
+        Sheets API quota free for writes) and falls back to the values API if the
+        export fails. Flushes keep reading through the API so they always see the
+        rows they have just written.
+        """
+        if SHEETS_READ_BACKEND == "csv" and sheets_breaker.allow():
+            try:
+                return read_csv_export(
+                    self.client.http_client.session, self.spreadsheet.id, worksheet.id
+                )
+            except Exception as e:
+                logger.warning(
+                    "CSV export read failed for '%s', falling back to the API: %s",
+                    worksheet.title,
+                    e,
+                )
+        return self._get_all_values_with_retry(worksheet)
+
+    def _read_records(self, worksheet: Any) -> List[Dict[str, Any]]:
+        """Read a worksheet as header-keyed records (see _read_values)."""
+        return records_from_values(self._read_values(worksheet))
 
-    @retry_on_api_error(max_retries=3, backoff_factor=2.0)
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
     def _batch_update_with_retry(
         self, worksheet: Any, updates: List[Dict[str, Any]]
     ) -> None:
         """Perform batch update on a worksheet with retry logic."""
         worksheet.batch_update(updates)
 
-    @retry_on_api_error(max_retries=3, backoff_factor=2.0)
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
     def _update_with_retry(
         self, worksheet: Any, range_str: str, values: List[List[Any]]
     ) -> None:
         """Perform update on a worksheet with retry logic."""
         worksheet.update(range_str, values)
 
-    @retry_on_api_error(max_retries=3, backoff_factor=2.0)
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
+    def _resize_with_retry(self, worksheet: Any, rows: int, cols: int) -> None:
+        """Resize a worksheet with retry logic."""
+        worksheet.resize(rows=rows, cols=cols)
+
+    def _ensure_grid(self, worksheet: Any, rows: int, cols: int) -> None:
+        """Grow a worksheet to at least rows x cols cells so writes stay inside its grid."""
+        if worksheet.row_count < rows or worksheet.col_count < cols:
+            self._resize_with_retry(
+                worksheet,
+                max(rows, worksheet.row_count),
+                max(cols, worksheet.col_count),
+            )
+
+    @retry_on_api_error(max_retries=3, backoff_factor=2.0, breaker=sheets_breaker)
     def _delete_rows_with_retry(self, worksheet: Any, row_index: int) -> None:
         """Delete a row from a worksheet with retry logic."""
         worksheet.delete_rows(row_index)
@@ -227,32 +671,25 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
         id_col = headers.index("ID") + 1
         div_fi_col = headers.index("Division_FI") + 1
         role_fi_col = headers.index("Role_FI") + 1
-        updates = []
+        cells: CellWrites = {}
         for row_idx, row in enumerate(all_values[1:], start=2):
             id_val = row[id_col - 1] if len(row) >= id_col else ""
             if not id_val:
                 div_fi = row[div_fi_col - 1] if len(row) >= div_fi_col else ""
                 role_fi = row[role_fi_col - 1] if len(row) >= role_fi_col else ""
                 if div_fi and role_fi:
-                    updates.append(
-                        {
-                            "range": f"{chr(64 + id_col)}{row_idx}",
-                            "values": [[str(uuid.uuid4())]],
-                        }
-                    )
-        return updates
+                    cells[(row_idx, id_col)] = str(uuid.uuid4())
+        return plan_write_ranges(cells)
 
-    @cached(cache=_roles_cache)  # type: ignore[untyped-decorator]
+    @cachedmethod(cache=attrgetter("_roles_cache"), condition=_cache_condition)  # type: ignore[untyped-decorator]
     def get_all_roles(self) -> List[ElectionStructureRow]:
         """Get all roles with caching and ensure IDs exist when cache refreshes."""
         if self.election_sheet is None:
             return []
         try:
-            all_values: List[List[Any]] = self._get_all_values_with_retry(
-                self.election_sheet
-            )
+            all_values: List[List[Any]] = self._read_values(self.election_sheet)
             if not all_values:
-                fallback_roles = _fallback_cache.get("roles")
+                fallback_roles = self._fallback_cache.get("roles")
                 if fallback_roles:
                     logger.warning("Empty data from sheets, using last known roles")
                     return cast(List[ElectionStructureRow], fallback_roles)
@@ -260,24 +697,60 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
 
             headers = all_values[0]
             updates = self._collect_missing_role_id_updates(all_values, headers)
-            if updates:
+            if updates and not self.read_only:
                 self._batch_update_with_retry(self.election_sheet, updates)
-                logger.info("Assigned IDs to %s role rows without IDs", len(updates))
+                logger.info(
+                    "Assigned IDs to %s role rows without IDs",
+                    sum(len(u["values"]) for u in updates),
+                )
+                all_values = self._get_all_values_with_retry(self.election_sheet)
 
-            result: List[Dict[str, Any]] = self._get_all_records_with_retry(
-                self.election_sheet
-            )
-            _fallback_cache["roles"] = result
+            result: List[Dict[str, Any]] = records_from_values(all_values)
+            self._remember("roles", result)
             return cast(List[ElectionStructureRow], result)
 
         except Exception as e:
             logger.error("Error getting roles: %s", e)
-            fallback_val = _fallback_cache.get("roles")
+            fallback_val = self._fallback_cache.get("roles")
             if fallback_val:
                 logger.warning("Returning last known roles due to error")
                 return cast(List[ElectionStructureRow], fallback_val)
             return []
 
+    def append_roles(self, roles: List[ElectionStructureRow]) -> None:
+        """Append roles to the Election Structure sheet in a single request.
+
+        Values are placed by the sheet's own header row, so reordered or extra
+        columns are respected; missing headers (e.g. Aliases) are added after the
+        last one and the grid is grown to fit. Raises on failure so bulk imports
+        can report it; callers invalidate caches.
+        """
+        if self.election_sheet is None:
+            raise RuntimeError("Election Structure sheet is not available")
+        if not roles:
+            return
+        all_values = self._get_all_values_with_retry(self.election_sheet)
+        headers = [str(h).strip() for h in all_values[0]] if all_values else []
+        cells: CellWrites = {}
+        columns = role_columns(roles)
+        for column in columns:
+            if column not in headers:
+                headers.append(column)
+                cells[(1, len(headers))] = column
+        start_row = max(len(all_values), 1) + 1
+        for row, role in enumerate(roles, start=start_row):
+            values = cast(Dict[str, Any], role)
+            for column in columns:
+                cells[(row, headers.index(column) + 1)] = values.get(column) or ""
+        self._ensure_grid(self.election_sheet, start_row + len(roles) - 1, len(headers))
+        self._batch_update_with_retry(self.election_sheet, plan_write_ranges(cells))
+
+    def read_roles_from_spreadsheet(self, sheet_url: str) -> List[Dict[str, Any]]:
+        """Read the Election Structure records of another spreadsheet (e.g. last year's)."""
+        spreadsheet = sheets_breaker.call(self.client.open_by_url, sheet_url)
+        worksheet = spreadsheet.worksheet("Election Structure")
+        return records_from_values(self._get_all_values_with_retry(worksheet))
+
     def get_divisions(self) -> List[DivisionDict]:
         """Get unique divisions (derived from cached roles)."""
         roles = self.get_all_roles()
@@ -291,38 +764,46 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                 )
         return list(divisions.values())
 
+    def _role_name_index(self) -> RoleNameIndex:
+        """Role name index for the cached roles, rebuilt only when the roles change."""
+        all_roles = self.get_all_roles()
+        source, index = self._role_names
+        if source is not all_roles:
+            index = RoleNameIndex(all_roles)
+            self._role_names = (all_roles, index)
+        return index
+
     def find_role_by_name(self, role_name: str) -> Optional[ElectionStructureRow]:
-        """Find a role by Finnish or English name using cached roles."""
+        """Find a role by Finnish or English name or alias (case- and accent-insensitive)."""
         if not role_name:
             return None
-        all_roles = self.get_all_roles()
-        return next(
-            (r for r in all_roles if role_name in (r.get("Role_FI"), r.get("Role_EN"))),
-            None,
-        )
+        return self._role_name_index().find(role_name)
+
+    def suggest_role_names(self, role_name: str) -> List[str]:
+        """Return role names close to a name that did not match any role."""
+        return self._role_name_index().suggest(role_name)
 
     def get_role_by_id(self, role_id: str) -> Optional[ElectionStructureRow]:
         """Get a role by ID using cached roles (O(1) after first call per refresh)."""
         all_roles = self.get_all_roles()
-        if self._roles_by_id_src is not all_roles:
-            self._roles_by_id = {r.get("ID", ""): r for r in all_roles}
-            self._roles_by_id_src = all_roles
-        return self._roles_by_id.get(role_id)
+        source, roles_by_id = self._roles_by_id
+        if source is not all_roles:
+            roles_by_id = {r.get("ID", ""): r for r in all_roles}
+            self._roles_by_id = (all_roles, roles_by_id)
+        return roles_by_id.get(role_id)
 
-    @cached(cache=_applications_cache)  # type: ignore[untyped-decorator]
+    @cachedmethod(cache=attrgetter("_applications_cache"), condition=_cache_condition)  # type: ignore[untyped-decorator]
     def get_all_applications_from_sheets(self) -> List[ApplicationRow]:
         """Get all applications with caching (1 minute TTL)."""
         if self.applications_sheet is None:
             return []
         try:
-            result: List[Dict[str, Any]] = self._get_all_records_with_retry(
-                self.applications_sheet
-            )
-            _fallback_cache["applications"] = result
+            result: List[Dict[str, Any]] = self._read_records(self.applications_sheet)
+            self._remember("applications", result)
             return cast(List[ApplicationRow], result)
         except Exception as e:
             logger.error("Error getting all applications: %s", e)
-            fallback_val = _fallback_cache.get("applications")
+            fallback_val = self._fallback_cache.get("applications")
             if fallback_val:
                 logger.warning("Returning last known applications due to error")
                 return cast(List[ApplicationRow], fallback_val)
@@ -331,49 +812,48 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
     def get_all_applications(self) -> List[ApplicationRow]:
         """Get all applications with caching (1 minute TTL)."""
         try:
-            sheet_applications = self.get_all_applications_from_sheets()
-
-            # Add queue applications to sheet applications (copy sheet apps to avoid mutating the cache)
-            queue_applications = list(self.application_queue)
-            all_applications: List[ApplicationRow] = [
-                cast(ApplicationRow, dict(app)) for app in sheet_applications
-            ] + queue_applications
-
-            if not self.status_update_queue:
-                return all_applications
-
-            # Index active apps by (Role_ID, Telegram_ID) so each queued update is O(1).
-            index: Dict[Tuple[str, str], ApplicationRow] = {}
-            for app in all_applications:
-                if app.get("Status") in ("DENIED", "REMOVED"):
-                    continue
-                key = (str(app.get("Role_ID")), str(app.get("Telegram_ID")))
-                index.setdefault(key, app)
+            # Snapshot pending writes before reading the cache: an item flushed in
+            # between is then still in the snapshot or already in the fresh cache.
+            queue_applications = self._pending("applications", self.application_queue)
+            status_updates = self._pending("status updates", self.status_update_queue)
+            return _merge_pending_applications(
+                self.get_all_applications_from_sheets(),
+                queue_applications,
+                status_updates,
+            )
+        except Exception as e:
+            logger.error("Error getting all applications: %s", e)
+            return []
 
-            for status_update in list(self.status_update_queue):
-                key = (
-                    str(status_update.get("Role_ID")),
-                    str(status_update.get("Telegram_ID")),
-                )
-                target = index.get(key)
-                if target is None:
-                    continue
-                if status_update.get("Status") is not None:
-                    target["Status"] = cast(
-                        ApplicationStatus, status_update.get("Status")
-                    )
-                if status_update.get("Fiirumi_Post") is not None:
-                    target["Fiirumi_Post"] = cast(
-                        str, status_update.get("Fiirumi_Post")
-                    )
-                if status_update.get("Group_ID") is not None:
-                    target["Group_ID"] = cast(str, status_update.get("Group_ID"))
-                if target.get("Status") in ("DENIED", "REMOVED"):
-                    index.pop(key, None)
+    def get_applications_for_role(self, role_id: str) -> List[ApplicationRow]:
+        """Get one role's applications, like get_all_applications() restricted to it.
 
-            return all_applications
+        Only the role's rows and pending writes are copied, so callers that
+        follow changed_since() can refresh a few roles cheaply.
+        """
+        try:
+            queue_applications = [
+                app
+                for app in self._pending("applications", self.application_queue)
+                if str(app.get("Role_ID")) == role_id
+            ]
+            status_updates = [
+                update
+                for update in self._pending("status updates", self.status_update_queue)
+                if str(update.get("Role_ID")) == role_id
+            ]
+            sheet_applications = self.get_all_applications_from_sheets()
+            source, by_role = self._sheet_applications_by_role
+            if source is not sheet_applications:
+                by_role = {}
+                for app in sheet_applications:
+                    by_role.setdefault(str(app.get("Role_ID")), []).append(app)
+                self._sheet_applications_by_role = (sheet_applications, by_role)
+            return _merge_pending_applications(
+                by_role.get(role_id, []), queue_applications, status_updates
+            )
         except Exception as e:
-            logger.error("Error getting all applications: %s", e)
+            logger.error("Error getting applications for role %s: %s", role_id, e)
             return []
 
     def add_application(
@@ -385,12 +865,9 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             role_id = applicant.get("Role_ID")
             telegram_id = applicant.get("Telegram_ID")
 
-            # Check if application is already in queue
-            for queued_app in self.application_queue:
-                if (
-                    queued_app.get("Role_ID") == role_id
-                    and queued_app.get("Telegram_ID") == telegram_id
-                ):
+            with self._queue_lock:
+                # Check if application is already queued or being flushed
+                if self._application_pending(_application_key(applicant)):
                     logger.warning(
                         "Application already queued for role %s and user %s",
                         role_id,
@@ -398,7 +875,9 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     )
                     return False
 
-            self.application_queue.append(applicant)
+                self.application_queue.append(applicant)
+                self._bump_generation("applications", [str(role_id)])
+                self._check_backlog("applications", self.application_queue)
 
             logger.info(
                 "Queued application for role %s by user %s", role_id, telegram_id
@@ -410,54 +889,63 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             return False
 
     def flush_application_queue(self) -> bool:
-        """Flush all queued applications to Google Sheets in a single batch operation."""
+        """Flush queued applications to Google Sheets in chunks of FLUSH_CHUNK_SIZE rows."""
         if self.applications_sheet is None:
             return False
-        applications_to_add: List[ApplicationRow] = []
-        try:
-            if not self.application_queue:
-                logger.debug("No applications in queue to flush")
-                return True
-
-            # Convert queue to list and clear queue
-            applications_to_add = list(self.application_queue)
-            self.application_queue.clear()
-
-            # Find the starting row for new applications
-            start_row = len(self.applications_sheet.col_values(1)) + 1
-
-            # Prepare batch data
-            batch_data: List[List[Any]] = []
-            for app in applications_to_add:
-                row_data = [
-                    app.get("Timestamp"),
-                    app.get("Role_ID"),
-                    app.get("Telegram_ID"),
-                    app.get("Fiirumi_Post"),
-                    app.get("Status"),
-                    app.get("Language"),
-                    app.get("Group_ID"),
-                ]
-                batch_data.append(row_data)
-
-            # Calculate the range for batch update
-            end_row = start_row + len(batch_data) - 1
-            range_str = f"A{start_row}:G{end_row}"
-
-            # Perform batch update with retry
-            self._update_with_retry(self.applications_sheet, range_str, batch_data)
-
-            logger.info(
-                "Flushed %d applications from queue to sheets", len(applications_to_add)
+        start_row: Optional[int] = None
+        flushed = 0
+        while True:
+            applications_to_add: List[ApplicationRow] = self._take_chunk(
+                self.application_queue, "applications"
             )
-            return True
+            if not applications_to_add:
+                break
+            try:
+                # Find the starting row for new applications
+                if start_row is None:
+                    start_row = (
+                        len(self._col_values_with_retry(self.applications_sheet, 1)) + 1
+                    )
 
-        except Exception as e:
-            logger.error("Error flushing application queue: %s", e)
-            # Re-queue the applications if they failed to flush
-            for app in applications_to_add:
-                self.application_queue.append(app)
-            return False
+                # Prepare batch data
+                batch_data: List[List[Any]] = []
+                for app in applications_to_add:
+                    row_data = [
+                        app.get("Timestamp"),
+                        app.get("Role_ID"),
+                        app.get("Telegram_ID"),
+                        app.get("Fiirumi_Post"),
+                        app.get("Status"),
+                        app.get("Language"),
+                        app.get("Group_ID"),
+                    ]
+                    batch_data.append(row_data)
+
+                # Calculate the range for batch update
+                end_row = start_row + len(batch_data) - 1
+                range_str = f"A{start_row}:G{end_row}"
+
+                # Perform batch update with retry
+                self._update_with_retry(self.applications_sheet, range_str, batch_data)
+                self._mark_written("applications", applications_to_add)
+                start_row = end_row + 1
+                flushed += len(batch_data)
+
+            except Exception as e:
+                logger.error("Error flushing application queue: %s", e)
+                # Re-queue the applications if they failed to flush
+                self._requeue(
+                    self.application_queue, applications_to_add, "applications"
+                )
+                self._check_backlog("applications", self.application_queue)
+                return False
+
+        if flushed:
+            logger.info("Flushed %d applications from queue to sheets", flushed)
+        else:
+            logger.debug("No applications in queue to flush")
+        self._check_backlog("applications", self.application_queue)
+        return True
 
     def update_application_status(
         self,
@@ -470,17 +958,34 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
     ) -> bool:
         """Queue an application status update (any of status/fiirumi_post/group_id)."""
         try:
-            for queued_update in self.status_update_queue:
-                if (
-                    queued_update.get("Role_ID") == role_id
-                    and queued_update.get("Telegram_ID") == telegram_id
-                ):
+            with self._queue_lock:
+                # Same rules as the flush: an empty Group_ID is never written
+                fields = {
+                    field: (str(value), None)
+                    for field, value in (
+                        ("Status", status),
+                        ("Fiirumi_Post", fiirumi_post),
+                        ("Group_ID", group_id or None),
+                    )
+                    if value is not None
+                }
+                if fields:
+                    key = (str(role_id), str(telegram_id))
+                    self._bot_updates.setdefault(key, {}).update(fields)
+                # Merge into the newest queued update for this application; when
+                # that one is spilled to disk, append instead. The flush applies
+                # updates in order, so the latest values win either way.
+                queued_update = self.status_update_queue.latest_in_memory(
+                    _application_key({"Role_ID": role_id, "Telegram_ID": telegram_id})
+                )
+                if queued_update is not None:
                     if status is not None:
                         queued_update["Status"] = status
                     if fiirumi_post is not None:
                         queued_update["Fiirumi_Post"] = fiirumi_post
                     if group_id is not None:
                         queued_update["Group_ID"] = group_id
+                    self._bump_generation("applications", [str(role_id)])
                     logger.info(
                         "Updated queued status change for role %s, user %s",
                         role_id,
@@ -488,15 +993,17 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     )
                     return True
 
-            status_update: Dict[str, Any] = {
-                "Role_ID": role_id,
-                "Telegram_ID": telegram_id,
-                "Status": status,
-                "Fiirumi_Post": fiirumi_post,
-            }
-            if group_id is not None and group_id != "":
-                status_update["Group_ID"] = group_id
-            self.status_update_queue.append(status_update)
+                status_update: Dict[str, Any] = {
+                    "Role_ID": role_id,
+                    "Telegram_ID": telegram_id,
+                    "Status": status,
+                    "Fiirumi_Post": fiirumi_post,
+                }
+                if group_id is not None and group_id != "":
+                    status_update["Group_ID"] = group_id
+                self.status_update_queue.append(status_update)
+                self._bump_generation("applications", [str(role_id)])
+                self._check_backlog("status updates", self.status_update_queue)
             logger.info(
                 "Queued status update for role %s, user %s",
                 role_id,
@@ -508,13 +1015,59 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             logger.error("Error queueing status update: %s", e)
             return False
 
+    def pop_bot_update(
+        self, role_id: str, telegram_id: Any, field: str, value: str
+    ) -> bool:
+        """Return True if the bot queued this field value itself, and forget it."""
+        key = (str(role_id), str(telegram_id))
+        with self._queue_lock:
+            expected = self._bot_updates.get(key)
+            if expected is None or expected.get(field, (None, None))[0] != value:
+                return False
+            del expected[field]
+            if not expected:
+                del self._bot_updates[key]
+            return True
+
+    def _confirm_bot_updates(self, updates: List[Dict[str, Any]]) -> None:
+        """Start the expiry of bot values whose status updates have been flushed."""
+        now = time.monotonic()
+        with self._queue_lock:
+            for update in updates:
+                expected = self._bot_updates.get(_application_key(update))
+                if expected is None:
+                    continue
+                for field, (value, written_at) in list(expected.items()):
+                    if written_at is None and str(update.get(field)) == value:
+                        expected[field] = (value, now)
+
+    def _expire_bot_updates(self) -> None:
+        """Forget bot values written more than BOT_UPDATE_GRACE seconds ago.
+
+        The diff normally pops them when it sees the change; this drops the ones
+        it never will (the sheet already held the value or the row was not found),
+        so a later manual edit back to that value is not mistaken for the bot's.
+        """
+        cutoff = time.monotonic() - BOT_UPDATE_GRACE
+        with self._queue_lock:
+            for key, expected in list(self._bot_updates.items()):
+                for field, (_, written_at) in list(expected.items()):
+                    if written_at is not None and written_at < cutoff:
+                        del expected[field]
+                if not expected:
+                    del self._bot_updates[key]
+
     def _compute_status_update_batch(
         self,
         all_data: List[List[Any]],
         headers: List[Any],
         updates_to_process: List[Dict[str, Any]],
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """Compute batch updates and processed count for status update queue flush."""
+    ) -> Tuple[List[Dict[str, Any]], int, List[Dict[str, Any]]]:
+        """Compute batch updates and processed count for status update queue flush.
+
+        Also returns the updates to keep queued: their application has no row yet
+        because it was queued after the application queue was flushed.
+        """
         cols = {
             k: headers.index(k) + 1
             for k in ("Role_ID", "Telegram_ID", "Status", "Fiirumi_Post", "Group_ID")
@@ -532,12 +1085,18 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                 continue
             row_index.setdefault((str(row[role_col]), str(row[tid_col])), i)
 
-        batch_updates: List[Dict[str, Any]] = []
+        cells: CellWrites = {}
         processed_count = 0
+        deferred: List[Dict[str, Any]] = []
         for update_data in updates_to_process:
             role_id = update_data.get("Role_ID")
             telegram_id = update_data.get("Telegram_ID")
             row_idx = row_index.get((str(role_id), str(telegram_id)))
+            if row_idx is None and self._application_pending(
+                _application_key(update_data)
+            ):
+                deferred.append(update_data)
+                continue
             if row_idx is None:
                 logger.warning(
                     "Application not found for queued status update: role %s, user %s",
@@ -549,91 +1108,110 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             fiirumi_post = update_data.get("Fiirumi_Post")
             group_id = update_data.get("Group_ID")
             if status is not None:
-                batch_updates.append(
-                    {
-                        "range": f"{chr(64 + cols['Status'])}{row_idx}",
-                        "values": [[status]],
-                    }
-                )
+                cells[(row_idx, cols["Status"])] = status
             if fiirumi_post is not None:
-                batch_updates.append(
-                    {
-                        "range": f"{chr(64 + cols['Fiirumi_Post'])}{row_idx}",
-                        "values": [[fiirumi_post]],
-                    }
-                )
+                cells[(row_idx, cols["Fiirumi_Post"])] = fiirumi_post
             if group_id:
-                batch_updates.append(
-                    {
-                        "range": f"{chr(64 + cols['Group_ID'])}{row_idx}",
-                        "values": [[group_id]],
-                    }
-                )
+                cells[(row_idx, cols["Group_ID"])] = group_id
             processed_count += 1
-        return batch_updates, processed_count
+        return plan_write_ranges(cells), processed_count, deferred
 
     def flush_status_update_queue(self) -> bool:
-        """Flush all queued status updates to Google Sheets in a single batch operation."""
+        """Flush queued status updates to Google Sheets in chunks of FLUSH_CHUNK_SIZE."""
         if self.applications_sheet is None:
             return False
-        updates_to_process: List[Dict[str, Any]] = []
-        try:
-            if not self.status_update_queue:
-                logger.debug("No status updates in queue to flush")
-                return True
-            updates_to_process = list(self.status_update_queue)
-            self.status_update_queue.clear()
-            all_data: List[List[Any]] = self._get_all_values_with_retry(
-                self.applications_sheet
+        self._expire_bot_updates()
+        all_data: List[List[Any]] = []
+        processed_count = 0
+        # Updates for applications that are still queued; kept for the next flush
+        deferred: List[Dict[str, Any]] = []
+        while True:
+            updates_to_process: List[Dict[str, Any]] = self._take_chunk(
+                self.status_update_queue, "status updates"
             )
-            headers = all_data[0]
-            batch_updates, processed_count = self._compute_status_update_batch(
-                all_data, headers, updates_to_process
+            if not updates_to_process:
+                break
+            try:
+                # Status updates never move rows, so one read serves every chunk
+                if not all_data:
+                    all_data = self._get_all_values_with_retry(self.applications_sheet)
+                headers = all_data[0]
+                batch_updates, chunk_count, chunk_deferred = (
+                    self._compute_status_update_batch(
+                        all_data, headers, updates_to_process
+                    )
+                )
+                if batch_updates:
+                    self._batch_update_with_retry(
+                        self.applications_sheet, batch_updates
+                    )
+                deferred_ids = {id(update) for update in chunk_deferred}
+                written = [u for u in updates_to_process if id(u) not in deferred_ids]
+                self._mark_written("status updates", written)
+                self._confirm_bot_updates(written)
+                deferred.extend(chunk_deferred)
+                processed_count += chunk_count
+            except Exception as e:
+                logger.error("Error flushing status update queue: %s", e)
+                self._requeue(
+                    self.status_update_queue, updates_to_process, "status updates"
+                )
+                self._requeue(self.status_update_queue, deferred, "status updates")
+                self._check_backlog("status updates", self.status_update_queue)
+                return False
+
+        if deferred:
+            logger.info(
+                "Keeping %d status updates queued until their applications are written",
+                len(deferred),
             )
-            if batch_updates:
-                self._batch_update_with_retry(self.applications_sheet, batch_updates)
+            self._requeue(self.status_update_queue, deferred, "status updates")
+
+        if all_data:
             logger.info(
                 "Flushed %d status updates from queue to sheets", processed_count
             )
-            return True
-        except Exception as e:
-            logger.error("Error flushing status update queue: %s", e)
-            for update_data in updates_to_process:
-                self.status_update_queue.append(update_data)
-            return False
+        else:
+            logger.debug("No status updates in queue to flush")
+        self._check_backlog("status updates", self.status_update_queue)
+        return True
 
     def flush_channel_queue(self) -> bool:
-        """Flush all queued channel operations to Google Sheets in batch operations."""
+        """Flush all queued channel operations to Google Sheets in batch operations.
+
+        Each stage's items are cleared as soon as they are written, so a failure
+        requeues only the stages that did not complete.
+        """
         if self.channels_sheet is None:
             return False
         channels_to_add: List[int] = []
         channels_to_remove: List[int] = []
+        digest_settings: List[Tuple[int, bool]] = []
 
         try:
             # Process channel additions
-            if self.channel_add_queue:
-                channels_to_add = list(self.channel_add_queue)
-                self.channel_add_queue.clear()
-
+            channels_to_add = self._drain_queue(self.channel_add_queue)
+            if channels_to_add:
                 # Prepare batch data for additions
-                current_row = len(self.channels_sheet.col_values(1)) + 1
+                current_row = (
+                    len(self._col_values_with_retry(self.channels_sheet, 1)) + 1
+                )
                 batch_data: List[List[Any]] = []
 
                 for chat_id in channels_to_add:
                     batch_data.append([chat_id, datetime.now().isoformat()])
 
-                if batch_data:
-                    range_end = current_row + len(batch_data) - 1
-                    self._update_with_retry(
-                        self.channels_sheet, f"A{current_row}:B{range_end}", batch_data
-                    )
-                    logger.info("Added %d channels in batch", len(batch_data))
+                range_end = current_row + len(batch_data) - 1
+                self._ensure_grid(self.channels_sheet, range_end, 2)
+                self._update_with_retry(
+                    self.channels_sheet, f"A{current_row}:B{range_end}", batch_data
+                )
+                logger.info("Added %d channels in batch", len(batch_data))
+                channels_to_add = []
 
             # Process channel removals
-            if self.channel_remove_queue:
-                channels_to_remove = list(self.channel_remove_queue)
-                self.channel_remove_queue.clear()
-
+            channels_to_remove = self._drain_queue(self.channel_remove_queue)
+            if channels_to_remove:
                 # Get current sheet data with retry
                 all_data: List[List[Any]] = self._get_all_values_with_retry(
                     self.channels_sheet
@@ -653,77 +1231,124 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     self._delete_rows_with_retry(self.channels_sheet, row_index)
 
                 logger.info("Removed %d channels in batch", len(rows_to_delete))
+                channels_to_remove = []
+
+            # Process digest settings after additions, so new channels have a row
+            digest_settings = self._drain_queue(
+                self.channel_digest_queue, "digest settings"
+            )
+            if digest_settings:
+                self._write_digest_settings(dict(digest_settings))
+            self._mark_written("digest settings", digest_settings)
 
             return True
 
         except Exception as e:
             logger.error("Error flushing channel queue: %s", e)
-            # Re-queue the operations if they failed to flush
-            for chat_id in channels_to_add:
-                self.channel_add_queue.append(chat_id)
-            for chat_id in channels_to_remove:
-                self.channel_remove_queue.append(chat_id)
+            # Re-queue the operations that were not written
+            self._requeue(self.channel_add_queue, channels_to_add)
+            self._requeue(self.channel_remove_queue, channels_to_remove)
+            self._requeue(self.channel_digest_queue, digest_settings, "digest settings")
             return False
 
+    def _write_digest_settings(self, settings: Dict[int, bool]) -> None:
+        """Write the Digest column for the given channels in one batch update."""
+        all_data: List[List[Any]] = self._get_all_values_with_retry(self.channels_sheet)
+        updates: List[Dict[str, Any]] = []
+        if not all_data or len(all_data[0]) < 3 or all_data[0][2] != "Digest":
+            # Channels sheets created before digests have no Digest column yet
+            updates.append({"range": "C1", "values": [["Digest"]]})
+        for i, row in enumerate(all_data[1:], start=2):
+            if not row or not str(row[0]).strip():
+                continue
+            chat_id = int(str(row[0]).replace("−", "-"))
+            if chat_id in settings:
+                updates.append(
+                    {"range": f"C{i}", "values": [[str(settings[chat_id]).upper()]]}
+                )
+        if updates:
+            # Sheets created before digests are only two columns wide
+            self._ensure_grid(self.channels_sheet, max(len(all_data), 1), 3)
+            self._batch_update_with_retry(self.channels_sheet, updates)
+            logger.info("Updated digest setting of %d channels", len(settings))
+
     # Channel management methods
-    @cached(cache=_channels_cache)  # type: ignore[untyped-decorator]
-    def get_all_channels(self) -> List[ChannelRow]:
-        """Get all registered channels."""
+    @cachedmethod(cache=attrgetter("_channels_cache"), condition=_cache_condition)  # type: ignore[untyped-decorator]
+    def get_all_channels_from_sheets(self) -> List[ChannelRow]:
+        """Get all registered channels from the sheet with caching. Used by get_all_channels()."""
         if self.channels_sheet is None:
             return []
         try:
-            all_data: List[Dict[str, Any]] = self._get_all_records_with_retry(
-                self.channels_sheet
-            )
-            unique_ids = {
-                int(str(record.get("Chat_ID", "")).replace("−", "-"))
-                for record in all_data
-            }
+            all_data: List[Dict[str, Any]] = self._read_records(self.channels_sheet)
+            digest_by_id: Dict[int, bool] = {}
+            for record in all_data:
+                chat_id = int(str(record.get("Chat_ID", "")).replace("−", "-"))
+                digest = str(record.get("Digest", "")).strip().upper() == "TRUE"
+                digest_by_id[chat_id] = digest_by_id.get(chat_id, False) or digest
             result: List[ChannelRow] = [
-                ChannelRow(Channel_ID=chat_id) for chat_id in unique_ids
+                ChannelRow(Channel_ID=chat_id, Digest=digest)
+                for chat_id, digest in digest_by_id.items()
             ]
-            _fallback_cache["channels"] = result
+            self._fallback_cache["channels"] = result
             return result
         except Exception as e:
             logger.error("Error getting channels: %s", e)
-            fallback_val = _fallback_cache.get("channels")
+            fallback_val = self._fallback_cache.get("channels")
             if fallback_val:
                 logger.warning("Returning last known channels due to error")
                 return cast(List[ChannelRow], fallback_val)
             return []
 
+    def get_all_channels(self) -> List[ChannelRow]:
+        """Get all registered channels with queued digest settings applied."""
+        settings = dict(self._pending("digest settings", self.channel_digest_queue))
+        channels = self.get_all_channels_from_sheets()
+        if not settings:
+            return channels
+        return [
+            ChannelRow(
+                Channel_ID=channel["Channel_ID"],
+                Digest=settings.get(channel["Channel_ID"], channel["Digest"]),
+            )
+            for channel in channels
+        ]
+
     def _queue_channel_op(self, chat_id: int, for_addition: bool) -> bool:
         """Queue a channel add or remove. Returns False only when removing non-existent channel."""
-        my_queue = self.channel_add_queue if for_addition else self.channel_remove_queue
-        other_queue = (
-            self.channel_remove_queue if for_addition else self.channel_add_queue
-        )
-        if chat_id in my_queue:
-            logger.info(
-                "Channel %s already queued for %s",
-                chat_id,
-                "addition" if for_addition else "removal",
+        # May read the sheet, so look it up before taking the queue lock
+        existing = any(c.get("Channel_ID") == chat_id for c in self.get_all_channels())
+        with self._queue_lock:
+            my_queue = (
+                self.channel_add_queue if for_addition else self.channel_remove_queue
             )
-            return True
-        try:
-            other_queue.remove(chat_id)
-            logger.info(
-                "Cancelled %s: removed channel %s from %s queue",
-                "removal" if for_addition else "addition",
-                chat_id,
-                "remove" if for_addition else "add",
+            other_queue = (
+                self.channel_remove_queue if for_addition else self.channel_add_queue
             )
-            return True
-        except ValueError:
-            pass
-        existing = any(c.get("Channel_ID") == chat_id for c in self.get_all_channels())
-        if for_addition and existing:
-            logger.info("Channel %s already exists", chat_id)
-            return True
-        if not for_addition and not existing:
-            logger.warning("Channel %s not found", chat_id)
-            return False
-        my_queue.append(chat_id)
+            if chat_id in my_queue:
+                logger.info(
+                    "Channel %s already queued for %s",
+                    chat_id,
+                    "addition" if for_addition else "removal",
+                )
+                return True
+            try:
+                other_queue.remove(chat_id)
+                logger.info(
+                    "Cancelled %s: removed channel %s from %s queue",
+                    "removal" if for_addition else "addition",
+                    chat_id,
+                    "remove" if for_addition else "add",
+                )
+                return True
+            except ValueError:
+                pass
+            if for_addition and existing:
+                logger.info("Channel %s already exists", chat_id)
+                return True
+            if not for_addition and not existing:
+                logger.warning("Channel %s not found", chat_id)
+                return False
+            my_queue.append(chat_id)
         logger.info(
             "Queued channel %s for %s",
             chat_id,
@@ -747,16 +1372,30 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             logger.error("Error queueing channel removal: %s", e)
             return False
 
+    def set_channel_digest(self, chat_id: int, enabled: bool) -> bool:
+        """Queue a channel's digest setting. Returns False if the channel is not registered."""
+        registered = any(
+            c.get("Channel_ID") == chat_id for c in self.get_all_channels()
+        )
+        with self._queue_lock:
+            if chat_id in self.channel_remove_queue or not (
+                registered or chat_id in self.channel_add_queue
+            ):
+                return False
+            self.channel_digest_queue.append((chat_id, enabled))
+        logger.info(
+            "Queued digest %s for channel %s", "on" if enabled else "off", chat_id
+        )
+        return True
+
     # User management methods
-    @cached(cache=_users_cache)  # type: ignore[untyped-decorator]
+    @cachedmethod(cache=attrgetter("_users_cache"), condition=_cache_condition)  # type: ignore[untyped-decorator]
     def get_all_users_from_sheets(self) -> List[UserRow]:
         """Get all users from the sheet with caching (TTL). Used by get_all_users()."""
         if self.users_sheet is None:
             return []
         try:
-            all_data: List[Dict[str, Any]] = self._get_all_records_with_retry(
-                self.users_sheet
-            )
+            all_data: List[Dict[str, Any]] = self._read_records(self.users_sheet)
             result: List[UserRow] = []
             for record in all_data:
                 raw_id = record.get("Telegram_ID", "")
@@ -779,11 +1418,11 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     Updated_At=record.get("Updated_At", ""),
                 )
                 result.append(user)
-            _fallback_cache["users"] = result
+            self._remember("users", result)
             return result
         except Exception as e:
             logger.error("Error getting users: %s", e)
-            fallback_val = _fallback_cache.get("users")
+            fallback_val = self._fallback_cache.get("users")
             if fallback_val:
                 logger.warning("Returning last known users due to error")
                 return cast(List[UserRow], fallback_val)
@@ -791,12 +1430,13 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
 
     def get_all_users(self) -> List[UserRow]:
         """Get all users: sheet data plus queued upserts. Use this everywhere for immediate visibility of changes."""
+        if self.users_manager is not None:
+            return self.users_manager.get_all_users()
         try:
+            queued_users = self._pending("users", self.user_upsert_queue)
             sheet_users = self.get_all_users_from_sheets()
             result: List[UserRow] = list(sheet_users)
-            if not self.user_upsert_queue:
-                return result
-            for queued in self.user_upsert_queue:
+            for queued in queued_users:
                 telegram_id = queued.get("Telegram_ID")
                 found = next(
                     (
@@ -827,22 +1467,26 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
         try:
             telegram_id = user.get("Telegram_ID")
 
-            # Check if already queued
-            for queued_user in self.user_upsert_queue:
-                if queued_user.get("Telegram_ID") == telegram_id:
-                    # Update the existing queue entry in place (UserRow keys)
-                    queued_user["Name"] = user.get("Name", "")
-                    queued_user["Email"] = user.get("Email", "")
-                    queued_user["Telegram"] = user.get("Telegram", "")
-                    queued_user["Show_On_Website_Consent"] = user.get(
-                        "Show_On_Website_Consent", False
-                    )
-                    queued_user["Updated_At"] = user.get("Updated_At", "")
-                    logger.info("Updated queued user info for user %s", telegram_id)
-                    return True
-
-            # Add to queue
-            self.user_upsert_queue.append(user)
+            with self._queue_lock:
+                # Update the newest queued entry: after a failed flush an older one
+                # may be queued before it, and the flush applies them in order
+                for queued_user in reversed(self.user_upsert_queue):
+                    if queued_user.get("Telegram_ID") == telegram_id:
+                        # Update the existing queue entry in place (UserRow keys)
+                        queued_user["Name"] = user.get("Name", "")
+                        queued_user["Email"] = user.get("Email", "")
+                        queued_user["Telegram"] = user.get("Telegram", "")
+                        queued_user["Show_On_Website_Consent"] = user.get(
+                            "Show_On_Website_Consent", False
+                        )
+                        queued_user["Updated_At"] = user.get("Updated_At", "")
+                        self._bump_generation("users", [telegram_id])
+                        logger.info("Updated queued user info for user %s", telegram_id)
+                        return True
+
+                # Add to queue
+                self.user_upsert_queue.append(user)
+                self._bump_generation("users", [telegram_id])
             logger.info("Queued user info for user %s", telegram_id)
             return True
 
@@ -864,8 +1508,10 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             if len(row) > tid_col_idx:
                 tid_index.setdefault(str(row[tid_col_idx]), i)
 
-        batch_updates: List[Dict[str, Any]] = []
+        cells: CellWrites = {}
         new_users: List[List[Any]] = []
+        # A requeued upsert and a newer one for the same user become one new row
+        new_user_rows: Dict[str, int] = {}
         for user in users_to_process:
             user_row_index = tid_index.get(str(user.get("Telegram_ID")))
             user_data = [
@@ -877,15 +1523,14 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                 user.get("Updated_At"),
             ]
             if user_row_index is not None:
-                batch_updates.append(
-                    {
-                        "range": f"A{user_row_index}:F{user_row_index}",
-                        "values": [user_data],
-                    }
-                )
+                for col, value in enumerate(user_data, start=1):
+                    cells[(user_row_index, col)] = value
+            elif str(user.get("Telegram_ID")) in new_user_rows:
+                new_users[new_user_rows[str(user.get("Telegram_ID"))]] = user_data
             else:
+                new_user_rows[str(user.get("Telegram_ID"))] = len(new_users)
                 new_users.append(user_data)
-        return batch_updates, new_users
+        return plan_write_ranges(cells), new_users
 
     def flush_user_queue(self) -> bool:
         """Flush all queued user operations to Google Sheets."""
@@ -893,11 +1538,10 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             return False
         users_to_process: List[UserRow] = []
         try:
-            if not self.user_upsert_queue:
+            users_to_process = self._drain_queue(self.user_upsert_queue, "users")
+            if not users_to_process:
                 logger.debug("No users in queue to flush")
                 return True
-            users_to_process = list(self.user_upsert_queue)
-            self.user_upsert_queue.clear()
             all_data: List[List[Any]] = self._get_all_values_with_retry(
                 self.users_sheet
             )
@@ -907,7 +1551,11 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
             )
             if batch_updates:
                 self._batch_update_with_retry(self.users_sheet, batch_updates)
-                logger.info("Updated %d existing users", len(batch_updates))
+                logger.info(
+                    "Updated %d existing users in %d range(s)",
+                    len(users_to_process) - len(new_users),
+                    len(batch_updates),
+                )
             if new_users:
                 start_row = len(all_data) + 1
                 end_row = start_row + len(new_users) - 1
@@ -917,9 +1565,9 @@ class SheetsManager:  # pylint: disable=too-many-public-methods,too-many-instanc
                     new_users,
                 )
                 logger.info("Added %d new users", len(new_users))
+            self._mark_written("users", users_to_process)
             return True
         except Exception as e:
             logger.error("Error flushing user queue: %s", e)
-            for user in users_to_process:
-                self.user_upsert_queue.append(user)
+            self._requeue(self.user_upsert_queue, users_to_process, "users")
             return False
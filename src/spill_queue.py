@@ -0,0 +1,180 @@
+"""FIFO write queue that keeps a bounded number of items in memory and spills the rest to disk."""
+
+import json
+import logging
+import os
+from collections import Counter, deque
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+logger = logging.getLogger("vaalilakanabot")
+T = TypeVar("T")
+
+
+class SpillQueue(Generic[T]):
+    """FIFO queue holding at most ``high_water`` items in memory.
+
+    Once the in-memory part is full, new items are appended to a JSON Lines
+    segment file and read back in order as the front of the queue is drained.
+    Only the segment survives a restart: the first ``high_water`` items live in
+    memory only, as the plain deques did before. Items must be JSON-serialisable.
+
+    ``key`` identifies an item for has_key(); the keys of spilled items are
+    indexed in memory so duplicate checks never read the segment. Iterating
+    reads the segment at most once per change to it. Not thread-safe: callers
+    hold their own lock.
+    """
+
+    def __init__(
+        self, path: str, high_water: int, key: Callable[[T], Hashable]
+    ) -> None:
+        self.path = path
+        self.high_water = max(1, high_water)
+        self.key = key
+        self._memory: deque[T] = deque()
+        self._spilled = 0
+        self._spilled_keys: Counter[Hashable] = Counter()
+        # Decoded segment for iteration; None when it has to be read again
+        self._segment_items: Optional[List[T]] = None
+        self._index_segment()
+        if self._spilled:
+            logger.info("Loaded %d spilled queue items from %s", self._spilled, path)
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._spilled
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all items; spilled items are shared and must not be mutated."""
+        yield from self._memory
+        if self._spilled:
+            if self._segment_items is None:
+                self._segment_items = list(self._read_segment())
+            yield from self._segment_items
+
+    def has_key(self, key: Hashable) -> bool:
+        """Return True if an item with this key is queued."""
+        return self._spilled_keys[key] > 0 or any(
+            self.key(item) == key for item in self._memory
+        )
+
+    @property
+    def spilled(self) -> int:
+        """Number of items currently on disk."""
+        return self._spilled
+
+    def latest_in_memory(self, key: Hashable) -> Optional[T]:
+        """Return the newest item with this key if it is in memory (safe to mutate).
+
+        Returns None when there is none or when a newer one is spilled to disk.
+        """
+        if self._spilled_keys[key]:
+            return None
+        return next(
+            (item for item in reversed(self._memory) if self.key(item) == key), None
+        )
+
+    def append(self, item: T) -> None:
+        """Add an item to the back; spills to disk above the high-water mark."""
+        # Once anything is on disk, everything newer goes there too to keep FIFO order
+        if self._spilled or len(self._memory) >= self.high_water:
+            self._append_segment([item])
+        else:
+            self._memory.append(item)
+
+    def extendleft(self, items: Iterable[T]) -> None:
+        """Add items to the front like deque.extendleft (the last item ends up first)."""
+        self._memory.extendleft(items)
+        overflow = len(self._memory) - self.high_water
+        if overflow > 0:
+            tail = [self._memory.pop() for _ in range(overflow)]
+            tail.reverse()
+            self._prepend_segment(tail)
+
+    def popleft_many(self, count: int) -> List[T]:
+        """Remove and return up to ``count`` items from the front."""
+        items: List[T] = []
+        while len(items) < count:
+            if not self._memory and not self._load_from_segment():
+                break
+            items.append(self._memory.popleft())
+        return items
+
+    def clear(self) -> None:
+        """Remove every item, including the on-disk segment."""
+        self._memory.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._spilled = 0
+        self._spilled_keys.clear()
+        self._segment_items = None
+
+    def _index_segment(self) -> None:
+        """Count and index the items of an existing segment."""
+        if not os.path.exists(self.path):
+            return
+        for item in self._read_segment():
+            self._spilled += 1
+            self._spilled_keys[self.key(item)] += 1
+
+    def _read_segment(self) -> Iterator[T]:
+        with open(self.path, encoding="utf-8") as segment:
+            for line in segment:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _append_segment(self, items: List[T]) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as segment:
+            for item in items:
+                segment.write(json.dumps(item) + "\n")
+        if not self._spilled:
+            logger.warning(
+                "Queue over %d items, spilling to %s", self.high_water, self.path
+            )
+        self._spilled += len(items)
+        self._spilled_keys.update(self.key(item) for item in items)
+        if self._segment_items is not None:
+            self._segment_items.extend(json.loads(json.dumps(item)) for item in items)
+
+    def _rewrite_segment(self, items: Iterable[Any]) -> None:
+        """Atomically replace the segment with the given items."""
+        tmp_path = self.path + ".tmp"
+        keys: Counter[Hashable] = Counter()
+        with open(tmp_path, "w", encoding="utf-8") as segment:
+            for item in items:
+                segment.write(json.dumps(item) + "\n")
+                keys[self.key(item)] += 1
+        os.replace(tmp_path, self.path)
+        self._spilled = sum(keys.values())
+        self._spilled_keys = keys
+        self._segment_items = None
+
+    def _prepend_segment(self, items: List[T]) -> None:
+        if not self._spilled:
+            self._append_segment(items)
+            return
+        self._rewrite_segment(chain(items, self._read_segment()))
+
+    def _load_from_segment(self) -> bool:
+        """Move the next high_water items from disk into memory; False if none."""
+        if not self._spilled:
+            return False
+        remaining = self._read_segment()
+        self._memory.extend(islice(remaining, self.high_water))
+        self._rewrite_segment(remaining)
+        if not self._spilled:
+            os.remove(self.path)
+        return bool(self._memory)
@@ -0,0 +1,195 @@
+"""Election statistics: columnar aggregates per snapshot and an on-disk time series."""
+
+import bisect
+import io
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import STATS_FILE
+from .types import ApplicationRow, ElectionStructureRow
+
+logger = logging.getLogger("vaalilakanabot")
+
+# Statuses counted as applicants of a role
+ACTIVE_STATUSES = ("pending", "approved", "elected")
+
+
+def _parse_amount(amount: Any) -> int:
+    """Return the number of seats from an Amount cell ('2', '1-2' -> 2), 0 if unknown."""
+    digits = [int(part) for part in str(amount or "").split("-") if part.isdigit()]
+    return max(digits) if digits else 0
+
+
+class ElectionStats:
+    """Aggregates over one snapshot of roles and applications.
+
+    The snapshot is first turned into columns (one array per field, roles and
+    applications indexed by position); every aggregate is then a single pass
+    over one or two columns instead of a walk over row dicts.
+    """
+
+    def __init__(
+        self,
+        roles: Iterable[ElectionStructureRow],
+        applications: Iterable[ApplicationRow],
+    ) -> None:
+        """Build the columns and compute all aggregates."""
+        role_ids: List[str] = []
+        role_names: List[str] = []
+        role_divisions: List[str] = []
+        role_types: List[str] = []
+        role_seats = array("i")
+        for role in roles:
+            role_ids.append(role.get("ID", ""))
+            role_names.append(role.get("Role_EN") or role.get("Role_FI") or "")
+            role_divisions.append(role.get("Division_EN") or role.get("Division_FI"))
+            role_types.append(role.get("Type") or "NON_ELECTED")
+            role_seats.append(_parse_amount(role.get("Amount")))
+        position = {role_id: i for i, role_id in enumerate(role_ids)}
+
+        app_roles = array("i")
+        app_statuses: List[str] = []
+        for app in applications:
+            app_roles.append(position.get(app.get("Role_ID", ""), -1))
+            app_statuses.append((app.get("Status") or "pending").lower())
+
+        self.by_status: Counter[str] = Counter(app_statuses)
+        active = Counter(
+            role
+            for role, status in zip(app_roles, app_statuses)
+            if role >= 0 and status in ACTIVE_STATUSES
+        )
+        self.applicants_by_role = [active[i] for i in range(len(role_ids))]
+        self.by_division: Counter[str] = Counter()
+        self.by_type: Counter[str] = Counter()
+        for division, role_type, count in zip(
+            role_divisions, role_types, self.applicants_by_role
+        ):
+            self.by_division[division] += count
+            self.by_type[role_type] += count
+        self.role_names = role_names
+        self.role_seats = role_seats
+
+    @property
+    def role_count(self) -> int:
+        """Number of roles in the snapshot."""
+        return len(self.applicants_by_role)
+
+    @property
+    def active(self) -> int:
+        """Number of pending, approved and elected applications to known roles."""
+        return sum(self.applicants_by_role)
+
+    @property
+    def roles_without_applicants(self) -> int:
+        """Number of roles nobody has applied to."""
+        return self.applicants_by_role.count(0)
+
+    def most_contested(self, limit: int = 5) -> List[Tuple[str, int, int]]:
+        """Return (role name, applicants, seats) for roles with more applicants than seats."""
+        contested = [
+            (name, count, seats)
+            for name, count, seats in zip(
+                self.role_names, self.applicants_by_role, self.role_seats
+            )
+            if seats and count > seats
+        ]
+        contested.sort(key=lambda row: row[1] / row[2], reverse=True)
+        return contested[:limit]
+
+    def sample(self) -> Dict[str, Any]:
+        """Return the compact time series record for this snapshot (without time)."""
+        return {"active": self.active, "statuses": dict(sorted(self.by_status.items()))}
+
+
+class StatsHistory:
+    """Append-only JSON Lines time series of snapshot samples.
+
+    A sample is written only when the counts changed since the previous one,
+    so a quiet election adds almost nothing. The file is read once; later
+    samples are appended to both the file and the in-memory list.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._samples: Optional[List[Dict[str, Any]]] = None
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Return all samples, oldest first. Shared; do not mutate."""
+        with self._lock:
+            return self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if self._samples is None:
+            self._samples = []
+            if os.path.exists(self.path):
+                with open(self.path, encoding="utf-8") as history:
+                    self._samples = [
+                        json.loads(line) for line in history if line.strip()
+                    ]
+        return self._samples
+
+    def record(self, stats: ElectionStats, now: Optional[float] = None) -> bool:
+        """Append a sample if the counts changed; returns True if one was written."""
+        sample = stats.sample()
+        with self._lock:
+            samples = self._load()
+            if samples and {k: v for k, v in samples[-1].items() if k != "t"} == sample:
+                return False
+            record = {"t": int(now if now is not None else time.time()), **sample}
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as history:
+                history.write(json.dumps(record) + "\n")
+            samples.append(record)
+            return True
+
+    def active_at(self, timestamp: float) -> Optional[int]:
+        """Return the active applicant count at a past time, or None if before the series."""
+        samples = self.samples()
+        index = bisect.bisect_right([s["t"] for s in samples], timestamp)
+        return samples[index - 1]["active"] if index else None
+
+
+def render_chart(samples: List[Dict[str, Any]]) -> bytes:
+    """Render active and pending applicants over time as a PNG.
+
+    Needs the optional matplotlib dependency. Uses a standalone Figure with an
+    Agg canvas instead of pyplot, whose global state is not thread-safe, so
+    charts can be rendered from several executor threads at once.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError as e:
+        raise ValueError(
+            "Charts require matplotlib (pip install 'vaalilakanabot[charts]')"
+        ) from e
+    times = [datetime.fromtimestamp(s["t"]) for s in samples]
+    figure = Figure(figsize=(8, 4))
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.subplots()
+    axes.step(times, [s["active"] for s in samples], where="post", label="active")
+    axes.step(
+        times,
+        [s["statuses"].get("pending", 0) for s in samples],
+        where="post",
+        label="pending",
+    )
+    axes.set_ylabel("applications")
+    axes.legend()
+    figure.autofmt_xdate()
+    buffer = io.BytesIO()
+    canvas.print_png(buffer)
+    return buffer.getvalue()
+
+
+stats_history = StatsHistory(STATS_FILE)
@@ -1,6 +1,6 @@
 """Types for the application process."""
 
-from typing import TypedDict, List, Optional, Literal, Tuple
+from typing import TypedDict, List, NotRequired, Optional, Literal, Tuple
 
 
 RoleType = Literal["BOARD", "ELECTED", "NON_ELECTED", "AUDITOR"]
@@ -34,6 +34,8 @@ class ElectionStructureRow(TypedDict):
     Type: RoleType
     Amount: Optional[str]
     Deadline: Optional[str]
+    # Optional column: comma-separated extra names admins may use for the role
+    Aliases: NotRequired[str]
 
 
 class ApplicationRow(TypedDict):
@@ -55,6 +57,32 @@ class DivisionDict(TypedDict):
     Division_EN: str
 
 
+ApplicationChangeKind = Literal[
+    "added",
+    "deleted",
+    "approved",
+    "rejected",
+    "removed",
+    "elected",
+    "status",
+    "group",
+    "fiirumi",
+]
+
+
+class ApplicationChange(TypedDict):
+    """A change to one application row between two sheet snapshots."""
+
+    Kind: ApplicationChangeKind
+    Role_ID: str
+    Telegram_ID: int
+    Old: str
+    New: str
+    Language: str
+    # True when the bot wrote the new value itself (already notified)
+    By_Bot: bool
+
+
 # For election sheet data (Applicants are enriched with Name/Email/Telegram from Users)
 class RoleData(TypedDict):
     """Role data dictionary."""
@@ -82,6 +110,8 @@ class ChannelRow(TypedDict):
     """Channel row dictionary."""
 
     Channel_ID: int
+    # Receive announcements as a periodic digest instead of one by one
+    Digest: bool
 
 
 
@@ -12,6 +12,7 @@ from .utils import (
     map_application_status,
     get_translation,
 )
+from .executors import sheets_executor
 from .sheets_data_manager import DataManager
 
 logger = logging.getLogger("vaalilakanabot")
@@ -29,11 +30,12 @@ async def help_command(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
 <b>Basic Commands:</b>
 • /start - Register or update your info (private chat)
 • /register - Register or update your info (private chat)
-• /sheet - Show current election sheet
+• /sheet - Show current election sheet (/sheet &lt;year&gt; for a past election)
 • /applications - Show your applications (private chat)
 • /apply - Apply for a position (private chat)
 • /announcements - Register this chat as an announcement channel
 • /stop - Unregister this chat from announcements
+• /digest on|off - Get announcements in this chat as a periodic digest
 
 <b>Fun Commands:</b>
 • /jauhis - Send jauhis sticker
@@ -76,11 +78,12 @@ async def apua_command(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
 <b>Peruskomennot:</b>
 • /start - Rekisteröidy tai päivitä tietosi (yksityisviesti)
 • /rekisteroidy - Rekisteröidy tai päivitä tietosi (yksityisviesti)
-• /lakana - Näytä nykyinen vaalilakana
+• /lakana - Näytä nykyinen vaalilakana (/lakana &lt;vuosi&gt; aiemmille vaaleille)
 • /hakemukset - Näytä omat hakemuksesi (yksityisviesti)
 • /hae - Hae virkaan (yksityisviesti)
 • /ilmoitukset - Rekisteröi tämä chat tiedotuskanavaksi
 • /stop - Poista tämä chat tiedotuskanavista
+• /digest on|off - Saa ilmoitukset tähän chattiin koosteena
 
 <b>Hauskat komennot:</b>
 • /jauhis - Lähetä jauhis-tarra
@@ -128,6 +131,41 @@ async def register_announcement_channel(
         logger.error(e)
 
 
+async def set_channel_digest(update: Update, data_manager: DataManager) -> None:
+    """Switch this channel between digests and immediate announcements (/digest on|off)."""
+    message = update.message
+    if message is None:
+        return
+    try:
+        chat_id = message.chat.id
+        parts = (message.text or "").split()
+        setting = parts[1].lower() if len(parts) > 1 else ""
+        if setting not in ("on", "off"):
+            current = next(
+                (c for c in data_manager.channels if c.get("Channel_ID") == chat_id),
+                None,
+            )
+            state = "on" if current and current.get("Digest") else "off"
+            await message.reply_text(
+                f"Kooste / Digest: {state}\nKäytä / Use: /digest on | /digest off"
+            )
+            return
+        if not data_manager.set_channel_digest(chat_id, setting == "on"):
+            await message.reply_text(
+                "Rekisteröi kanava ensin komennolla /ilmoitukset. / Register the channel first with /announcements."
+            )
+        elif setting == "on":
+            await message.reply_text(
+                "✅ Ilmoitukset tulevat jatkossa koosteena. / Announcements will now arrive as a periodic digest."
+            )
+        else:
+            await message.reply_text(
+                "✅ Ilmoitukset tulevat heti. / Announcements will arrive right away."
+            )
+    except Exception as e:
+        logger.error(e)
+
+
 async def unregister_channel(update: Update, data_manager: DataManager) -> None:
     """Unregister a channel from announcements (/stop)."""
     message = update.message
@@ -243,12 +281,29 @@ async def applications(update: Update, data_manager: DataManager) -> None:
 async def _show_election_sheet(
     update: Update, data_manager: DataManager, is_finnish: bool
 ) -> None:
-    """Show the current election sheet."""
-    if update.message is None:
+    """Show the current election sheet, or a past year's with '/lakana <year>'."""
+    message = update.message
+    if message is None:
         return
     try:
-        text = vaalilakana_to_string(data_manager.vaalilakana, is_finnish)
-        await update.message.reply_html(text, disable_web_page_preview=True)
+        args = (message.text or "").split()[1:]
+        if not args:
+            text = vaalilakana_to_string(data_manager.vaalilakana, is_finnish)
+        else:
+            # Past years are opened and read lazily, which blocks
+            year_data = await sheets_executor.run(data_manager.for_year, args[0])
+            if year_data is None:
+                await message.reply_text(
+                    get_translation(
+                        "unknown_election_year",
+                        is_finnish,
+                        years=", ".join(data_manager.election_years()),
+                    )
+                )
+                return
+            roles = await sheets_executor.run(lambda: year_data.vaalilakana)
+            text = vaalilakana_to_string(roles, is_finnish)
+        await message.reply_html(text, disable_web_page_preview=True)
     except Exception as e:
         logger.error(e)
 
@@ -8,7 +8,9 @@ from typing import Any, Callable, List, Literal, Optional, TypeVar
 from gspread.exceptions import APIError
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, is_outage_error
 from .config import BASE_URL
+from .executors import file_io_executor
 from .types import (
     ApplicationRow,
     ApplicationStatus,
@@ -69,17 +71,27 @@ def is_pending_status(status: Optional[ApplicationStatus]) -> bool:
 
 
 def retry_on_api_error(
-    max_retries: int = 3, backoff_factor: float = 2.0
+    max_retries: int = 3,
+    backoff_factor: float = 2.0,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Decorator to retry API calls with exponential backoff on 503 errors."""
+    """Decorator to retry API calls with exponential backoff on 503 errors.
+
+    With a circuit breaker, calls fail fast with CircuitOpenError while it is
+    open and retrying stops as soon as it opens, so latency stays bounded
+    during outages. A call counts as one breaker failure only once all its
+    retries failed, and while half-open only one call probes the service.
+    """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
+        def attempts(*args: Any, **kwargs: Any) -> T:
             last_exception: Optional[Exception] = None
             for attempt in range(max_retries):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
                 except APIError as e:
                     last_exception = e
                     status_code = 503
@@ -89,6 +101,9 @@ def retry_on_api_error(
                         raise
                     if status_code not in (429, 500, 502, 503, 504):
                         raise
+                    if breaker is not None and breaker.state == "open":
+                        # Other calls tripped the breaker: stop retrying
+                        break
                     wait_time = backoff_factor**attempt
                     logger.warning(
                         "API error %s in %s (attempt %d/%d), retrying in %.1fs: %s",
@@ -101,6 +116,8 @@ def retry_on_api_error(
                     )
                     time.sleep(wait_time)
                 except Exception as exc:
+                    if breaker is not None and is_outage_error(exc):
+                        breaker.record_failure()
                     logger.error("Non-retryable error in %s: %s", func.__name__, exc)
                     raise
             logger.error(
@@ -109,10 +126,27 @@ def retry_on_api_error(
                 func.__name__,
                 last_exception,
             )
+            if breaker is not None:
+                breaker.record_failure()
             if last_exception:
                 raise last_exception
             raise RuntimeError("Unknown error")
 
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if breaker is None:
+                return attempts(*args, **kwargs)
+            admitted = breaker.acquire()
+            if admitted is None:
+                raise CircuitOpenError(
+                    f"{breaker.name} circuit is open, skipping {func.__name__}"
+                )
+            try:
+                return attempts(*args, **kwargs)
+            finally:
+                if admitted == "half_open":
+                    breaker.release_probe()
+
         return wrapper
 
     return decorator
@@ -228,13 +262,19 @@ def create_fiirumi_link(t_id: str) -> str:
     return f"{BASE_URL}/t/{t_id}"
 
 
+def _read_asset(filename: str) -> bytes:
+    """Read a file from the assets directory."""
+    with open(f"assets/{filename}", "rb") as asset:
+        return asset.read()
+
+
 async def send_sticker(update: Update, sticker_name: str) -> None:
     """Send a sticker by name."""
+    if not update.message:
+        return
     try:
-        with open(f"assets/{sticker_name}.png", "rb") as photo:
-            if not update.message:
-                return
-            await update.message.reply_sticker(photo)
+        sticker = await file_io_executor.run(_read_asset, f"{sticker_name}.png")
+        await update.message.reply_sticker(sticker)
     except Exception as e:
         logger.warning("Error in sending %s sticker: %s", sticker_name.capitalize(), e)
 
@@ -409,6 +449,10 @@ def get_translation(key: str, is_finnish: bool = True, **kwargs: Any) -> str:
             "Sinulla ei ole vielä hakemuksia.",
             "You have no applications yet.",
         ),
+        "unknown_election_year": (
+            "Vaalilakanaa ei löydy tälle vuodelle. Saatavilla: {years}",
+            "No election sheet for that year. Available: {years}",
+        ),
         # Registration
         "please_register_first": (
             "Rekisteröidy ensin komennolla /rekisteroidy ennen hakemista.",
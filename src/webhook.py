@@ -0,0 +1,145 @@
+"""Receiver for Fiirumi (Discourse) webhooks that triggers an immediate topic poll."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+from telegram.ext import ContextTypes, JobQueue
+
+logger = logging.getLogger("vaalilakanabot")
+
+# Largest request body accepted; Discourse payloads are a few kilobytes
+MAX_BODY = 1024 * 1024
+# Seconds a client may take to send a whole request
+READ_TIMEOUT = 10.0
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check an X-Discourse-Event-Signature header ('sha256=<hex HMAC of body>')."""
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256=") :])
+
+
+def is_new_topic_event(event: str, payload: Dict[str, Any]) -> bool:
+    """Return True for a new topic: topic_created, or post_created for a first post."""
+    if event == "topic_created":
+        return True
+    post = payload.get("post") or {}
+    return event == "post_created" and post.get("post_number") == 1
+
+
+class FiirumiWebhook:
+    """Minimal HTTP endpoint for signed Discourse webhook deliveries.
+
+    A verified new-topic event schedules the topic poll job right away, so the
+    linking, cursor and announcement logic stays in one place and a topic is
+    announced once however it was noticed. Events arriving while a triggered
+    poll is still pending are coalesced into it. Other events are acknowledged
+    and ignored; replies are still announced by the hourly responses job.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        secret: str,
+        job_queue: JobQueue[Any],
+        poll: Callable[[ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, Any]],
+    ) -> None:
+        self.path = path
+        self.secret = secret
+        self.job_queue = job_queue
+        self.poll = poll
+        self._poll_pending = False
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self, host: str, port: int) -> None:
+        """Start listening for deliveries."""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        logger.info("Fiirumi webhook listening on %s:%d%s", host, port, self.path)
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            try:
+                async with asyncio.timeout(READ_TIMEOUT):
+                    status = await self._handle(reader)
+            except (TimeoutError, ValueError, asyncio.IncompleteReadError) as e:
+                logger.warning("Bad Fiirumi webhook request: %s", e)
+                status = 400
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Length: 0\r\nConnection: close\r\n\r\n".encode("ascii")
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.error("Error serving Fiirumi webhook request: %s", e)
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader) -> int:
+        """Read one request and return the response status code."""
+        method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if target.split("?", 1)[0] != self.path:
+            return 404
+        if method != "POST":
+            return 405
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY:
+            return 413
+        body = await reader.readexactly(length)
+        if not verify_signature(
+            self.secret, body, headers.get("x-discourse-event-signature")
+        ):
+            logger.warning("Rejected Fiirumi webhook with a bad signature")
+            return 401
+
+        event = headers.get("x-discourse-event", "")
+        payload = json.loads(body or b"{}")
+        if not isinstance(payload, dict):
+            logger.warning("Rejected Fiirumi webhook whose body is not an object")
+            return 400
+        if is_new_topic_event(event, payload):
+            logger.info("Fiirumi webhook: %s", event)
+            self._trigger_poll()
+        else:
+            logger.debug("Ignoring Fiirumi webhook event %s", event)
+        return 200
+
+    def _trigger_poll(self) -> None:
+        if self._poll_pending:
+            return
+        self._poll_pending = True
+
+        async def run(context: ContextTypes.DEFAULT_TYPE) -> None:
+            self._poll_pending = False
+            await self.poll(context)
+
+        self.job_queue.run_once(run, when=0, name="fiirumi-webhook-poll")
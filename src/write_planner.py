@@ -0,0 +1,76 @@
+"""Plan Google Sheets batch_update payloads as few contiguous A1 ranges as possible."""
+
+from typing import Any, Dict, List, Tuple
+
+# (row, col) -> value, both 1-based like the Sheets API
+CellWrites = Dict[Tuple[int, int], Any]
+
+
+def column_letter(col: int) -> str:
+    """Convert a 1-based column index to its A1 letters (1 -> A, 27 -> AA)."""
+    if col < 1:
+        raise ValueError(f"Column index must be >= 1, got {col}")
+    letters = ""
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def a1_range(start_row: int, start_col: int, end_row: int, end_col: int) -> str:
+    """Return an A1 range string; single cells are written without the ':' part."""
+    start = f"{column_letter(start_col)}{start_row}"
+    if start_row == end_row and start_col == end_col:
+        return start
+    return f"{start}:{column_letter(end_col)}{end_row}"
+
+
+def _row_runs(row_cells: Dict[int, Any]) -> List[Tuple[int, int, List[Any]]]:
+    """Split one row's cells into runs of adjacent columns: (start_col, end_col, values)."""
+    runs: List[Tuple[int, int, List[Any]]] = []
+    for col in sorted(row_cells):
+        if runs and runs[-1][1] == col - 1:
+            start, _, values = runs[-1]
+            values.append(row_cells[col])
+            runs[-1] = (start, col, values)
+        else:
+            runs.append((col, col, [row_cells[col]]))
+    return runs
+
+
+def plan_write_ranges(cells: CellWrites) -> List[Dict[str, Any]]:
+    """Merge single-cell writes into the fewest contiguous rectangles.
+
+    Adjacent columns within a row become one run, and runs covering the same
+    columns on consecutive rows are stacked into one block. The result is a
+    list of ``{"range": ..., "values": ...}`` dicts for ``Worksheet.batch_update``.
+    """
+    by_row: Dict[int, Dict[int, Any]] = {}
+    for (row, col), value in cells.items():
+        by_row.setdefault(row, {})[col] = value
+
+    # Blocks are [start_row, end_row, start_col, end_col, values]; only blocks
+    # touched by the previous row can still grow downwards.
+    open_blocks: Dict[Tuple[int, int], List[Any]] = {}
+    blocks: List[List[Any]] = []
+    for row in sorted(by_row):
+        next_open: Dict[Tuple[int, int], List[Any]] = {}
+        for start_col, end_col, values in _row_runs(by_row[row]):
+            key = (start_col, end_col)
+            block = open_blocks.get(key)
+            if block is not None and block[1] == row - 1:
+                block[1] = row
+                block[4].append(values)
+            else:
+                block = [row, row, start_col, end_col, [values]]
+                blocks.append(block)
+            next_open[key] = block
+        open_blocks = next_open
+
+    return [
+        {
+            "range": a1_range(start_row, start_col, end_row, end_col),
+            "values": values,
+        }
+        for start_row, end_row, start_col, end_col, values in blocks
+    ]
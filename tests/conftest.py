@@ -0,0 +1,19 @@
+"""Test configuration: the bot reads required settings from the environment at import."""
+
+import os
+import tempfile
+
+for name, value in {
+    "VAALILAKANABOT_TOKEN": "test-token",
+    "ADMIN_CHAT_ID": "1",
+    "BASE_URL": "https://fiirumi.example",
+    "GOOGLE_SHEET_URL": "https://sheets.example/test",
+    "API_KEY": "test-key",
+    "API_USERNAME": "test",
+    "ELECTION_YEAR": "2026",
+    # Small chunks and high-water marks so the tests exercise chunking and spilling
+    "FLUSH_CHUNK_SIZE": "16",
+    "QUEUE_HIGH_WATER": "32",
+    "QUEUE_SPILL_DIR": tempfile.mkdtemp(prefix="vaalilakanabot-spill-"),
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,77 @@
+"""Breaker accounting for retried calls and the single half-open probe."""
+
+import threading
+from typing import List
+from unittest import mock
+
+import pytest
+import requests
+
+from src import circuit_breaker, utils
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture(autouse=True)
+def fixture_quiet(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No backoff sleeps and no admin alerts."""
+    monkeypatch.setattr(utils.time, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(circuit_breaker, "queue_admin_alert", lambda _text: None)
+
+
+def _outage() -> utils.APIError:
+    response = mock.Mock(status_code=503)
+    response.json.return_value = {"error": {"code": 503, "message": "unavailable"}}
+    return utils.APIError(response)
+
+
+def test_retried_call_counts_as_one_failure() -> None:
+    breaker = CircuitBreaker("Test", failure_threshold=3, reset_timeout=60)
+    calls: List[int] = []
+
+    @utils.retry_on_api_error(max_retries=3, breaker=breaker)
+    def flaky() -> None:
+        calls.append(1)
+        raise _outage()
+
+    for _ in range(2):
+        with pytest.raises(utils.APIError):
+            flaky()
+    assert len(calls) == 6 and breaker.state == "closed"
+    with pytest.raises(utils.APIError):
+        flaky()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        flaky()
+    assert len(calls) == 9
+
+
+def test_half_open_admits_one_probe() -> None:
+    breaker = CircuitBreaker("Test", failure_threshold=1, reset_timeout=0)
+    with pytest.raises(requests.ConnectionError):
+        breaker.call(mock.Mock(side_effect=requests.ConnectionError()))
+    assert breaker.state == "half_open"
+
+    probe_running = threading.Event()
+    finish_probe = threading.Event()
+
+    def probe() -> None:
+        probe_running.set()
+        finish_probe.wait(5)
+
+    thread = threading.Thread(target=breaker.call, args=(probe,))
+    thread.start()
+    assert probe_running.wait(5)
+    assert not breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: None)
+    finish_probe.set()
+    thread.join(5)
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_probe_without_verdict_releases_half_open() -> None:
+    breaker = CircuitBreaker("Test", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    with pytest.raises(ValueError):
+        breaker.call(mock.Mock(side_effect=ValueError("bad request")))
+    assert breaker.state == "half_open" and breaker.allow()
@@ -0,0 +1,112 @@
+"""The election tree is rebuilt only for roles whose inputs changed."""
+
+from typing import Any, Dict, Iterator, List, cast
+
+import pytest
+
+from src.sheets_data_manager import DataManager
+from src.sheets_manager import SheetsManager
+from src.types import RoleData, UserRow
+
+ROLE_HEADERS = ["ID", "Division_FI", "Division_EN", "Role_FI", "Role_EN", "Type"]
+APPLICATION_HEADERS = ["Timestamp", "Role_ID", "Telegram_ID", "Status", "Group_ID"]
+USER_HEADERS = ["Telegram_ID", "Name", "Email", "Telegram"]
+
+
+class ValuesWorksheet:  # pylint: disable=too-few-public-methods
+    """Read-only worksheet serving a list of rows."""
+
+    def __init__(self, title: str, rows: List[List[Any]]) -> None:
+        self.title = title
+        self.id = title
+        self.rows = rows
+
+    def get_all_values(self) -> List[List[Any]]:
+        """Return the rows as strings, like the values API."""
+        return [[str(value) for value in row] for row in self.rows]
+
+
+@pytest.fixture(name="data_manager")
+def fixture_data_manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[DataManager]:
+    """A data manager on three roles with one approved applicant each."""
+    monkeypatch.setattr(SheetsManager, "_connect", lambda self: None)
+    data_manager = DataManager("https://sheets.example/test", "credentials.json")
+    sheets = data_manager.sheets_manager
+    sheets.election_sheet = ValuesWorksheet(
+        "Election Structure",
+        [ROLE_HEADERS]
+        + [
+            [f"r{i}", "Hallitus", "Board", f"Rooli {i}", f"Role {i}", "BOARD"]
+            for i in range(3)
+        ],
+    )
+    sheets.applications_sheet = ValuesWorksheet(
+        "Applications",
+        [APPLICATION_HEADERS]
+        + [[f"2026-01-0{i + 1}", f"r{i}", 100 + i, "APPROVED", ""] for i in range(3)],
+    )
+    sheets.users_sheet = ValuesWorksheet(
+        "Users",
+        [USER_HEADERS]
+        + [[100 + i, f"User {i}", f"u{i}@example.com", f"u{i}"] for i in range(3)],
+    )
+    sheets.invalidate_caches()
+    yield data_manager
+    sheets.status_update_queue.clear()
+    sheets.user_upsert_queue.clear()
+
+
+def _nodes(data_manager: DataManager) -> Dict[str, RoleData]:
+    return {
+        role["ID"]: role
+        for division in data_manager.vaalilakana_full
+        for role in division["Roles"]
+    }
+
+
+def _full_rebuild(data_manager: DataManager) -> Dict[str, RoleData]:
+    """Nodes built from scratch from the same data, for comparison."""
+    data_manager._tree_generation = None  # pylint: disable=protected-access
+    data_manager._views.clear()  # pylint: disable=protected-access
+    return _nodes(data_manager)
+
+
+def test_only_changed_roles_are_rebuilt(data_manager: DataManager) -> None:
+    before = _nodes(data_manager)
+    assert [before[f"r{i}"]["Applicants"][0]["Name"] for i in range(3)] == [
+        "User 0",
+        "User 1",
+        "User 2",
+    ]
+
+    data_manager.sheets_manager.update_application_status("r0", 100, status="ELECTED")
+    after_status = _nodes(data_manager)
+    assert after_status["r0"]["Applicants"][0]["Status"] == "ELECTED"
+    assert after_status["r1"] is before["r1"] and after_status["r2"] is before["r2"]
+
+    data_manager.upsert_user(
+        cast(
+            UserRow,
+            {"Telegram_ID": 101, "Name": "Renamed", "Email": "", "Telegram": ""},
+        )
+    )
+    after_user = _nodes(data_manager)
+    assert after_user["r1"]["Applicants"][0]["Name"] == "Renamed"
+    assert after_user["r0"] is after_status["r0"]
+    assert after_user["r2"] is before["r2"]
+
+    assert after_user == _full_rebuild(data_manager)
+
+
+def test_sheet_edit_rebuilds_its_role(data_manager: DataManager) -> None:
+    before = _nodes(data_manager)
+    sheets = data_manager.sheets_manager
+    sheets.applications_sheet.rows[3][3] = "REMOVED"
+    sheets.applications_sheet.rows.append(["2026-01-09", "r0", 102, "APPROVED", ""])
+    sheets.invalidate_caches()
+
+    after = _nodes(data_manager)
+    assert after["r1"] is before["r1"]
+    assert not after["r2"]["Applicants"]
+    assert [app["Name"] for app in after["r0"]["Applicants"]] == ["User 0", "User 2"]
+    assert after == _full_rebuild(data_manager)
@@ -0,0 +1,94 @@
+"""New Fiirumi topics are announced even when a poll fails halfway."""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import pytest
+
+from src import announcements
+from src.config import get_question_list_url, get_topic_list_url
+from src.fiirumi_cursor import TopicCursor
+
+
+def _page(*topic_ids: int) -> Dict[str, Any]:
+    return {
+        "topic_list": {
+            "topics": [
+                {
+                    "id": topic_id,
+                    "title": f"Topic {topic_id}",
+                    "bumped_at": f"2026-01-01T00:00:{topic_id:02d}.000Z",
+                }
+                for topic_id in sorted(topic_ids, reverse=True)
+            ]
+        }
+    }
+
+
+@pytest.fixture(name="fiirumi")
+def fixture_fiirumi(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Serve topic lists from a dict by URL and collect the announced messages.
+
+    Assigning the same page object again simulates a 304 Not Modified answer.
+    """
+    pages: Dict[str, Any] = {
+        get_topic_list_url(): _page(1, 2),
+        get_question_list_url(): _page(),
+    }
+    announced: List[str] = []
+
+    async def topic_list(url: str) -> Dict[str, Any]:
+        return pages[url]
+
+    async def announce(message: str, *_args: Any) -> None:
+        announced.append(message)
+
+    monkeypatch.setattr(announcements.discourse, "topic_list", topic_list)
+    monkeypatch.setattr(
+        announcements.discourse, "more_topics", mock.AsyncMock(return_value=[])
+    )
+    monkeypatch.setattr(announcements, "announce_to_channels", announce)
+    monkeypatch.setattr(announcements, "_processed_lists", {})
+    monkeypatch.setattr(
+        announcements, "topic_cursor", TopicCursor(str(tmp_path / "cursor.json"))
+    )
+    return pages, announced
+
+
+def _poll() -> None:
+    data_manager = mock.Mock(vaalilakana=[])
+    asyncio.run(announcements.parse_fiirumi_posts(mock.Mock(), data_manager))
+
+
+def test_failed_cursor_write_is_announced_on_next_poll(
+    fiirumi: Tuple[Dict[str, Any], List[str]],
+) -> None:
+    pages, announced = fiirumi
+    _poll()
+    assert not announced
+
+    pages[get_topic_list_url()] = _page(1, 2, 3)
+    with mock.patch.object(os, "replace", side_effect=OSError("disk full")):
+        _poll()
+    assert not announced
+
+    # Discourse now answers 304 with the list the failed poll already saw
+    _poll()
+    assert len(announced) == 1 and "Topic 3" in announced[0]
+    _poll()
+    assert len(announced) == 1
+
+
+def test_failing_question_list_does_not_hold_back_topics(
+    fiirumi: Tuple[Dict[str, Any], List[str]],
+) -> None:
+    pages, announced = fiirumi
+    _poll()
+    pages[get_topic_list_url()] = _page(1, 2, 3)
+    pages[get_question_list_url()] = {}
+    _poll()
+    assert len(announced) == 1 and "Topic 3" in announced[0]
@@ -0,0 +1,267 @@
+"""Handlers queueing writes in parallel with background flushes and cache reads."""
+
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple, cast
+
+import pytest
+
+from src.sheets_manager import SheetsManager
+from src.types import ApplicationRow
+
+WRITERS = 6
+APPLICATIONS_PER_WRITER = 40
+_A1 = re.compile(r"^([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$")
+
+
+def _column(letters: str) -> int:
+    col = 0
+    for letter in letters:
+        col = col * 26 + ord(letter) - 64
+    return col
+
+
+class FakeWorksheet:
+    """Thread-safe in-memory worksheet with the gspread calls the manager uses.
+
+    Every call sleeps briefly to widen race windows, and writes fail at random
+    while ``fail_rate`` is set, like a flaky Sheets API.
+    """
+
+    def __init__(self, title: str, headers: List[str]) -> None:
+        self.title = title
+        self.id = title
+        self.row_count = 1000
+        self.col_count = len(headers)
+        self.rows: List[List[Any]] = [list(headers)]
+        self.fail_rate = 0.0
+        self._lock = threading.Lock()
+
+    def _pause(self) -> None:
+        time.sleep(random.uniform(0, 0.002))
+
+    def _maybe_fail(self) -> None:
+        if random.random() < self.fail_rate:
+            raise RuntimeError(f"injected write failure on {self.title}")
+
+    def _write(self, range_str: str, values: List[List[Any]]) -> None:
+        match = _A1.match(range_str)
+        assert match, range_str
+        row, col = int(match.group(2)), _column(match.group(1))
+        for r, row_values in enumerate(values, start=row):
+            for c, value in enumerate(row_values, start=col):
+                assert r <= self.row_count and c <= self.col_count, range_str
+                while len(self.rows) < r:
+                    self.rows.append([])
+                cells = self.rows[r - 1]
+                while len(cells) < c:
+                    cells.append("")
+                cells[c - 1] = "" if value is None else value
+
+    def get_all_values(self) -> List[List[Any]]:
+        """Return every row padded to the same width, as strings."""
+        self._pause()
+        with self._lock:
+            width = max(len(row) for row in self.rows)
+            return [
+                [str(v) for v in row] + [""] * (width - len(row)) for row in self.rows
+            ]
+
+    def col_values(self, col: int) -> List[Any]:
+        """Return one column without its trailing empty cells."""
+        self._pause()
+        with self._lock:
+            values = [row[col - 1] if len(row) >= col else "" for row in self.rows]
+        while values and values[-1] == "":
+            values.pop()
+        return values
+
+    def update(self, range_str: str, values: List[List[Any]]) -> None:
+        """Write a block of values at an A1 range."""
+        self._pause()
+        self._maybe_fail()
+        with self._lock:
+            self._write(range_str, values)
+
+    def batch_update(self, updates: List[Dict[str, Any]]) -> None:
+        """Write several A1 ranges in one call."""
+        self._pause()
+        self._maybe_fail()
+        with self._lock:
+            for update in updates:
+                self._write(update["range"], update["values"])
+
+    def delete_rows(self, index: int) -> None:
+        """Delete one row."""
+        self._pause()
+        with self._lock:
+            del self.rows[index - 1]
+
+    def resize(self, rows: int, cols: int) -> None:
+        """Change the grid size."""
+        with self._lock:
+            self.row_count, self.col_count = rows, cols
+
+    def records(self) -> List[Dict[str, str]]:
+        """Data rows keyed by header, ignoring empty rows."""
+        values = self.get_all_values()
+        return [dict(zip(values[0], row)) for row in values[1:] if any(row)]
+
+
+@pytest.fixture(name="manager")
+def fixture_manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[SheetsManager]:
+    """A manager on fake worksheets, without a Google connection."""
+    monkeypatch.setattr(SheetsManager, "_connect", lambda self: None)
+    manager = SheetsManager("https://sheets.example/test", "credentials.json")
+    manager.election_sheet = FakeWorksheet(
+        "Election Structure", ["ID", "Division_FI", "Role_FI"]
+    )
+    manager.applications_sheet = FakeWorksheet(
+        "Applications",
+        [
+            "Timestamp",
+            "Role_ID",
+            "Telegram_ID",
+            "Fiirumi_Post",
+            "Status",
+            "Language",
+            "Group_ID",
+        ],
+    )
+    manager.channels_sheet = FakeWorksheet(
+        "Channels", ["Chat_ID", "Added_Date", "Digest"]
+    )
+    manager.users_sheet = FakeWorksheet(
+        "Users",
+        [
+            "Telegram_ID",
+            "Name",
+            "Email",
+            "Telegram",
+            "Show_On_Website_Consent",
+            "Updated_At",
+        ],
+    )
+    yield manager
+    manager.application_queue.clear()
+    manager.status_update_queue.clear()
+
+
+def _application(writer: int, number: int) -> ApplicationRow:
+    return cast(
+        ApplicationRow,
+        {
+            "Timestamp": f"2026-01-01T00:{writer:02d}:{number:02d}",
+            "Role_ID": f"role-{number}",
+            "Telegram_ID": 1000 + writer,
+            "Fiirumi_Post": "",
+            "Status": "PENDING",
+            "Language": "fi",
+            "Group_ID": "",
+        },
+    )
+
+
+def test_concurrent_handlers_and_flushes(manager: SheetsManager) -> None:
+    """No application, status update or user is lost, duplicated or hidden."""
+    for sheet in (manager.applications_sheet, manager.users_sheet):
+        sheet.fail_rate = 0.2
+    writers_done = threading.Event()
+    errors: List[str] = []
+
+    def writer(index: int) -> None:
+        telegram_id = 1000 + index
+        for number in range(APPLICATIONS_PER_WRITER):
+            assert manager.add_application(_application(index, number))
+            manager.upsert_user(
+                {
+                    "Telegram_ID": telegram_id,
+                    "Name": f"User {index} v{number}",
+                    "Email": f"user{index}@example.com",
+                    "Telegram": f"user{index}",
+                    "Show_On_Website_Consent": number % 2 == 0,
+                    "Updated_At": str(number),
+                }
+            )
+            if number % 2 == 0:
+                assert manager.update_application_status(
+                    f"role-{number}", telegram_id, status="APPROVED"
+                )
+
+    def flusher() -> None:
+        while not writers_done.is_set():
+            manager.flush_all()
+
+    def reader() -> None:
+        seen: Set[Tuple[str, str]] = set()
+        while not writers_done.is_set():
+            visible = {
+                (str(app.get("Role_ID")), str(app.get("Telegram_ID")))
+                for app in manager.get_all_applications()
+            }
+            missing = seen - visible
+            if missing:
+                errors.append(f"{len(missing)} applications disappeared from reads")
+            seen |= visible
+
+    def run(target: Callable[..., None], *args: Any) -> threading.Thread:
+        def guarded() -> None:
+            try:
+                target(*args)
+            except Exception as e:
+                errors.append(f"{target.__name__}: {e!r}")
+
+        return threading.Thread(target=guarded)
+
+    background = [run(flusher) for _ in range(2)] + [run(reader) for _ in range(2)]
+    writer_threads = [run(writer, i) for i in range(WRITERS)]
+    for thread in background + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    writers_done.set()
+    for thread in background:
+        thread.join()
+
+    for sheet in (manager.applications_sheet, manager.users_sheet):
+        sheet.fail_rate = 0.0
+    manager.flush_all()
+
+    assert not errors
+    assert all(size == 0 for size in manager.queue_sizes().values())
+
+    applications = manager.applications_sheet.records()
+    keys = [(row["Role_ID"], row["Telegram_ID"]) for row in applications]
+    assert len(keys) == len(set(keys)) == WRITERS * APPLICATIONS_PER_WRITER
+    for row in applications:
+        number = int(row["Role_ID"].split("-")[1])
+        assert row["Status"] == ("APPROVED" if number % 2 == 0 else "PENDING")
+
+    users = manager.users_sheet.records()
+    assert sorted(int(user["Telegram_ID"]) for user in users) == [
+        1000 + i for i in range(WRITERS)
+    ]
+    last = APPLICATIONS_PER_WRITER - 1
+    assert {user["Name"] for user in users} == {
+        f"User {i} v{last}" for i in range(WRITERS)
+    }
+    # Every write the bot made is visible through the read path as well
+    assert len(manager.get_all_applications()) == WRITERS * APPLICATIONS_PER_WRITER
+
+
+def test_requeued_chunk_keeps_order_before_new_items(manager: SheetsManager) -> None:
+    """A failed chunk goes back in front of items queued during the flush."""
+    for number in range(40):
+        manager.add_application(_application(0, number))
+    manager.applications_sheet.fail_rate = 1.0
+    assert not manager.flush_application_queue()
+    manager.add_application(_application(1, 0))
+    manager.applications_sheet.fail_rate = 0.0
+    manager.flush_all()
+
+    written = [row["Timestamp"] for row in manager.applications_sheet.records()]
+    assert written == [_application(0, n)["Timestamp"] for n in range(40)] + [
+        _application(1, 0)["Timestamp"]
+    ]